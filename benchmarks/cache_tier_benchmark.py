@@ -0,0 +1,69 @@
+"""Benchmark hot cache hits with and without the in-memory tier.
+
+Stores a feed-sized value and its header, then times repeated reads of
+the value, the header and the gzip body, as a cached feed poll does.
+
+Usage:
+    python -m benchmarks.cache_tier_benchmark --iterations 20000 --size-kb 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+
+from ytpodcast.manager.cache_manager import CacheManager
+
+
+def run_tier(cache_manager: CacheManager, value: str, iterations: int) -> list[float]:
+    """Return per-hit latencies in seconds for a cached feed poll."""
+    cache_manager.set(
+        "feed",
+        value,
+        ttl_seconds=3600,
+        etag='"benchmark"',
+        content_encodings=("gzip",),
+    )
+    timings: list[float] = []
+    for _ in range(iterations):
+        started_at: float = time.perf_counter()
+        cache_manager.get_header("feed")
+        cache_manager.get_encoded("feed", "gzip", '"benchmark"')
+        cache_manager.get("feed")
+        timings.append(time.perf_counter() - started_at)
+    return timings
+
+
+def report(name: str, timings: list[float]) -> None:
+    """Print a one-line summary for a tier."""
+    ordered: list[float] = sorted(timings)
+    print(
+        f"{name:<7} median={statistics.median(ordered) * 1e6:9.1f}us "
+        f"p99={ordered[int(len(ordered) * 0.99) - 1] * 1e6:9.1f}us "
+        f"mean={statistics.mean(ordered) * 1e6:9.1f}us"
+    )
+
+
+def main() -> None:
+    """Parse arguments and benchmark both tiers."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--size-kb", type=int, default=64)
+    args = parser.parse_args()
+    value: str = "<item>episode</item>" * (args.size_kb * 1024 // 20)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        report("file", run_tier(CacheManager(cache_dir), value, args.iterations))
+    with tempfile.TemporaryDirectory() as cache_dir:
+        memory_cache_manager = CacheManager(
+            cache_dir,
+            memory_max_entries=1024,
+            memory_max_bytes=64 * 1024 * 1024,
+        )
+        report("memory", run_tier(memory_cache_manager, value, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
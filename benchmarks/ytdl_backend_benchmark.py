@@ -0,0 +1,76 @@
+"""Benchmark the subprocess and embedded yt-dlp backends.
+
+Runs format extraction for the same videos with each backend and reports
+cold (first call) and warm latencies plus peak RSS. Needs network access.
+
+Usage:
+    python -m benchmarks.ytdl_backend_benchmark --iterations 5 FEtPLvsBS2M
+"""
+
+from __future__ import annotations
+
+import argparse
+import resource
+import statistics
+import tempfile
+import time
+
+from ytpodcast.client.yt_dl_client import YtDlClient
+from ytpodcast.client.yt_dl_embedded_client import YtDlEmbeddedClient
+
+
+def run_backend(client: YtDlClient, video_ids: list[str], iterations: int) -> list[float]:
+    """Return per-call extraction latencies in seconds."""
+    timings: list[float] = []
+    for _ in range(iterations):
+        for video_id in video_ids:
+            started_at: float = time.perf_counter()
+            client.fetch_audio_formats(video_id)
+            timings.append(time.perf_counter() - started_at)
+    return timings
+
+
+def report(name: str, timings: list[float], peak_rss_kb: int) -> None:
+    """Print a one-line summary for a backend."""
+    warm: list[float] = timings[1:] or timings
+    print(
+        f"{name:<11} cold={timings[0] * 1000:8.1f}ms "
+        f"warm_median={statistics.median(warm) * 1000:8.1f}ms "
+        f"warm_mean={statistics.mean(warm) * 1000:8.1f}ms "
+        f"peak_rss={peak_rss_kb / 1024:7.1f}MB"
+    )
+
+
+def main() -> None:
+    """Parse arguments and benchmark both backends."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("video_ids", nargs="+")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--ytdl-executable-path", default="yt-dlp")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as download_dir:
+        subprocess_client = YtDlClient(
+            default_format="bestaudio",
+            download_dir=download_dir,
+            ytdl_executable_path=args.ytdl_executable_path,
+            ffmpeg_executable_path="ffmpeg",
+        )
+        timings: list[float] = run_backend(subprocess_client, args.video_ids, args.iterations)
+        children_rss_kb: int = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        report("subprocess", timings, children_rss_kb)
+
+        embedded_client = YtDlEmbeddedClient(
+            default_format="bestaudio",
+            download_dir=download_dir,
+            ytdl_executable_path=args.ytdl_executable_path,
+            ffmpeg_executable_path="ffmpeg",
+            worker_count=1,
+        )
+        timings = run_backend(embedded_client, args.video_ids, args.iterations)
+        self_rss_kb: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        report("embedded", timings, self_rss_kb)
+
+
+if __name__ == "__main__":
+    main()
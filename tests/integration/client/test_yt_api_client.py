@@ -6,11 +6,12 @@ import unittest
 
 from ytpodcast.client.yt_api_client import YtApiClient
 from ytpodcast.model.client.ytapi.channel_response import ChannelResponse
+from ytpodcast.model.client.ytapi.channel_videos_page_response import ChannelVideosPageResponse
 from ytpodcast.model.client.ytapi.video_response import VideoResponse
 from ytpodcast.container.default_container import DefaultContainer
 
 
-class TestYtApiClient(unittest.TestCase):
+class TestYtApiClient(unittest.IsolatedAsyncioTestCase):
     """Integration tests for the YouTube API client."""
 
     api_key: str
@@ -29,17 +30,28 @@ class TestYtApiClient(unittest.TestCase):
         cls.api_key = api_key
         cls.client = container.get(YtApiClient)
 
-    def test_fetch_channel_by_handle(self) -> None:
+    async def test_fetch_channel_by_handle(self) -> None:
         """Fetch a channel by handle."""
-        response: ChannelResponse = self.client.fetch_channel(self.channel_handle)
+        response: ChannelResponse = await self.client.fetch_channel(self.channel_handle)
         self.assertTrue(response.get_channel_id())
         self.assertTrue(response.get_title())
         self.assertIn(response.get_channel_id(), response.get_url())
 
-    def test_fetch_video_by_id(self) -> None:
+    async def test_fetch_video_by_id(self) -> None:
         """Fetch a video by id."""
-        response: VideoResponse = self.client.fetch_video(self.video_id)
+        response: VideoResponse = await self.client.fetch_video(self.video_id)
         self.assertEqual(response.get_video_id(), self.video_id)
         self.assertTrue(response.get_title())
         self.assertTrue(response.get_channel_id())
         self.assertIn(self.video_id, response.get_url())
+
+    async def test_fetch_channel_videos_page(self) -> None:
+        """Fetch the newest uploads of a channel."""
+        channel: ChannelResponse = await self.client.fetch_channel(self.channel_handle)
+        page: ChannelVideosPageResponse = await self.client.fetch_channel_videos_page(
+            channel.get_channel_id(),
+            max_results=5,
+        )
+        self.assertTrue(page.get_items())
+        published_dates = [item.get_published_at() for item in page.get_items()]
+        self.assertEqual(published_dates, sorted(published_dates, reverse=True))
@@ -0,0 +1,116 @@
+"""Unit tests for ytpodcast.client.yt_api_client channel listing."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import Any
+
+import httpx
+
+from ytpodcast.client.yt_api_client import YtApiClient
+from ytpodcast.mapper.client.ytapi.channel_response_mapper import ChannelResponseMapper
+from ytpodcast.mapper.client.ytapi.video_response_mapper import VideoResponseMapper
+
+
+def create_playlist_item(video_id: str, video_published_at: str | None) -> dict[str, Any]:
+    """Build a playlistItems.list item."""
+    return {
+        "snippet": {"title": f"Title {video_id}", "description": ""},
+        "contentDetails": {"videoId": video_id, "videoPublishedAt": video_published_at},
+    }
+
+
+class TestYtApiClientListing(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the channel listings."""
+
+    def setUp(self) -> None:
+        """Record requests sent through a stubbed transport."""
+        self.requests: list[httpx.Request] = []
+        self.payload: dict[str, Any] = {"items": []}
+
+    def create_client(self, channel_listing: str = "playlist") -> YtApiClient:
+        """Build a client whose requests are answered with self.payload."""
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(200, json=self.payload)
+
+        return YtApiClient(
+            "https://youtube.googleapis.com",
+            "key",
+            ChannelResponseMapper(),
+            VideoResponseMapper(),
+            channel_listing=channel_listing,
+            transport=httpx.MockTransport(handle),
+        )
+
+    async def test_uploads_listing_reads_the_uploads_playlist(self) -> None:
+        """List uploads for one quota unit and skip private videos."""
+        client = self.create_client()
+        self.payload = {
+            "items": [
+                create_playlist_item("new", "2024-05-02T10:00:00Z"),
+                create_playlist_item("private", None),
+                create_playlist_item("old", "2024-05-01T10:00:00Z"),
+            ],
+            "nextPageToken": "next",
+        }
+
+        page = await client.fetch_channel_videos_page("UCabcdefghijklmnopqrstuv", max_results=3)
+
+        self.assertEqual([item.get_video_id() for item in page.get_items()], ["new", "old"])
+        self.assertEqual(page.get_next_page_token(), "next")
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(self.requests[0].url.path, "/youtube/v3/playlistItems")
+        self.assertEqual(
+            self.requests[0].url.params["playlistId"],
+            "UUabcdefghijklmnopqrstuv",
+        )
+        self.assertNotIn("pageToken", self.requests[0].url.params)
+        self.assertEqual(client.get_stats()["total_quota_units"], 1)
+
+    async def test_search_listing_bounds_results_by_publish_date(self) -> None:
+        """Pass the date range to search.list as RFC 3339 UTC timestamps."""
+        client = self.create_client("search")
+
+        await client.fetch_channel_videos_page(
+            "UCabcdefghijklmnopqrstuv",
+            published_after=datetime(2024, 5, 1, 12, tzinfo=timezone(timedelta(hours=2))),
+            published_before=datetime(2024, 5, 3),
+        )
+
+        params = self.requests[0].url.params
+        self.assertEqual(self.requests[0].url.path, "/youtube/v3/search")
+        self.assertEqual(params["publishedAfter"], "2024-05-01T10:00:00Z")
+        self.assertEqual(params["publishedBefore"], "2024-05-03T00:00:00Z")
+
+    async def test_upstream_errors_raise_value_error(self) -> None:
+        """Report API error statuses and undecodable bodies as ValueError."""
+        responses = [
+            httpx.Response(403, json={"error": {"message": "quotaExceeded"}}),
+            httpx.Response(200, text="<html>Service Unavailable</html>"),
+        ]
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            del request
+            return responses.pop(0)
+
+        client = YtApiClient(
+            "https://youtube.googleapis.com",
+            "key",
+            ChannelResponseMapper(),
+            VideoResponseMapper(),
+            transport=httpx.MockTransport(handle),
+        )
+
+        with self.assertRaisesRegex(ValueError, "status 403"):
+            await client.fetch_channel("@podcast")
+        with self.assertRaisesRegex(ValueError, "invalid body"):
+            await client.fetch_channel("@podcast")
+
+
+if __name__ == "__main__":
+    unittest.main()
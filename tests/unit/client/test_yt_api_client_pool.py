@@ -0,0 +1,52 @@
+"""Unit tests for ytpodcast.client.yt_api_client connection pooling."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import unittest
+
+import httpx
+
+from ytpodcast.client.yt_api_client import YtApiClient
+from ytpodcast.mapper.client.ytapi.channel_response_mapper import ChannelResponseMapper
+from ytpodcast.mapper.client.ytapi.video_response_mapper import VideoResponseMapper
+
+
+class TestYtApiClientPool(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the per-loop pooled HTTP client."""
+
+    async def test_client_of_another_loop_is_closed_when_replaced(self) -> None:
+        """Close the previous loop's client on that loop instead of leaking it."""
+        client = YtApiClient(
+            "https://youtube.googleapis.com",
+            "key",
+            ChannelResponseMapper(),
+            VideoResponseMapper(),
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+        )
+        other_loop = asyncio.new_event_loop()
+        other_thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        other_thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(
+                client._request("videos.list", {}),  # pylint: disable=protected-access
+                other_loop,
+            ).result(timeout=5)
+            replaced_client = client._http_client  # pylint: disable=protected-access
+            assert replaced_client is not None
+
+            await client._request("videos.list", {})  # pylint: disable=protected-access
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other_loop).result(timeout=5)
+
+            self.assertTrue(replaced_client.is_closed)
+            self.assertIsNot(replaced_client, client._http_client)  # pylint: disable=protected-access
+        finally:
+            await client.aclose()
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            other_thread.join(timeout=5)
+            other_loop.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Unit tests for YtDlClient output variants and codec fallbacks."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from ytpodcast.client.yt_dl_client import YtDlClient
+from ytpodcast.model.service.audio_output_policy import AudioOutputCodec
+from ytpodcast.model.service.audio_output_policy import AudioOutputMode
+from ytpodcast.model.service.audio_output_policy import AudioOutputPolicy
+from ytpodcast.service.video_service import VideoService
+
+
+def create_client(download_dir: str) -> YtDlClient:
+    """Create a client whose commands are never executed."""
+    return YtDlClient("bestaudio", download_dir, "yt-dlp", "ffmpeg")
+
+
+class TestYtDlClientOutput(unittest.TestCase):
+    """Check output naming, policy resolution and codec fallbacks."""
+
+    def test_output_variants_get_distinct_paths(self) -> None:
+        """Keep each mode and bitrate of a video in its own file."""
+        client: YtDlClient = create_client("/downloads")
+
+        transcoded: Path = client.get_output_path(
+            "vid", AudioOutputPolicy(mode=AudioOutputMode.TRANSCODE, bitrate_kbps=64)
+        )
+        remuxed: Path = client.get_output_path(
+            "vid", AudioOutputPolicy(mode=AudioOutputMode.REMUX)
+        )
+
+        self.assertEqual(Path("/downloads/vid.transcode-64.mp3"), transcoded)
+        self.assertEqual(Path("/downloads/vid.remux-auto.mp3"), remuxed)
+
+    def test_resolve_output_policy_overlays_request_settings(self) -> None:
+        """Fill unset request settings from the deployment policy."""
+        deployment_policy: AudioOutputPolicy = AudioOutputPolicy(
+            mode=AudioOutputMode.REMUX,
+            codec=AudioOutputCodec.OPUS,
+            bitrate_kbps=96,
+        )
+        video_service: VideoService = VideoService(
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            deployment_policy,
+            MagicMock(),
+            MagicMock(),
+        )
+
+        self.assertIs(deployment_policy, video_service.resolve_output_policy())
+        resolved: AudioOutputPolicy = video_service.resolve_output_policy(
+            mode=AudioOutputMode.TRANSCODE,
+            bitrate_kbps=48,
+        )
+
+        self.assertEqual(AudioOutputMode.TRANSCODE, resolved.get_mode())
+        self.assertEqual(AudioOutputCodec.OPUS, resolved.get_codec())
+        self.assertEqual(48, resolved.get_bitrate_kbps())
+
+    def test_codec_arguments_copy_only_compatible_sources(self) -> None:
+        """Copy matching streams and re-encode everything else."""
+        client: YtDlClient = create_client("/downloads")
+        remux_policy: AudioOutputPolicy = AudioOutputPolicy(
+            mode=AudioOutputMode.REMUX,
+            codec=AudioOutputCodec.AAC,
+            bitrate_kbps=128,
+        )
+        transcode_policy: AudioOutputPolicy = AudioOutputPolicy(
+            mode=AudioOutputMode.TRANSCODE,
+            codec=AudioOutputCodec.AAC,
+            bitrate_kbps=128,
+        )
+
+        # pylint: disable=protected-access
+        self.assertEqual(["-c:a", "copy"], client._build_codec_arguments(remux_policy, "m4a"))
+        self.assertEqual(
+            ["-c:a", "aac", "-b:a", "128k"],
+            client._build_codec_arguments(remux_policy, "webm"),
+        )
+        self.assertEqual(
+            ["-c:a", "aac", "-b:a", "128k"],
+            client._build_codec_arguments(transcode_policy, "m4a"),
+        )
+
+    def test_passthrough_moves_matching_source_and_converts_mismatch(self) -> None:
+        """Serve a matching source as-is and fall back to ffmpeg otherwise."""
+        passthrough_policy: AudioOutputPolicy = AudioOutputPolicy(
+            mode=AudioOutputMode.PASSTHROUGH,
+            codec=AudioOutputCodec.OPUS,
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            client: YtDlClient = create_client(temp_dir)
+            output_path: Path = client.get_output_path("vid", passthrough_policy)
+            matching_source: Path = Path(temp_dir) / "vid.opus"
+            matching_source.write_bytes(b"opus")
+            mismatched_source: Path = Path(temp_dir) / "vid.m4a"
+            mismatched_source.write_bytes(b"aac")
+
+            with patch.object(client, "_run_command") as run_command:
+                # pylint: disable=protected-access
+                client._convert_audio(matching_source, output_path, passthrough_policy)
+                run_command.assert_not_called()
+                self.assertEqual(b"opus", output_path.read_bytes())
+
+                client._convert_audio(mismatched_source, output_path, passthrough_policy)
+                command: list[str] = run_command.call_args.args[0]
+
+        self.assertEqual(["-c:a", "libopus"], command[5:7])
+        self.assertEqual(str(output_path), command[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""Unit tests for ytpodcast.client.yt_dl_embedded_client."""
+
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from yt_dlp.utils import YoutubeDLError
+
+from ytpodcast.client.yt_dl_embedded_client import YtDlEmbeddedClient
+
+
+class StubYoutubeDL:
+    """YoutubeDL stand-in that records the settings each call ran with."""
+
+    def __init__(self, params: dict[str, Any]) -> None:
+        """Keep the params the way YoutubeDL does."""
+        self.params: dict[str, Any] = {**params, "outtmpl": {"default": "%(id)s.%(ext)s"}}
+        self.format_selector: Any = None
+        self.calls: list[tuple[bool, Any, Any, str]] = []
+        self.fail: bool = False
+
+    def build_format_selector(self, format_spec: str) -> str:
+        """Return a marker for the compiled selector."""
+        return f"compiled:{format_spec}"
+
+    def extract_info(self, url: str, download: bool) -> dict[str, Any]:
+        """Record the active settings, then succeed or fail."""
+        self.calls.append(
+            (
+                download,
+                self.params.get("format"),
+                self.format_selector,
+                self.params["outtmpl"]["default"],
+            )
+        )
+        if self.fail:
+            raise YoutubeDLError("download failed")
+        return {"id": url.rsplit("=", 1)[-1]}
+
+    def sanitize_info(self, info: dict[str, Any]) -> dict[str, Any]:
+        """Return the info unchanged."""
+        return info
+
+
+class TestYtDlEmbeddedClient(unittest.TestCase):
+    """Unit tests for the warm per-thread YoutubeDL instance."""
+
+    def setUp(self) -> None:
+        """Create a single-worker client over a stubbed YoutubeDL."""
+        self.stubs: list[StubYoutubeDL] = []
+
+        def create_stub(params: dict[str, Any]) -> StubYoutubeDL:
+            stub = StubYoutubeDL(params)
+            self.stubs.append(stub)
+            return stub
+
+        patcher = patch("ytpodcast.client.yt_dl_embedded_client.YoutubeDL", create_stub)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = YtDlEmbeddedClient(
+            "bestaudio", "/downloads", "yt-dlp", "ffmpeg", worker_count=1
+        )
+        self.addCleanup(self.client._executor.shutdown)  # pylint: disable=protected-access
+
+    def test_download_settings_do_not_leak_into_later_calls(self) -> None:
+        """Restore the format and template after both successful and failed downloads."""
+        # pylint: disable=protected-access
+        self.client._download_source("first", "251/bestaudio", Path("/staging/first.%(ext)s"))
+        self.stubs[0].fail = True
+        with self.assertRaises(ValueError):
+            self.client._download_source("second", "140", Path("/staging/second.%(ext)s"))
+        self.stubs[0].fail = False
+        self.client._extract_info("third")
+
+        self.assertEqual(1, len(self.stubs))
+        self.assertEqual(
+            [
+                (True, "251/bestaudio", "compiled:251/bestaudio", "/staging/first.%(ext)s"),
+                (True, "140", "compiled:140", "/staging/second.%(ext)s"),
+                (False, None, None, "%(id)s.%(ext)s"),
+            ],
+            self.stubs[0].calls,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""Unit tests for ytpodcast.helper.content_encoding."""
+
+from __future__ import annotations
+
+import gzip
+import tempfile
+import unittest
+
+from ytpodcast.helper.content_encoding import select_content_encoding
+from ytpodcast.helper.http_validators import create_encoded_etag
+from ytpodcast.manager.cache_manager import CacheManager
+
+
+class TestContentEncoding(unittest.TestCase):
+    """Unit tests for encoding negotiation and pre-compressed cache entries."""
+
+    def test_select_content_encoding_follows_weights(self) -> None:
+        """Prefer the highest weight, then the stored order, and honour q=0."""
+        available = ["br", "gzip"]
+
+        self.assertEqual(select_content_encoding("gzip, deflate, br", available), "br")
+        self.assertEqual(select_content_encoding("br;q=0.5, gzip", available), "gzip")
+        self.assertEqual(select_content_encoding("*;q=0.1, br;q=0", available), "gzip")
+        self.assertIsNone(select_content_encoding("identity", available))
+        self.assertIsNone(select_content_encoding(None, available))
+
+    def test_cache_manager_stores_compressed_bodies(self) -> None:
+        """Compress the value once at write time and list it in the header."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_manager = CacheManager(temp_dir)
+            cache_manager.set(
+                "feed",
+                "<rss />",
+                ttl_seconds=60,
+                etag='"abc"',
+                content_encodings=("gzip",),
+            )
+
+            header = cache_manager.get_header("feed")
+            encoded_body = cache_manager.get_encoded("feed", "gzip", '"abc"')
+
+        self.assertIsNotNone(header)
+        assert header is not None
+        self.assertEqual(header.get_content_encodings(), ["gzip"])
+        self.assertIsNotNone(encoded_body)
+        assert encoded_body is not None
+        self.assertEqual(gzip.decompress(encoded_body), b"<rss />")
+        self.assertEqual(create_encoded_etag('"abc"', "gzip"), '"abc-gzip"')
+        self.assertEqual(create_encoded_etag('"abc"', None), '"abc"')
+
+
+if __name__ == "__main__":
+    unittest.main()
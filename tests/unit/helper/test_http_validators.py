@@ -0,0 +1,43 @@
+"""Unit tests for ytpodcast.helper.http_validators."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import datetime
+from datetime import timezone
+
+from ytpodcast.helper.http_validators import create_etag
+from ytpodcast.helper.http_validators import format_http_date
+from ytpodcast.helper.http_validators import is_not_modified
+
+
+class TestHttpValidators(unittest.TestCase):
+    """Unit tests for conditional GET evaluation."""
+
+    def setUp(self) -> None:
+        """Create validators for a rendered feed."""
+        self.etag = create_etag("<rss />")
+        self.last_modified = datetime(2024, 5, 1, 12, 0, 0, 500000, tzinfo=timezone.utc)
+
+    def test_if_none_match_takes_precedence(self) -> None:
+        """Match entity tags weakly and ignore dates when tags are sent."""
+        http_date = format_http_date(self.last_modified)
+
+        self.assertTrue(is_not_modified(f'"other", W/{self.etag}', None, self.etag, None))
+        self.assertTrue(is_not_modified("*", None, self.etag, None))
+        self.assertFalse(is_not_modified('"other"', http_date, self.etag, self.last_modified))
+
+    def test_if_modified_since_uses_whole_seconds(self) -> None:
+        """Treat a feed as unmodified up to the second it last changed."""
+        http_date = format_http_date(self.last_modified)
+
+        self.assertEqual(http_date, "Wed, 01 May 2024 12:00:00 GMT")
+        self.assertTrue(is_not_modified(None, http_date, self.etag, self.last_modified))
+        self.assertFalse(
+            is_not_modified(None, "Wed, 01 May 2024 11:59:59 GMT", self.etag, self.last_modified)
+        )
+        self.assertFalse(is_not_modified(None, "not a date", self.etag, self.last_modified))
+
+
+if __name__ == "__main__":
+    unittest.main()
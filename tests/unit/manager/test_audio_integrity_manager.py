@@ -0,0 +1,52 @@
+"""Unit tests for ytpodcast.manager.audio_integrity_manager."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from ytpodcast.manager.audio_integrity_manager import AudioIntegrityManager
+
+
+def create_fake_ffprobe(directory: Path, output: str, exit_code: int) -> str:
+    """Write a stand-in ffprobe that prints a fixed duration."""
+    ffprobe_path = directory / "ffprobe"
+    ffprobe_path.write_text(f"#!/bin/sh\necho '{output}'\nexit {exit_code}\n", encoding="utf-8")
+    ffprobe_path.chmod(0o755)
+    return str(ffprobe_path)
+
+
+class TestAudioIntegrityManager(unittest.TestCase):
+    """Unit tests for integrity records."""
+
+    def test_recorded_file_is_trusted_until_its_size_changes(self) -> None:
+        """Verify against the record and reject a truncated file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            manager = AudioIntegrityManager(temp_dir, create_fake_ffprobe(temp_path, "12.5", 0))
+            staged_path = temp_path / "staged.mp3"
+            staged_path.write_bytes(b"audio-bytes")
+            output_path = temp_path / "video.mp3"
+
+            manager.record(staged_path, output_path)
+            staged_path.replace(output_path)
+
+            self.assertTrue(manager.verify(output_path))
+            output_path.write_bytes(b"audio")
+            self.assertFalse(manager.verify(output_path))
+            self.assertEqual(manager.get_stats()["probed"], 1)
+
+    def test_unrecorded_file_that_does_not_decode_is_rejected(self) -> None:
+        """Probe files without a record and refuse undecodable ones."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            manager = AudioIntegrityManager(temp_dir, create_fake_ffprobe(temp_path, "N/A", 1))
+            output_path = temp_path / "video.mp3"
+            output_path.write_bytes(b"truncated")
+
+            self.assertFalse(manager.verify(output_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Unit tests for ytpodcast.manager.audio_store_manager."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from ytpodcast.manager.audio_integrity_manager import AudioIntegrityManager
+from ytpodcast.manager.audio_store_manager import AudioStoreManager
+
+
+class TestAudioStoreManager(unittest.TestCase):
+    """Unit tests for the size-bounded audio store."""
+
+    def _create_manager(self, download_dir: str, max_bytes: int) -> AudioStoreManager:
+        """Build a store without a background sweeper."""
+        return AudioStoreManager(
+            download_dir=download_dir,
+            max_bytes=max_bytes,
+            pin_latest_count=1,
+            pin_ttl_seconds=60,
+            sweep_interval_seconds=0,
+            default_reservation_bytes=10,
+        )
+
+    def _write_file(self, path: Path, size: int, accessed_at: float) -> None:
+        """Write a file of size bytes with a fixed access time."""
+        path.write_bytes(b"x" * size)
+        os.utime(path, (accessed_at, accessed_at))
+
+    def test_sweep_evicts_least_recently_used_unpinned_files(self) -> None:
+        """Evict by access time while keeping pinned episodes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = self._create_manager(temp_dir, max_bytes=20)
+            self._write_file(Path(temp_dir) / "pinned.mp3", 10, 1000)
+            self._write_file(Path(temp_dir) / "old.mp3", 10, 2000)
+            self._write_file(Path(temp_dir) / "new.mp3", 10, 3000)
+            manager.pin_feed("channel", ["pinned", "other"])
+
+            manager.sweep()
+
+            self.assertTrue((Path(temp_dir) / "pinned.mp3").exists())
+            self.assertFalse((Path(temp_dir) / "old.mp3").exists())
+            self.assertTrue((Path(temp_dir) / "new.mp3").exists())
+            stats = manager.get_stats()
+            self.assertEqual(stats["bytes_used"], 20)
+            self.assertEqual(stats["evictions"], 1)
+
+    def test_eviction_deletes_integrity_records(self) -> None:
+        """Drop the record of an evicted file and keep the others."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            integrity_manager = AudioIntegrityManager(temp_dir, "ffprobe")
+            manager = AudioStoreManager(
+                download_dir=temp_dir,
+                max_bytes=10,
+                pin_latest_count=0,
+                pin_ttl_seconds=60,
+                sweep_interval_seconds=0,
+                default_reservation_bytes=10,
+                audio_integrity_manager=integrity_manager,
+            )
+            for name, accessed_at in (("old.mp3", 1000), ("new.mp3", 2000)):
+                self._write_file(Path(temp_dir) / name, 10, accessed_at)
+                (integrity_manager.records_dir / f"{name}.json").write_text("{}", encoding="utf-8")
+
+            manager.sweep()
+
+            self.assertFalse((integrity_manager.records_dir / "old.mp3.json").exists())
+            self.assertTrue((integrity_manager.records_dir / "new.mp3.json").exists())
+
+    def test_reserve_makes_room_and_rejects_oversized_downloads(self) -> None:
+        """Evict to fit a reservation and refuse one larger than the quota."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = self._create_manager(temp_dir, max_bytes=30)
+            self._write_file(Path(temp_dir) / "a.mp3", 10, 1000)
+            self._write_file(Path(temp_dir) / "b.mp3", 10, 2000)
+
+            with manager.reserve(15):
+                self.assertEqual(manager.get_stats()["reserved_bytes"], 15)
+                self.assertFalse((Path(temp_dir) / "a.mp3").exists())
+            self.assertEqual(manager.get_stats()["reserved_bytes"], 0)
+
+            with self.assertRaises(ValueError):
+                with manager.reserve(40):
+                    pass
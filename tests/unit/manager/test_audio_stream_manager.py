@@ -0,0 +1,56 @@
+"""Unit tests for ytpodcast.manager.audio_stream_manager."""
+
+from __future__ import annotations
+
+import tempfile
+import threading
+import unittest
+from collections.abc import Iterator
+from pathlib import Path
+
+from ytpodcast.manager.audio_stream_manager import AudioStreamManager
+
+
+class TestAudioStreamManager(unittest.TestCase):
+    """Unit tests for live audio stream sharing."""
+
+    def test_readers_join_live_stream_and_file_is_stored(self) -> None:
+        """Share one encode between readers and persist the finished output."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = AudioStreamManager(lock_dir=temp_dir, poll_interval_seconds=0.01)
+            output_path = Path(temp_dir) / "vid.mp3"
+            release = threading.Event()
+            calls: list[int] = []
+
+            def source() -> Iterator[bytes]:
+                calls.append(1)
+                yield b"first-"
+                release.wait(timeout=5)
+                yield b"second"
+
+            first_reader = manager.open("vid", output_path, source)
+            self.assertEqual(next(first_reader), b"first-")
+            second_reader = manager.open("vid", output_path, source)
+            release.set()
+
+            self.assertEqual(b"first-" + b"".join(first_reader), b"first-second")
+            self.assertEqual(b"".join(second_reader), b"first-second")
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(output_path.read_bytes(), b"first-second")
+            self.assertFalse(output_path.with_name("vid.mp3.part").exists())
+            self.assertEqual(manager.get_stats()["total_joined"], 1)
+
+    def test_failed_source_raises_and_leaves_no_output(self) -> None:
+        """Surface encoder failures to readers and discard the partial file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = AudioStreamManager(lock_dir=temp_dir, poll_interval_seconds=0.01)
+            output_path = Path(temp_dir) / "vid.mp3"
+
+            def source() -> Iterator[bytes]:
+                yield b"partial"
+                raise ValueError("ffmpeg exited with status 1.")
+
+            reader = manager.open("vid", output_path, source)
+            with self.assertRaises(ValueError):
+                b"".join(reader)
+            self.assertFalse(output_path.exists())
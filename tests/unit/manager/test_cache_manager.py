@@ -0,0 +1,88 @@
+"""Unit tests for ytpodcast.manager.cache_manager."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from unittest.mock import patch
+
+from ytpodcast.manager.cache_manager import CacheManager
+
+
+class TestCacheManager(unittest.TestCase):
+    """Unit tests for the memory tier in front of the file store."""
+
+    def setUp(self) -> None:
+        """Create a cache over a temporary directory."""
+        self._temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.cache_manager = CacheManager(
+            self._temp_dir.name,
+            memory_max_entries=2,
+            memory_max_bytes=1024,
+        )
+
+    def tearDown(self) -> None:
+        """Remove the temporary cache."""
+        self._temp_dir.cleanup()
+
+    def test_hot_hits_skip_the_file_store(self) -> None:
+        """Serve written and read entries from memory, evicting the least recent."""
+        self.cache_manager.set("first", "one", ttl_seconds=60)
+        self.cache_manager.set("second", "two", ttl_seconds=60)
+        self.assertEqual(self.cache_manager.get("first"), "one")
+        self.cache_manager.set("third", "three", ttl_seconds=60)
+
+        self.assertEqual(self.cache_manager.get("second"), "two")
+        self.assertEqual(self.cache_manager.get("third"), "three")
+
+        stats = self.cache_manager.get_stats()
+        self.assertEqual(stats["memory"]["entries"], 2)
+        self.assertEqual(stats["memory"]["hits"], 2)
+        self.assertEqual(stats["memory"]["misses"], 1)
+        self.assertEqual(stats["memory"]["evictions"], 2)
+        self.assertEqual(stats["file"]["hits"], 1)
+
+    def test_byte_bound_and_expiry_fall_through_to_files(self) -> None:
+        """Keep oversized values out of memory and reread expired ones from files."""
+        self.cache_manager.set("large", "x" * 2048, ttl_seconds=60)
+        self.cache_manager.set("small", "value", ttl_seconds=60)
+        later = datetime.now(timezone.utc) + timedelta(seconds=120)
+
+        with patch.object(CacheManager, "_now_utc", return_value=later):
+            stale_value = self.cache_manager.get("small", max_stale_seconds=3600)
+            expired_value = self.cache_manager.get("small")
+
+        stats = self.cache_manager.get_stats()
+        self.assertEqual(self.cache_manager.get("large"), "x" * 2048)
+        self.assertEqual(stale_value, "value")
+        self.assertIsNone(expired_value)
+        self.assertEqual(stats["memory"]["entries"], 0)
+        self.assertEqual(stats["memory"]["bytes"], 0)
+        self.assertEqual(stats["file"], {"hits": 1, "misses": 1, "hit_rate": 0.5})
+
+    def test_oversized_rewrite_replaces_the_memory_copy(self) -> None:
+        """Drop the old memory copy when a key is rewritten with a value too large to keep."""
+        self.cache_manager.set("feed", "old", ttl_seconds=60)
+        self.cache_manager.set("feed", "y" * 2048, ttl_seconds=60)
+
+        self.assertEqual(self.cache_manager.get("feed"), "y" * 2048)
+        self.assertEqual(self.cache_manager.get_stats()["memory"]["entries"], 0)
+
+    def test_bodies_rewritten_by_another_worker_are_not_paired_with_old_header(self) -> None:
+        """Serve a compressed body only for the etag it was written with."""
+        other_worker = CacheManager(self._temp_dir.name)
+        other_worker.set("feed", "old", ttl_seconds=60, etag='"v1"', content_encodings=("gzip",))
+        header = self.cache_manager.get_header("feed")
+        other_worker.set("feed", "new", ttl_seconds=60, etag='"v2"', content_encodings=("gzip",))
+
+        assert header is not None
+        self.assertEqual(header.get_etag(), '"v1"')
+        self.assertIsNone(self.cache_manager.get_encoded("feed", "gzip", header.get_etag()))
+        self.assertIsNotNone(self.cache_manager.get_encoded("feed", "gzip", '"v2"'))
+
+
+if __name__ == "__main__":
+    unittest.main()
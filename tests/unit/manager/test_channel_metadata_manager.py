@@ -0,0 +1,56 @@
+"""Unit tests for ytpodcast.manager.channel_metadata_manager."""
+
+from __future__ import annotations
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ytpodcast.manager.channel_metadata_manager import ChannelMetadataManager
+from ytpodcast.model.client.ytapi.channel_response import ChannelResponse
+
+
+class TestChannelMetadataManager(unittest.TestCase):
+    """Unit tests for the channel metadata store."""
+
+    def test_resolutions_outlive_snippets(self) -> None:
+        """Keep handle resolutions after the snippet has to be refreshed."""
+        channel_id = "UCabcdefghijklmnopqrstuv"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_path = str(Path(temp_dir) / "channels.sqlite3")
+            manager = ChannelMetadataManager(
+                database_path,
+                identifier_max_age_seconds=3600,
+                snippet_max_age_seconds=60,
+            )
+            manager.put(
+                "@Podcast",
+                ChannelResponse(
+                    channel_id=channel_id,
+                    title="Podcast",
+                    description="",
+                    url=f"https://www.youtube.com/channel/{channel_id}",
+                    image_url="",
+                ),
+            )
+
+            reopened = ChannelMetadataManager(
+                database_path,
+                identifier_max_age_seconds=3600,
+                snippet_max_age_seconds=60,
+            )
+            self.assertEqual(reopened.resolve("@podcast"), channel_id)
+            stored = reopened.get(channel_id)
+            assert stored is not None
+            self.assertEqual(stored.get_title(), "Podcast")
+            with patch("time.time", return_value=time.time() + 120):
+                self.assertEqual(reopened.resolve("@Podcast"), channel_id)
+                self.assertIsNone(reopened.get(channel_id))
+            self.assertIsNone(reopened.resolve("@other"))
+            self.assertEqual(reopened.get_stats()["resolution_misses"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
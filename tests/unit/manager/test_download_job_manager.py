@@ -0,0 +1,70 @@
+"""Unit tests for ytpodcast.manager.download_job_manager."""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import unittest
+from pathlib import Path
+
+from ytpodcast.manager.download_job_manager import DownloadJobManager
+from ytpodcast.model.service.download_job import DownloadJobStatus
+
+
+class TestDownloadJobManager(unittest.TestCase):
+    """Unit tests for the download job queue."""
+
+    def test_submit_deduplicates_and_completes(self) -> None:
+        """Return the pending job for repeated submissions and finish it."""
+        manager = DownloadJobManager(worker_count=1, queue_size=4)
+        release = threading.Event()
+        calls: list[int] = []
+
+        def work() -> Path:
+            calls.append(1)
+            release.wait(timeout=5)
+            return Path("/tmp/vid.mp3")
+
+        manager.submit("vid", work)
+        manager.submit("vid", work)
+        pending = asyncio.run(manager.wait("vid", 0.05))
+        self.assertIsNotNone(pending)
+        assert pending is not None
+        self.assertFalse(pending.is_finished())
+        release.set()
+        finished = asyncio.run(manager.wait("vid", 5))
+        assert finished is not None
+        self.assertEqual(finished.get_status(), DownloadJobStatus.COMPLETED)
+        self.assertEqual(finished.get_path(), "/tmp/vid.mp3")
+        self.assertEqual(len(calls), 1)
+
+    def test_submit_raises_when_queue_is_full(self) -> None:
+        """Reject new jobs once the bounded queue is saturated."""
+        manager = DownloadJobManager(worker_count=1, queue_size=1)
+        release = threading.Event()
+
+        def work() -> Path:
+            release.wait(timeout=5)
+            return Path("/tmp/out.mp3")
+
+        manager.submit("running", work)
+        while manager.get_stats()["jobs"]["running"] == 0:
+            release.wait(0.01)
+        manager.submit("queued", work)
+        with self.assertRaises(queue.Full):
+            manager.submit("rejected", work)
+        release.set()
+
+    def test_finished_jobs_are_forgotten_after_retention(self) -> None:
+        """Wake waiters without threads and drop finished jobs past the retention window."""
+        manager = DownloadJobManager(worker_count=1, queue_size=4, retention_seconds=0)
+
+        async def submit_and_wait() -> DownloadJobStatus | None:
+            manager.submit("vid", lambda: Path("/tmp/vid.mp3"))
+            job = await manager.wait("vid", 5)
+            return job.get_status() if job is not None else None
+
+        self.assertEqual(asyncio.run(submit_and_wait()), DownloadJobStatus.COMPLETED)
+        self.assertEqual(manager.get_stats()["jobs"]["completed"], 0)
+        self.assertIsNone(manager.get_job("vid"))
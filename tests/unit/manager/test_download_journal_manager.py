@@ -0,0 +1,35 @@
+"""Unit tests for ytpodcast.manager.download_journal_manager."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from ytpodcast.helper.file_lock import FileLock
+from ytpodcast.manager.download_journal_manager import DownloadJournalManager
+
+
+class TestDownloadJournalManager(unittest.TestCase):
+    """Unit tests for crash recovery bookkeeping."""
+
+    def test_only_entries_without_a_live_owner_are_collected(self) -> None:
+        """Skip jobs whose lock is held and hand back abandoned ones once."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            lock_dir = Path(temp_dir) / "locks"
+            manager = DownloadJournalManager(str(Path(temp_dir) / "journal"), str(lock_dir))
+            manager.begin("live.mp3", {"video_id": "live"})
+            manager.begin("dead.mp3", {"video_id": "dead"})
+            manager.begin("done.mp3", {"video_id": "done"})
+            manager.end("done.mp3")
+
+            with FileLock(lock_dir / "live.mp3.lock"):
+                interrupted = manager.collect_interrupted()
+
+            self.assertEqual([entry["video_id"] for entry in interrupted], ["dead"])
+            self.assertEqual(manager.collect_interrupted()[0]["video_id"], "live")
+            self.assertEqual(manager.collect_interrupted(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
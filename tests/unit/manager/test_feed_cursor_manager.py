@@ -0,0 +1,88 @@
+"""Unit tests for ytpodcast.manager.feed_cursor_manager."""
+
+from __future__ import annotations
+
+import base64
+import tempfile
+import unittest
+from datetime import datetime
+from datetime import timezone
+
+from ytpodcast.manager.cache_manager import CacheManager
+from ytpodcast.manager.feed_cursor_manager import FeedCursorManager
+from ytpodcast.model.service.feed_cursor import FeedCursor
+
+
+class TestFeedCursorManager(unittest.TestCase):
+    """Unit tests for remembered feed positions."""
+
+    def setUp(self) -> None:
+        """Create a manager over a temporary file cache."""
+        self._temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.feed_cursor_manager = FeedCursorManager(CacheManager(self._temp_dir.name), 900)
+        self.from_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def tearDown(self) -> None:
+        """Remove the temporary cache."""
+        self._temp_dir.cleanup()
+
+    def create_cursor(self, offset: int, page_token: str | None) -> FeedCursor:
+        """Build a position in the listing filtered from from_date."""
+        return FeedCursor(
+            channel_id="UCchannel",
+            from_date=self.from_date,
+            include_shorts=False,
+            offset=offset,
+            page_token=page_token,
+            page_position=1,
+        )
+
+    def test_find_nearest_returns_the_deepest_earlier_position(self) -> None:
+        """Resume from the checkpoint closest to, but not past, the offset."""
+        self.feed_cursor_manager.remember(
+            [
+                self.create_cursor(0, None),
+                self.create_cursor(40, "p2"),
+                self.create_cursor(80, "p3"),
+            ]
+        )
+
+        nearest = self.feed_cursor_manager.find_nearest(
+            "UCchannel",
+            self.from_date,
+            None,
+            False,
+            79,
+        )
+
+        assert nearest is not None
+        self.assertEqual((nearest.get_offset(), nearest.get_page_token()), (40, "p2"))
+        self.assertIsNone(
+            self.feed_cursor_manager.find_nearest("UCchannel", None, None, False, 79)
+        )
+        self.assertEqual(self.feed_cursor_manager.get_stats()["resumed"], 1)
+
+    def test_tokens_round_trip_and_reject_garbage(self) -> None:
+        """Decode what encode produced and raise ValueError for anything else."""
+        cursor = self.create_cursor(40, "p2").model_copy(update={"limit": 20})
+
+        token = self.feed_cursor_manager.encode(cursor)
+
+        self.assertEqual(self.feed_cursor_manager.decode(token), cursor)
+        with self.assertRaises(ValueError):
+            self.feed_cursor_manager.decode("not-a-cursor")
+
+    def test_decode_rejects_out_of_range_positions(self) -> None:
+        """Refuse forged cursors whose paging fields the query checks would reject."""
+        for payload in (
+            '{"channel_id": "UCchannel", "limit": 0}',
+            '{"channel_id": "UCchannel", "offset": -5}',
+            '{"channel_id": "UCchannel", "page_position": -1}',
+        ):
+            token = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+            with self.assertRaises(ValueError):
+                self.feed_cursor_manager.decode(token)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+"""Unit tests for ytpodcast.manager.feed_refresh_manager."""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import unittest
+from collections.abc import Awaitable
+from collections.abc import Callable
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from unittest.mock import patch
+
+from ytpodcast.manager.cache_manager import CacheManager
+from ytpodcast.manager.feed_refresh_manager import FeedRefreshManager
+
+
+class TestFeedRefreshManager(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for stale feed serving and background rebuilds."""
+
+    async def test_schedule_runs_one_rebuild_per_key(self) -> None:
+        """Join stale hits on a running rebuild and count its outcome."""
+        feed_refresh_manager = FeedRefreshManager(10800, 86400, 604800)
+        release = asyncio.Event()
+        calls: list[str] = []
+
+        async def rebuild() -> None:
+            calls.append("rebuild")
+            await release.wait()
+
+        self.assertTrue(feed_refresh_manager.schedule("feed", rebuild))
+        self.assertFalse(feed_refresh_manager.schedule("feed", rebuild))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        stats = feed_refresh_manager.get_stats()
+        self.assertEqual(calls, ["rebuild"])
+        self.assertEqual(stats["stale_hits"], 2)
+        self.assertEqual(stats["refreshes"], 1)
+        self.assertEqual(stats["in_flight"], 0)
+
+    async def test_failed_rebuild_keeps_stale_entry(self) -> None:
+        """Count upstream failures and keep serving the expired value."""
+        feed_refresh_manager = FeedRefreshManager(10800, 86400, 604800)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_manager = CacheManager(temp_dir)
+            cache_manager.set("feed", "<rss />", ttl_seconds=60, etag='"abc"')
+
+            async def rebuild() -> None:
+                raise ValueError("quota exceeded")
+
+            feed_refresh_manager.schedule("feed", rebuild)
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            later = datetime.now(timezone.utc) + timedelta(seconds=120)
+            with patch.object(CacheManager, "_now_utc", return_value=later):
+                expired_value = cache_manager.get("feed")
+                stale_value = cache_manager.get(
+                    "feed",
+                    max_stale_seconds=feed_refresh_manager.get_retention_seconds(),
+                )
+                stale_header = cache_manager.get_header("feed", max_stale_seconds=3600)
+
+        self.assertIsNone(expired_value)
+        self.assertEqual(stale_value, "<rss />")
+        self.assertIsNotNone(stale_header)
+        self.assertEqual(feed_refresh_manager.get_stats()["refresh_failures"], 1)
+
+    async def test_any_rebuild_failure_is_counted(self) -> None:
+        """Count transport and storage errors, and still let cancellation through."""
+        feed_refresh_manager = FeedRefreshManager(10800, 86400, 604800)
+
+        async def rebuild() -> None:
+            raise OSError("disk full")
+
+        feed_refresh_manager.schedule("feed", rebuild)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        async def slow_rebuild() -> None:
+            await asyncio.sleep(60)
+
+        feed_refresh_manager.schedule("slow", slow_rebuild)
+        await asyncio.sleep(0)
+        await feed_refresh_manager.aclose()
+
+        stats = feed_refresh_manager.get_stats()
+        self.assertEqual(stats["refresh_failures"], 1)
+        self.assertEqual(stats["in_flight"], 0)
+
+    async def test_run_due_refreshes_within_budget(self) -> None:
+        """Refresh tracked feeds ahead of expiry until the quota budget is spent."""
+        quota_used = [0]
+
+        async def rebuild() -> None:
+            quota_used[0] += 100
+
+        feed_refresh_manager = FeedRefreshManager(
+            10800,
+            86400,
+            604800,
+            quota_usage=lambda: quota_used[0],
+            track_seconds=3600,
+            lead_seconds=600,
+            stagger_seconds=300,
+            quota_budget_per_hour=150,
+        )
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        for key in ("first", "second", "third"):
+            feed_refresh_manager.track(key, rebuild, expires_at)
+            feed_refresh_manager.track(key, rebuild, expires_at)
+        queue = feed_refresh_manager.get_stats()["queue"]
+        next_runs = {entry["next_run_at"] for entry in queue}
+
+        feed_refresh_manager.run_due()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        feed_refresh_manager.run_due()
+
+        stats = feed_refresh_manager.get_stats()
+        self.assertEqual(len(next_runs), 3)
+        self.assertEqual(stats["proactive_refreshes"], 3)
+        self.assertEqual(stats["quota_spent_last_hour"], 300)
+        self.assertEqual(quota_used[0], 300)
+        feed_refresh_manager.track("third", rebuild, expires_at)
+        feed_refresh_manager.run_due()
+        stats = feed_refresh_manager.get_stats()
+        self.assertEqual(stats["skipped_for_budget"], 1)
+        self.assertEqual([entry["key"] for entry in stats["queue"]][0], "third")
+        self.assertGreater(stats["queue"][1]["next_run_at"], datetime.now(timezone.utc).isoformat())
+
+    async def test_tracking_is_bounded_and_skips_one_off_feeds(self) -> None:
+        """Drop the least recently requested feeds and refresh only repeated ones."""
+        calls: list[str] = []
+
+        def create_rebuild(key: str) -> Callable[[], Awaitable[None]]:
+            async def rebuild() -> None:
+                calls.append(key)
+
+            return rebuild
+
+        feed_refresh_manager = FeedRefreshManager(
+            10800,
+            86400,
+            604800,
+            track_seconds=3600,
+            max_tracked=2,
+        )
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        feed_refresh_manager.track("evicted", create_rebuild("evicted"), expires_at)
+        feed_refresh_manager.track("evicted", create_rebuild("evicted"), expires_at)
+        feed_refresh_manager.track("repeated", create_rebuild("repeated"), expires_at)
+        feed_refresh_manager.track("repeated", create_rebuild("repeated"), expires_at)
+        feed_refresh_manager.track("one-off", create_rebuild("one-off"), expires_at)
+
+        feed_refresh_manager.run_due()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        queue = feed_refresh_manager.get_stats()["queue"]
+        self.assertEqual(sorted(entry["key"] for entry in queue), ["one-off", "repeated"])
+        self.assertEqual(calls, ["repeated"])
+
+    def test_compute_ttl_seconds_follows_upload_cadence(self) -> None:
+        """Derive the TTL from upload gaps and recency within the bounds."""
+        feed_refresh_manager = FeedRefreshManager(
+            10800,
+            86400,
+            604800,
+            adaptive_ttl=True,
+            min_ttl_seconds=900,
+            max_ttl_seconds=86400,
+            ttl_gap_fraction=0.25,
+        )
+        now = datetime.now(timezone.utc)
+        hourly = [now - timedelta(hours=hours) for hours in range(0, 10)]
+        daily = [now - timedelta(days=days, hours=1) for days in range(0, 5)]
+        monthly = [now - timedelta(days=30 * months) for months in range(0, 4)]
+
+        self.assertEqual(feed_refresh_manager.compute_ttl_seconds(hourly), 900)
+        self.assertEqual(feed_refresh_manager.compute_ttl_seconds(daily), 21600)
+        self.assertEqual(feed_refresh_manager.compute_ttl_seconds(monthly), 86400)
+        self.assertEqual(feed_refresh_manager.compute_ttl_seconds([]), 10800)
+        self.assertEqual(
+            feed_refresh_manager.compute_ttl_seconds(hourly, to_date=now - timedelta(days=1)),
+            86400,
+        )
+
+        feed_refresh_manager.record_rebuild("monthly", 86400, 4)
+        feed_refresh_manager.record_rebuild("hourly", 900, 4)
+        adaptive_stats = feed_refresh_manager.get_stats()["adaptive_ttl"]
+        self.assertEqual(adaptive_stats["rebuilds"], 2)
+        self.assertEqual(adaptive_stats["fixed_ttl_rebuilds"], 8.08)
+        self.assertEqual(adaptive_stats["rebuilds_saved"], 6.08)
+        self.assertEqual(adaptive_stats["quota_units_saved"], 24.33)
+
+        uncached_refresh_manager = FeedRefreshManager(0, 86400, 604800)
+        uncached_refresh_manager.record_rebuild("feed", 0, 4)
+        self.assertEqual(uncached_refresh_manager.get_stats()["adaptive_ttl"]["rebuilds_saved"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
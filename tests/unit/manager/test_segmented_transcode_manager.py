@@ -0,0 +1,45 @@
+"""Unit tests for ytpodcast.manager.segmented_transcode_manager."""
+
+from __future__ import annotations
+
+import unittest
+
+from ytpodcast.manager.segmented_transcode_manager import SegmentedTranscodeManager
+from ytpodcast.model.service.audio_output_policy import AudioOutputCodec
+from ytpodcast.model.service.audio_output_policy import AudioOutputPolicy
+
+
+class TestSegmentedTranscodeManager(unittest.TestCase):
+    """Unit tests for segment planning."""
+
+    def test_segments_are_contiguous_and_frame_aligned(self) -> None:
+        """Cover every frame exactly once with one segment per worker."""
+        manager = SegmentedTranscodeManager("ffmpeg", min_duration_seconds=1800, worker_count=4)
+        total_frames = -(-3 * 3600 * 44100 // 1152)
+
+        segments = manager.plan_segments(3 * 3600, 44100, 1152)
+
+        self.assertEqual(len(segments), 4)
+        self.assertEqual(segments[0].start_frame, 0)
+        self.assertEqual(segments[0].preroll_frames, 0)
+        for previous, current in zip(segments, segments[1:]):
+            assert previous.frame_count is not None
+            self.assertEqual(previous.start_frame + previous.frame_count, current.start_frame)
+            self.assertEqual(current.preroll_frames, 77)
+        self.assertIsNone(segments[-1].frame_count)
+        self.assertLess(segments[-1].start_frame, total_frames)
+
+    def test_short_or_unsupported_sources_are_not_segmented(self) -> None:
+        """Only segment long sources in codecs that can be joined losslessly."""
+        manager = SegmentedTranscodeManager("ffmpeg", min_duration_seconds=1800, worker_count=4)
+
+        self.assertFalse(manager.supports(AudioOutputPolicy(), 600))
+        self.assertFalse(manager.supports(AudioOutputPolicy(), None))
+        self.assertTrue(manager.supports(AudioOutputPolicy(), 7200))
+        self.assertFalse(
+            manager.supports(AudioOutputPolicy(codec=AudioOutputCodec.OPUS), 7200)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Unit tests for ytpodcast.manager.single_flight_manager."""
+
+from __future__ import annotations
+
+import tempfile
+import threading
+import unittest
+
+from ytpodcast.manager.single_flight_manager import SingleFlightManager
+
+
+class TestSingleFlightManager(unittest.TestCase):
+    """Unit tests for request coalescing."""
+
+    def test_concurrent_callers_share_one_execution(self) -> None:
+        """Run the work once and hand the result to every waiter."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = SingleFlightManager(lock_dir=temp_dir)
+            started = threading.Event()
+            release = threading.Event()
+            calls: list[int] = []
+
+            def work() -> str:
+                calls.append(1)
+                started.set()
+                release.wait(timeout=5)
+                return "done"
+
+            results: list[str] = []
+            leader = threading.Thread(target=lambda: results.append(manager.run("vid", work)))
+            leader.start()
+            started.wait(timeout=5)
+            followers = [
+                threading.Thread(target=lambda: results.append(manager.run("vid", work)))
+                for _ in range(3)
+            ]
+            for follower in followers:
+                follower.start()
+            while manager.get_stats()["in_flight"][0]["waiters"] < 3:
+                threading.Event().wait(0.01)
+            release.set()
+            for thread in [leader, *followers]:
+                thread.join(timeout=5)
+
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(results, ["done"] * 4)
+            stats = manager.get_stats()
+            self.assertEqual(stats["in_flight"], [])
+            self.assertEqual(stats["total_flights"], 1)
+            self.assertEqual(stats["total_joined"], 3)
+
+    def test_error_is_shared_and_flight_is_released(self) -> None:
+        """Propagate failures and allow a retry afterwards."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = SingleFlightManager(lock_dir=temp_dir)
+
+            def failing_work() -> str:
+                raise ValueError("boom")
+
+            with self.assertRaises(ValueError):
+                manager.run("vid", failing_work)
+            self.assertEqual(manager.run("vid", lambda: "ok"), "ok")
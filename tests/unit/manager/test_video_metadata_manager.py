@@ -0,0 +1,46 @@
+"""Unit tests for ytpodcast.manager.video_metadata_manager."""
+
+from __future__ import annotations
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ytpodcast.manager.video_metadata_manager import VideoMetadataManager
+from ytpodcast.model.client.ytapi.video_response import VideoResponse
+
+
+class TestVideoMetadataManager(unittest.TestCase):
+    """Unit tests for the video metadata store."""
+
+    def test_stale_titles_still_serve_structural_lookups(self) -> None:
+        """Keep durations forever but refresh titles after max age."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_path = str(Path(temp_dir) / "videos.sqlite3")
+            manager = VideoMetadataManager(database_path, max_age_seconds=60)
+            manager.put_many(
+                [
+                    VideoResponse(
+                        video_id="abc",
+                        title="Episode",
+                        description="",
+                        duration_seconds=3600,
+                        url="https://www.youtube.com/watch?v=abc",
+                        channel_id="UCchannel",
+                    )
+                ]
+            )
+
+            reopened = VideoMetadataManager(database_path, max_age_seconds=60)
+            self.assertEqual(reopened.get_many(["abc"])["abc"].get_title(), "Episode")
+            with patch("time.time", return_value=time.time() + 120):
+                self.assertEqual(reopened.get_many(["abc", "missing"]), {})
+                structural = reopened.get_many(["abc"], structural_only=True)
+            self.assertEqual(structural["abc"].get_duration_seconds(), 3600)
+            self.assertEqual(reopened.get_stats()["misses"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
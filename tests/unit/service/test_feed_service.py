@@ -0,0 +1,289 @@
+"""Unit tests for ytpodcast.service.feed_service."""
+
+from __future__ import annotations
+
+import tempfile
+from collections.abc import Callable
+import unittest
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from pathlib import Path
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+from ytpodcast.manager.cache_manager import CacheManager
+from ytpodcast.manager.channel_index_manager import ChannelIndexManager
+from ytpodcast.manager.feed_cursor_manager import FeedCursorManager
+from ytpodcast.mapper.service.feed_item_mapper import FeedItemMapper
+from ytpodcast.model.client.ytapi.channel_video_response import ChannelVideoResponse
+from ytpodcast.model.client.ytapi.channel_videos_page_response import ChannelVideosPageResponse
+from ytpodcast.model.client.ytapi.video_response import VideoResponse
+from ytpodcast.model.service.channel import Channel
+from ytpodcast.service.feed_service import FeedService
+
+
+def create_page(
+    video_ids: list[str],
+    newest: datetime,
+    next_page_token: str | None,
+) -> ChannelVideosPageResponse:
+    """Build a listing page with one video per hour, newest first."""
+    return ChannelVideosPageResponse(
+        items=[
+            ChannelVideoResponse(
+                video_id=video_id,
+                title=video_id,
+                description="",
+                url=f"https://www.youtube.com/watch?v={video_id}",
+                published_at=newest - timedelta(hours=index),
+            )
+            for index, video_id in enumerate(video_ids)
+        ],
+        next_page_token=next_page_token,
+    )
+
+
+def create_video(video_id: str, duration_seconds: int) -> VideoResponse:
+    """Build a video details payload."""
+    return VideoResponse(
+        video_id=video_id,
+        title=video_id,
+        description="",
+        duration_seconds=duration_seconds,
+        url=f"https://www.youtube.com/watch?v={video_id}",
+        channel_id="UCchannel",
+    )
+
+
+def create_listing(
+    video_ids: list[str],
+    newest: datetime,
+) -> Callable[..., ChannelVideosPageResponse]:
+    """Build a fake listing whose page tokens are item offsets, like the API's."""
+
+    def fetch_channel_videos_page(
+        channel_id: str,
+        max_results: int = 20,
+        page_token: str | None = None,
+        **_: object,
+    ) -> ChannelVideosPageResponse:
+        del channel_id
+        start = int(page_token or 0)
+        end = min(start + max_results, len(video_ids))
+        return create_page(
+            video_ids[start:end],
+            newest - timedelta(hours=start),
+            str(end) if end < len(video_ids) else None,
+        )
+
+    return fetch_channel_videos_page
+
+
+class TestFeedService(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for feed collection."""
+
+    def setUp(self) -> None:
+        """Create a feed service over a stubbed API client."""
+        self.yt_api_client = AsyncMock()
+        self.feed_service = FeedService(
+            self.yt_api_client,
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+        )
+        self.newest = datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+
+    async def test_shorts_are_classified_once_per_page(self) -> None:
+        """Look up durations with one batched call per listing page."""
+        self.yt_api_client.fetch_channel_videos_page.side_effect = [
+            create_page(["a", "b", "c"], self.newest, "page-2"),
+            create_page(["d", "e"], self.newest - timedelta(days=1), None),
+        ]
+        self.yt_api_client.fetch_videos.side_effect = lambda video_ids, structural_only: {
+            video_id: create_video(video_id, 60 if video_id in ("b", "d") else 1800)
+            for video_id in video_ids
+        }
+
+        collected = await self.feed_service._collect_filtered_videos(  # pylint: disable=protected-access
+            "UCchannel",
+            3,
+            None,
+            None,
+            False,
+        )
+
+        self.assertEqual([video.get_video_id() for video in collected.videos], ["a", "c", "e"])
+        self.assertEqual(self.yt_api_client.fetch_videos.call_count, 2)
+        self.assertTrue(self.yt_api_client.fetch_videos.call_args.kwargs["structural_only"])
+        self.yt_api_client.fetch_video.assert_not_called()
+
+    async def test_from_date_stops_at_the_first_older_page(self) -> None:
+        """Stop paging once a page reaches back past from_date."""
+        self.yt_api_client.fetch_channel_videos_page.side_effect = [
+            create_page(["a", "b", "c"], self.newest, "page-2"),
+            create_page(["d", "e", "f"], self.newest - timedelta(days=1), "page-3"),
+            create_page(["g", "h", "i"], self.newest - timedelta(days=2), None),
+        ]
+
+        collected = await self.feed_service._collect_filtered_videos(  # pylint: disable=protected-access
+            "UCchannel",
+            20,
+            self.newest - timedelta(days=1, hours=1),
+            None,
+            True,
+        )
+
+        self.assertEqual(
+            [video.get_video_id() for video in collected.videos],
+            ["a", "b", "c", "d", "e"],
+        )
+        self.assertEqual(self.yt_api_client.fetch_channel_videos_page.call_count, 2)
+
+    async def test_date_range_is_forwarded_to_the_listing(self) -> None:
+        """Request full pages bounded by the date range in one upstream call."""
+        self.yt_api_client.fetch_channel_videos_page.side_effect = [
+            create_page(["d", "e"], self.newest - timedelta(days=1), None),
+        ]
+        from_date = datetime(2024, 4, 29)
+        to_date = self.newest - timedelta(hours=12)
+
+        collected = await self.feed_service._collect_filtered_videos(  # pylint: disable=protected-access
+            "UCchannel",
+            20,
+            from_date,
+            to_date,
+            True,
+        )
+
+        self.assertEqual([video.get_video_id() for video in collected.videos], ["d", "e"])
+        self.assertEqual(self.yt_api_client.fetch_channel_videos_page.call_count, 1)
+        kwargs = self.yt_api_client.fetch_channel_videos_page.call_args.kwargs
+        self.assertEqual(kwargs["max_results"], 50)
+        self.assertEqual(kwargs["published_after"], from_date.replace(tzinfo=timezone.utc))
+        self.assertEqual(kwargs["published_before"], to_date)
+
+    async def test_equivalent_queries_are_equal(self) -> None:
+        """Map parameter combinations that select the same items to one query."""
+        implicit = self.feed_service.create_feed_query(
+            "@Podcast",
+            None,
+            None,
+            datetime(2024, 5, 1, 12),
+            None,
+            False,
+        )
+        explicit = self.feed_service.create_feed_query(
+            "@podcast",
+            20,
+            0,
+            datetime(2024, 5, 1, 14, tzinfo=timezone(timedelta(hours=2))),
+            None,
+            False,
+        )
+
+        self.assertEqual(implicit, explicit)
+        self.assertNotEqual(
+            implicit,
+            self.feed_service.create_feed_query("@podcast", 20, 20, None, None, False),
+        )
+
+    async def test_index_syncs_only_new_uploads(self) -> None:
+        """Backfill once, then stop head syncs at the newest indexed video."""
+        self.yt_api_client.fetch_videos.side_effect = lambda video_ids, structural_only: {
+            video_id: create_video(video_id, 1800) for video_id in video_ids
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            channel_index_manager = ChannelIndexManager(str(Path(temp_dir) / "index.sqlite3"))
+            feed_service = FeedService(
+                self.yt_api_client,
+                MagicMock(),
+                MagicMock(),
+                MagicMock(),
+                channel_index_manager,
+                0,
+            )
+            self.yt_api_client.fetch_channel_videos_page.side_effect = [
+                create_page(["c", "d"], self.newest, "page-2"),
+                create_page(["e", "f"], self.newest - timedelta(days=1), None),
+            ]
+            first = await feed_service._query_channel_index(  # pylint: disable=protected-access
+                channel_index_manager, "UCchannel", 3, 3, None, None, None, False
+            )
+            self.assertEqual([video.get_video_id() for video in first], ["c", "d", "e"])
+
+            self.yt_api_client.fetch_channel_videos_page.reset_mock()
+            self.yt_api_client.fetch_channel_videos_page.side_effect = [
+                create_page(["a", "b", "c", "d"], self.newest + timedelta(hours=2), "page-2"),
+            ]
+            second = await feed_service._query_channel_index(  # pylint: disable=protected-access
+                channel_index_manager, "UCchannel", 3, 2, 1, None, None, False
+            )
+
+            self.assertEqual([video.get_video_id() for video in second], ["b", "c"])
+            self.assertEqual(self.yt_api_client.fetch_channel_videos_page.call_count, 1)
+
+    async def test_deep_offsets_resume_from_remembered_positions(self) -> None:
+        """Page forward from remembered listing positions instead of the newest upload."""
+        video_ids = [f"v{index:02d}" for index in range(12)]
+        self.yt_api_client.fetch_channel_videos_page.side_effect = create_listing(
+            video_ids,
+            self.newest,
+        )
+        channel_mapper = MagicMock()
+        channel_mapper.create_from_channel_response.return_value = Channel(
+            channel_id="UCchannel",
+            title="Channel",
+            description="",
+            url="https://www.youtube.com/channel/UCchannel",
+            image_url="",
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            feed_cursor_manager = FeedCursorManager(CacheManager(temp_dir), 900)
+            feed_service = FeedService(
+                self.yt_api_client,
+                channel_mapper,
+                FeedItemMapper(),
+                MagicMock(),
+                None,
+                0,
+                feed_cursor_manager,
+            )
+
+            first = await feed_service.get_channel_feed("UCchannel", limit=3, offset=6)
+            self.assertEqual(
+                [item.get_video_id() for item in first.get_items()],
+                ["v06", "v07", "v08"],
+            )
+
+            self.yt_api_client.fetch_channel_videos_page.reset_mock()
+            second = await feed_service.get_channel_feed("UCchannel", limit=2, offset=10)
+            self.assertEqual(
+                [item.get_video_id() for item in second.get_items()],
+                ["v10", "v11"],
+            )
+            self.assertEqual(self.yt_api_client.fetch_channel_videos_page.call_count, 1)
+            self.assertEqual(
+                self.yt_api_client.fetch_channel_videos_page.call_args.kwargs["page_token"],
+                "9",
+            )
+
+            next_cursor = first.get_next_cursor()
+            assert next_cursor is not None
+            cursor = feed_cursor_manager.decode(next_cursor)
+            self.yt_api_client.fetch_channel_videos_page.reset_mock()
+            third = await feed_service.get_channel_feed(
+                "UCchannel",
+                limit=cursor.get_limit(),
+                offset=cursor.get_offset(),
+                cursor=cursor,
+            )
+            self.assertEqual(
+                [item.get_video_id() for item in third.get_items()],
+                ["v09", "v10", "v11"],
+            )
+            self.assertEqual(self.yt_api_client.fetch_channel_videos_page.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
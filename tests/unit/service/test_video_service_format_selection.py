@@ -0,0 +1,112 @@
+"""Unit tests for VideoService format selection."""
+
+import unittest
+from unittest.mock import MagicMock
+
+from ytpodcast.model.client.ytdl.audio_format_response import AudioFormatResponse
+from ytpodcast.model.service.audio_format_preference import AudioFormatPreference
+from ytpodcast.model.service.audio_output_policy import AudioOutputCodec
+from ytpodcast.model.service.audio_output_policy import AudioOutputMode
+from ytpodcast.model.service.audio_output_policy import AudioOutputPolicy
+from ytpodcast.service.video_service import VideoService
+
+
+def create_audio_format(
+    format_id: str,
+    extension: str,
+    audio_bitrate_kbps: int,
+    language: str,
+) -> AudioFormatResponse:
+    """Create an audio-only format listing entry."""
+    return AudioFormatResponse(
+        format_id=format_id,
+        extension=extension,
+        audio_bitrate_kbps=audio_bitrate_kbps,
+        is_audio_only=True,
+        language=language,
+    )
+
+
+def create_video_service(format_preference: AudioFormatPreference) -> VideoService:
+    """Create a video service whose collaborators are not used by selection."""
+    return VideoService(
+        MagicMock(),
+        MagicMock(),
+        MagicMock(),
+        MagicMock(),
+        MagicMock(),
+        MagicMock(),
+        AudioOutputPolicy(),
+        format_preference,
+        MagicMock(),
+    )
+
+
+class TestVideoServiceFormatSelection(unittest.TestCase):
+    """Check that both selection paths follow the same preferences."""
+
+    def test_selector_orders_language_then_bitrate_then_codec(self) -> None:
+        """Compile preferences into ordered yt-dlp alternatives."""
+        video_service: VideoService = create_video_service(
+            AudioFormatPreference(preferred_languages=["it"], max_bitrate_kbps=128)
+        )
+        output_policy: AudioOutputPolicy = AudioOutputPolicy(
+            mode=AudioOutputMode.REMUX,
+            codec=AudioOutputCodec.OPUS,
+        )
+
+        alternatives: list[str] = video_service._build_format_selector(  # pylint: disable=protected-access
+            output_policy
+        ).split("/")
+
+        self.assertEqual(alternatives[0], "bestaudio[language^=it][abr<=?128][ext=opus]")
+        self.assertLess(
+            alternatives.index("bestaudio[language^=it]"),
+            alternatives.index("bestaudio[abr<=?128][ext=opus]"),
+        )
+        self.assertEqual(alternatives[-2:], ["bestaudio", "best"])
+
+    def test_download_size_is_estimated_from_cached_listing(self) -> None:
+        """Reserve the cached size of the likely format, or defer to the default."""
+        video_service: VideoService = create_video_service(AudioFormatPreference())
+        yt_dl_client: MagicMock = video_service.yt_dl_client  # type: ignore[assignment]
+        audio_format: AudioFormatResponse = create_audio_format(
+            "251", "webm", 160, "en"
+        ).model_copy(update={"file_size_bytes": 4_000_000})
+        yt_dl_client.get_cached_audio_formats.return_value = [
+            create_audio_format("140", "m4a", 128, "en"),
+            audio_format,
+        ]
+
+        # pylint: disable=protected-access
+        estimate: int | None = video_service._estimate_download_bytes("vid", AudioOutputPolicy())
+        yt_dl_client.get_cached_audio_formats.return_value = None
+        uncached_estimate: int | None = video_service._estimate_download_bytes(
+            "vid", AudioOutputPolicy()
+        )
+
+        self.assertEqual(estimate, 4_000_000)
+        self.assertIsNone(uncached_estimate)
+
+    def test_listing_selection_prefers_language_within_ceiling(self) -> None:
+        """Pick the highest bitrate preferred-language format under the ceiling."""
+        video_service: VideoService = create_video_service(
+            AudioFormatPreference(preferred_languages=["it"], max_bitrate_kbps=130)
+        )
+        audio_formats: list[AudioFormatResponse] = [
+            create_audio_format("1", "m4a", 128, "en"),
+            create_audio_format("2", "m4a", 48, "it"),
+            create_audio_format("3", "m4a", 129, "it-IT"),
+            create_audio_format("4", "webm", 160, "it"),
+        ]
+
+        selected: AudioFormatResponse = video_service._select_best_audio_format(  # pylint: disable=protected-access
+            audio_formats,
+            AudioOutputPolicy(),
+        )
+
+        self.assertEqual(selected.get_format_id(), "3")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,33 +1,52 @@
 """Module for ytpodcast.api."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 from starlette.responses import RedirectResponse
 
+from ytpodcast.client.yt_api_client import YtApiClient
 from ytpodcast.config.app_config import AppConfig
 from ytpodcast.container.default_container import DefaultContainer
 from ytpodcast.controller.channel_controller import ChannelController
 from ytpodcast.controller.feed_controller import FeedController
+from ytpodcast.controller.stats_controller import StatsController
 from ytpodcast.controller.video_controller import VideoController
+from ytpodcast.manager.feed_refresh_manager import FeedRefreshManager
 
 
 default_container: DefaultContainer = DefaultContainer.get_instance()
 app_config: AppConfig = default_container.get(AppConfig)
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Schedule feed refreshes, and stop them and close upstream connections on shutdown."""
+    default_container.get(FeedRefreshManager).start_scheduler()
+    yield
+    await default_container.get(FeedRefreshManager).aclose()
+    await default_container.get(YtApiClient).aclose()
+
+
 app = FastAPI(
     title=app_config.app_name,
     description="YT podcast API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 channel_controller: ChannelController = default_container.get(ChannelController)
 feed_controller: FeedController = default_container.get(FeedController)
 video_controller: VideoController = default_container.get(VideoController)
+stats_controller: StatsController = default_container.get(StatsController)
 
 app.include_router(channel_controller.router)
 app.include_router(feed_controller.router)
 app.include_router(video_controller.router)
+app.include_router(stats_controller.router)
 
 app.add_middleware(
     CORSMiddleware,
@@ -1,13 +1,21 @@
 """Module for ytpodcast.client.yt_api_client."""
 
+import asyncio
+import importlib.util
+import logging
+import threading
 from datetime import datetime
 from datetime import timezone
 from typing import Any
 
-from pyyoutube import Client
+import httpx
 from pyyoutube.models.channel import ChannelListResponse
+from pyyoutube.models.playlist_item import PlaylistItemListResponse
+from pyyoutube.models.search_result import SearchListResponse
 from pyyoutube.models.video import VideoListResponse
 
+from ytpodcast.manager.channel_metadata_manager import ChannelMetadataManager
+from ytpodcast.manager.video_metadata_manager import VideoMetadataManager
 from ytpodcast.model.client.ytapi.channel_response import ChannelResponse
 from ytpodcast.model.client.ytapi.channel_video_response import ChannelVideoResponse
 from ytpodcast.model.client.ytapi.channel_videos_page_response import ChannelVideosPageResponse
@@ -16,73 +24,316 @@ from ytpodcast.mapper.client.ytapi.channel_response_mapper import ChannelRespons
 from ytpodcast.mapper.client.ytapi.video_response_mapper import VideoResponseMapper
 
 
+# Quota units charged per request by the YouTube Data API.
+QUOTA_COSTS: dict[str, int] = {
+    "channels.list": 1,
+    "videos.list": 1,
+    "playlistItems.list": 1,
+    "search.list": 100,
+}
+
+# Maximum number of ids accepted by a single videos.list request.
+VIDEOS_BATCH_SIZE = 50
+
+CHANNEL_LISTING_PLAYLIST = "playlist"
+CHANNEL_LISTING_SEARCH = "search"
+
+# HTTP/2 needs the optional h2 package; without it requests use HTTP/1.1.
+HTTP2_AVAILABLE: bool = importlib.util.find_spec("h2") is not None
+
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=too-many-instance-attributes
 class YtApiClient:
-    """Client wrapper for the YouTube Data API."""
+    """Asynchronous client for the YouTube Data API.
 
+    Requests share one keep-alive connection pool, multiplexed over HTTP/2
+    when available, so a worker can keep many upstream calls in flight
+    without blocking the event loop. A semaphore caps concurrent requests
+    and every request is bounded by timeout_seconds. The pool belongs to
+    the event loop that first used it and is recreated for a new loop.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
         self,
         base_url: str,
         api_key: str,
         channel_response_mapper: ChannelResponseMapper,
         video_response_mapper: VideoResponseMapper,
+        channel_listing: str = CHANNEL_LISTING_PLAYLIST,
+        video_metadata_manager: VideoMetadataManager | None = None,
+        channel_metadata_manager: ChannelMetadataManager | None = None,
+        timeout_seconds: float = 10.0,
+        max_connections: int = 20,
+        max_concurrent_requests: int = 100,
+        http2: bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
     ) -> None:
         """Store API configuration."""
+        if channel_listing not in (CHANNEL_LISTING_PLAYLIST, CHANNEL_LISTING_SEARCH):
+            raise ValueError(f"Unknown channel listing '{channel_listing}'.")
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("The h2 package is not installed; using HTTP/1.1.")
         self.base_url: str = base_url.rstrip("/")
-        self.api_key: str
-        self.client: Client = Client(api_key=api_key)
+        self.api_key: str = api_key
+        self.timeout_seconds = timeout_seconds
+        self.max_connections = max(max_connections, 1)
+        self.max_concurrent_requests = max(max_concurrent_requests, 1)
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._transport = transport
+        self._http_client: httpx.AsyncClient | None = None
+        self._http_client_loop: asyncio.AbstractEventLoop | None = None
+        self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        self._in_flight: int = 0
         self.channel_response_mapper = channel_response_mapper
         self.video_response_mapper = video_response_mapper
+        self.channel_listing = channel_listing
+        self.video_metadata_manager = video_metadata_manager
+        self.channel_metadata_manager = channel_metadata_manager
+        self._quota_lock = threading.Lock()
+        self._requests: dict[str, int] = {}
+
+    async def fetch_channel(self, identifier: str) -> ChannelResponse:
+        """Fetch a channel payload, reading through the channel metadata store.
+
+        A handle or username that resolved recently is looked up by its
+        channel id, and a fresh stored snippet skips channels.list entirely.
+        """
+        lookup_identifier: str = identifier
+        if self.channel_metadata_manager is not None:
+            channel_id: str | None = await asyncio.to_thread(
+                self.channel_metadata_manager.resolve,
+                identifier,
+            )
+            if channel_id is not None:
+                stored: ChannelResponse | None = await asyncio.to_thread(
+                    self.channel_metadata_manager.get,
+                    channel_id,
+                )
+                if stored is not None:
+                    return stored
+                lookup_identifier = channel_id
 
-    def fetch_channel(self, identifier: str) -> ChannelResponse:
-        """Fetch a channel payload from the YouTube API."""
         channel_params: dict[str, str] = {}
-        if identifier.startswith("@"):
-            channel_params["for_handle"] = identifier
-        elif identifier.startswith("UC") and len(identifier) == 24:
-            channel_params["channel_id"] = identifier
+        if lookup_identifier.startswith("@"):
+            channel_params["forHandle"] = lookup_identifier
+        elif lookup_identifier.startswith("UC") and len(lookup_identifier) == 24:
+            channel_params["id"] = lookup_identifier
         else:
-            channel_params["for_username"] = identifier
+            channel_params["forUsername"] = lookup_identifier
 
-        response: ChannelListResponse = self.client.channels.list(
-            parts="snippet",
-            return_json=False,
-            **channel_params,
+        payload: dict[str, Any] = await self._request(
+            "channels.list",
+            {"part": "snippet", **channel_params},
         )
+        response: ChannelListResponse = ChannelListResponse.from_dict(payload)
 
-        return self.channel_response_mapper.create_from_channel_list_response(
+        channel: ChannelResponse = self.channel_response_mapper.create_from_channel_list_response(
             response,
             identifier,
         )
+        if self.channel_metadata_manager is not None:
+            await asyncio.to_thread(self.channel_metadata_manager.put, identifier, channel)
+        return channel
 
-    def fetch_video(self, video_id: str) -> VideoResponse:
-        """Fetch a video payload from the YouTube API."""
-
-        response: VideoListResponse = self.client.videos.list(
-            parts="snippet,contentDetails",
-            video_id=video_id,
-            return_json=False,
+    async def fetch_video(self, video_id: str) -> VideoResponse:
+        """Fetch a video payload, reading through the metadata store."""
+        if self.video_metadata_manager is not None:
+            stored: dict[str, VideoResponse] = await asyncio.to_thread(
+                self.video_metadata_manager.get_many,
+                [video_id],
+            )
+            if video_id in stored:
+                return stored[video_id]
+        payload: dict[str, Any] = await self._request(
+            "videos.list",
+            {"part": "snippet,contentDetails", "id": video_id},
         )
-        return self.video_response_mapper.create_from_video_list_response(
+        response: VideoListResponse = VideoListResponse.from_dict(payload)
+        video: VideoResponse = self.video_response_mapper.create_from_video_list_response(
             response,
             video_id,
         )
+        if self.video_metadata_manager is not None:
+            await asyncio.to_thread(self.video_metadata_manager.put_many, [video])
+        return video
 
-    def fetch_channel_videos_page(
+    async def fetch_videos(
+        self,
+        video_ids: list[str],
+        structural_only: bool = False,
+    ) -> dict[str, VideoResponse]:
+        """Fetch video payloads for many ids, keyed by video id.
+
+        Stored videos are served from the metadata store; the rest are looked
+        up 50 per videos.list request, with the batches sent concurrently.
+        With structural_only, stored videos with an outdated title are still
+        served, since callers only use the duration and channel. Ids that do
+        not resolve are left out.
+        """
+        videos: dict[str, VideoResponse] = {}
+        if self.video_metadata_manager is not None:
+            videos = await asyncio.to_thread(
+                self.video_metadata_manager.get_many,
+                video_ids,
+                structural_only,
+            )
+        unique_ids: list[str] = [
+            video_id for video_id in dict.fromkeys(video_ids) if video_id not in videos
+        ]
+        payloads: list[dict[str, Any]] = await asyncio.gather(
+            *(
+                self._request(
+                    "videos.list",
+                    {
+                        "part": "snippet,contentDetails",
+                        "id": ",".join(unique_ids[start : start + VIDEOS_BATCH_SIZE]),
+                        "maxResults": VIDEOS_BATCH_SIZE,
+                    },
+                )
+                for start in range(0, len(unique_ids), VIDEOS_BATCH_SIZE)
+            )
+        )
+        fetched: list[VideoResponse] = []
+        for payload in payloads:
+            fetched.extend(
+                self.video_response_mapper.create_list_from_video_list_response(
+                    VideoListResponse.from_dict(payload)
+                )
+            )
+        if self.video_metadata_manager is not None:
+            await asyncio.to_thread(self.video_metadata_manager.put_many, fetched)
+        for video in fetched:
+            videos[video.get_video_id()] = video
+        return videos
+
+    async def fetch_channel_videos_page(
         self,
         channel_id: str,
         max_results: int = 20,
         page_token: str | None = None,
+        published_after: datetime | None = None,
+        published_before: datetime | None = None,
+    ) -> ChannelVideosPageResponse:
+        """Fetch a page of channel videos for feed generation, newest first.
+
+        By default the channel's uploads playlist is read, which costs one
+        quota unit per page and lists every public upload. The search listing
+        costs 100 units per page and may skip or reorder videos. Only the
+        search listing can bound results by publish date; the uploads
+        playlist ignores published_after and published_before, so callers
+        must still filter its items.
+        """
+        if self.channel_listing == CHANNEL_LISTING_SEARCH:
+            return await self._fetch_search_page(
+                channel_id,
+                max_results,
+                page_token,
+                published_after,
+                published_before,
+            )
+        return await self._fetch_uploads_page(channel_id, max_results, page_token)
+
+    def get_quota_units_used(self) -> int:
+        """Return the quota units used by this process so far."""
+        with self._quota_lock:
+            return sum(
+                count * QUOTA_COSTS.get(endpoint, 1) for endpoint, count in self._requests.items()
+            )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return request counts and quota units used per endpoint."""
+        with self._quota_lock:
+            requests: dict[str, int] = dict(self._requests)
+        quota_units: dict[str, int] = {
+            endpoint: count * QUOTA_COSTS.get(endpoint, 1)
+            for endpoint, count in requests.items()
+        }
+        return {
+            "channel_listing": self.channel_listing,
+            "http2": self.http2,
+            "in_flight": self._in_flight,
+            "requests": requests,
+            "quota_units": quota_units,
+            "total_quota_units": sum(quota_units.values()),
+        }
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def _fetch_uploads_page(
+        self,
+        channel_id: str,
+        max_results: int,
+        page_token: str | None,
     ) -> ChannelVideosPageResponse:
-        """Fetch a page of channel videos for feed generation."""
-        response: Any = self.client.search.list(
-            part="snippet",
-            channel_id=channel_id,
-            order="date",
-            type="video",
-            max_results=max_results,
-            page_token=page_token,
-            return_json=False,
+        """Fetch a page of the channel's uploads playlist."""
+        if not channel_id.startswith("UC"):
+            raise ValueError(f"Cannot derive an uploads playlist for channel '{channel_id}'.")
+        payload: dict[str, Any] = await self._request(
+            "playlistItems.list",
+            {
+                "part": "snippet,contentDetails",
+                "playlistId": f"UU{channel_id[2:]}",
+                "maxResults": max_results,
+                "pageToken": page_token,
+            },
         )
+        response: PlaylistItemListResponse = PlaylistItemListResponse.from_dict(payload)
+        items: list[Any] = response.items or []
+        videos: list[ChannelVideoResponse] = []
+        for item in items:
+            snippet = item.snippet
+            content_details = item.contentDetails
+            video_id_value: str = (content_details.videoId if content_details else "") or ""
+            # Private and deleted uploads have no video publish date.
+            video_published_at: Any = (
+                content_details.videoPublishedAt if content_details else None
+            )
+            if not video_id_value or not video_published_at:
+                continue
+            videos.append(
+                ChannelVideoResponse(
+                    video_id=video_id_value,
+                    title=snippet.title or "",
+                    description=snippet.description or "",
+                    url=f"https://www.youtube.com/watch?v={video_id_value}",
+                    published_at=self._normalize_published_at(video_published_at),
+                )
+            )
+        next_page_token: str | None = getattr(response, "nextPageToken", None)
+        return ChannelVideosPageResponse(items=videos, next_page_token=next_page_token)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    async def _fetch_search_page(
+        self,
+        channel_id: str,
+        max_results: int,
+        page_token: str | None,
+        published_after: datetime | None = None,
+        published_before: datetime | None = None,
+    ) -> ChannelVideosPageResponse:
+        """Fetch a page of channel videos through search.list."""
+        payload: dict[str, Any] = await self._request(
+            "search.list",
+            {
+                "part": "snippet",
+                "channelId": channel_id,
+                "order": "date",
+                "type": "video",
+                "maxResults": max_results,
+                "pageToken": page_token,
+                "publishedAfter": self._format_rfc3339(published_after),
+                "publishedBefore": self._format_rfc3339(published_before),
+            },
+        )
+        response: SearchListResponse = SearchListResponse.from_dict(payload)
         items: list[Any] = response.items
         videos: list[ChannelVideoResponse] = []
         for item in items:
@@ -105,6 +356,80 @@ class YtApiClient:
         next_page_token: str | None = getattr(response, "nextPageToken", None)
         return ChannelVideosPageResponse(items=videos, next_page_token=next_page_token)
 
+    async def _request(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Send a GET request to a Data API endpoint and return its JSON body.
+
+        Raises ValueError when the request fails or the API returns an error.
+        """
+        http_client: httpx.AsyncClient = self._get_http_client()
+        query: dict[str, Any] = {key: value for key, value in params.items() if value is not None}
+        query["key"] = self.api_key
+        self._record_request(endpoint)
+        async with self._request_slots:
+            self._in_flight += 1
+            try:
+                response: httpx.Response = await http_client.get(
+                    f"/youtube/v3/{endpoint.split('.', 1)[0]}",
+                    params=query,
+                )
+                response.raise_for_status()
+            except httpx.HTTPStatusError as exc:
+                raise ValueError(
+                    f"YouTube Data API {endpoint} failed with status "
+                    f"{exc.response.status_code}."
+                ) from exc
+            except httpx.HTTPError as exc:
+                raise ValueError(f"YouTube Data API {endpoint} request failed.") from exc
+            finally:
+                self._in_flight -= 1
+        try:
+            payload: Any = response.json()
+        except ValueError as exc:
+            raise ValueError(f"YouTube Data API {endpoint} returned an invalid body.") from exc
+        if not isinstance(payload, dict):
+            raise ValueError(f"YouTube Data API {endpoint} returned an invalid body.")
+        return payload
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client of the running event loop."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_client_loop is not loop:
+            if self._http_client is not None and self._http_client_loop is not None:
+                self._close_replaced_client(self._http_client, self._http_client_loop)
+            self._http_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                timeout=httpx.Timeout(self.timeout_seconds),
+                transport=self._transport,
+            )
+            self._http_client_loop = loop
+            self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        return self._http_client
+
+    def _close_replaced_client(
+        self,
+        http_client: httpx.AsyncClient,
+        client_loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """Close the pooled client of another event loop on that loop.
+
+        Its connections belong to that loop, so they can only be closed there
+        while it still runs; the sockets of a closed loop are left to it.
+        """
+        if client_loop.is_closed() or not client_loop.is_running():
+            logger.debug("Dropping the HTTP client of a stopped event loop.")
+            return
+        asyncio.run_coroutine_threadsafe(http_client.aclose(), client_loop)
+
+    def _record_request(self, endpoint: str) -> None:
+        """Count a request against the daily quota."""
+        with self._quota_lock:
+            self._requests[endpoint] = self._requests.get(endpoint, 0) + 1
+
     def _normalize_published_at(self, published_at: Any) -> datetime:
         """Normalize published timestamps into timezone-aware datetimes."""
         if isinstance(published_at, datetime):
@@ -121,3 +446,11 @@ class YtApiClient:
                 return parsed_value.replace(tzinfo=timezone.utc)
             return parsed_value
         return datetime.now(timezone.utc)
+
+    def _format_rfc3339(self, value: datetime | None) -> str | None:
+        """Format a date filter as the RFC 3339 UTC timestamp the API expects."""
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -1,30 +1,56 @@
 """Module for ytpodcast.client.yt_dl_client."""
 
 import json
+import shutil
 import subprocess
-import tempfile
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from ytpodcast.manager.audio_integrity_manager import AudioIntegrityManager
+from ytpodcast.manager.cache_manager import CacheManager
+from ytpodcast.manager.segmented_transcode_manager import SegmentedTranscodeManager
+from ytpodcast.model.client.ytdl.audio_download_response import AudioDownloadResponse
 from ytpodcast.model.client.ytdl.audio_format_response import AudioFormatResponse
+from ytpodcast.model.service.audio_output_policy import AudioOutputCodec
+from ytpodcast.model.service.audio_output_policy import AudioOutputMode
+from ytpodcast.model.service.audio_output_policy import AudioOutputPolicy
 
 
-# pylint: disable=too-few-public-methods
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+# pylint: disable=too-few-public-methods,too-many-instance-attributes
 class YtDlClient:
     """Client wrapper around yt-dlp."""
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(
         self,
         default_format: str,
         download_dir: str,
         ytdl_executable_path: str,
         ffmpeg_executable_path: str,
+        output_policy: AudioOutputPolicy | None = None,
+        cache_manager: CacheManager | None = None,
+        info_cache_ttl_seconds: int = 0,
+        segmented_transcode_manager: SegmentedTranscodeManager | None = None,
+        audio_integrity_manager: AudioIntegrityManager | None = None,
     ) -> None:
         """Store default audio format settings."""
         self.default_format = default_format
         self.download_dir = download_dir
         self.ytdl_executable_path = ytdl_executable_path
         self.ffmpeg_executable_path = ffmpeg_executable_path
+        self.output_policy = output_policy or AudioOutputPolicy()
+        self.cache_manager = cache_manager
+        self.info_cache_ttl_seconds = info_cache_ttl_seconds
+        self.segmented_transcode_manager = segmented_transcode_manager
+        self.audio_integrity_manager = audio_integrity_manager
+        self._stats_lock = threading.Lock()
+        self._info_cache_hits: int = 0
+        self._info_cache_misses: int = 0
 
     def fetch_audio_format(self, video_id: str) -> AudioFormatResponse:
         """Return a default audio format payload."""
@@ -37,64 +63,303 @@ class YtDlClient:
         )
 
     def fetch_audio_formats(self, video_id: str) -> list[AudioFormatResponse]:
-        """Return available audio formats for a video."""
+        """Return available audio formats for a video.
+
+        Results are cached per video so repeated calls skip spawning yt-dlp
+        and parsing its full info document.
+        """
+        cached_formats: list[AudioFormatResponse] | None = self._get_cached_audio_formats(
+            video_id
+        )
+        if cached_formats is not None:
+            return cached_formats
         info: dict[str, Any] = self._extract_info(video_id)
+        audio_formats: list[AudioFormatResponse] = self._create_audio_formats(info)
+        self._set_cached_audio_formats(video_id, audio_formats)
+        return audio_formats
+
+    def get_cached_audio_formats(self, video_id: str) -> list[AudioFormatResponse] | None:
+        """Return the audio formats of a video from the info cache without running yt-dlp."""
+        return self._get_cached_audio_formats(video_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return info cache hit and miss counters."""
+        with self._stats_lock:
+            lookups: int = self._info_cache_hits + self._info_cache_misses
+            return {
+                "info_cache_hits": self._info_cache_hits,
+                "info_cache_misses": self._info_cache_misses,
+                "info_cache_hit_rate": self._info_cache_hits / lookups if lookups else 0.0,
+            }
+
+    def _create_audio_formats(self, info: dict[str, Any]) -> list[AudioFormatResponse]:
+        """Map the formats of a yt-dlp info document into audio formats."""
         formats: list[dict[str, Any]] = info.get("formats", [])
         audio_formats: list[AudioFormatResponse] = []
         for format_payload in formats:
-            format_id: str | None = format_payload.get("format_id")
-            if not format_id:
-                continue
-            resolution: str | None = format_payload.get("resolution")
-            is_audio_only: bool = resolution == "audio only"
-            extension: str = format_payload.get("ext") or "mp3"
-            audio_bitrate_kbps: int | None = None
-            language: str | None = format_payload.get("language")
-            note: str | None = format_payload.get("format_note")
-            audio_formats.append(
-                AudioFormatResponse(
-                    format_id=str(format_id),
-                    extension=extension,
-                    audio_bitrate_kbps=audio_bitrate_kbps,
-                    is_audio_only=is_audio_only,
-                    language=language,
-                    note=note,
-                )
-            )
+            audio_format: AudioFormatResponse | None = self._create_audio_format(format_payload)
+            if audio_format is not None:
+                audio_formats.append(audio_format)
         return audio_formats
 
-    def download_audio(self, video_id: str, format_id: str) -> Path:
+    def _create_audio_format(self, format_payload: dict[str, Any]) -> AudioFormatResponse | None:
+        """Map a single yt-dlp format payload into an audio format."""
+        format_id: str | None = format_payload.get("format_id")
+        if not format_id:
+            return None
+        resolution: str | None = format_payload.get("resolution")
+        audio_bitrate: Any = format_payload.get("abr")
+        file_size: Any = format_payload.get("filesize") or format_payload.get("filesize_approx")
+        return AudioFormatResponse(
+            format_id=str(format_id),
+            extension=format_payload.get("ext") or "mp3",
+            audio_bitrate_kbps=int(audio_bitrate) if audio_bitrate else None,
+            is_audio_only=resolution == "audio only",
+            language=format_payload.get("language"),
+            note=format_payload.get("format_note"),
+            file_size_bytes=int(file_size) if file_size else None,
+        )
+
+    def get_output_path(
+        self,
+        video_id: str,
+        output_policy: AudioOutputPolicy | None = None,
+    ) -> Path:
+        """Return the final audio path for a video."""
+        return self._build_output_path(video_id, output_policy or self.output_policy)
+
+    def find_downloaded_audio(
+        self,
+        video_id: str,
+        output_policy: AudioOutputPolicy | None = None,
+    ) -> Path | None:
+        """Return the downloaded audio path if it exists and passes its integrity check.
+
+        Files that fail the check are deleted so they get downloaded again.
+        """
+        output_path: Path = self.get_output_path(video_id, output_policy)
+        if not output_path.exists():
+            return None
+        if self.audio_integrity_manager is not None and not (
+            self.audio_integrity_manager.verify(output_path)
+        ):
+            output_path.unlink(missing_ok=True)
+            self.audio_integrity_manager.remove(output_path)
+            return None
+        return output_path
+
+    def discard_staging(
+        self,
+        video_id: str,
+        output_policy: AudioOutputPolicy | None = None,
+        keep_source: bool = False,
+    ) -> None:
+        """Delete leftovers of an interrupted download.
+
+        With keep_source, the partially downloaded source is kept so that
+        yt-dlp can continue it on the next attempt.
+        """
+        output_path: Path = self.get_output_path(video_id, output_policy)
+        self._build_staging_path(output_path).unlink(missing_ok=True)
+        output_path.with_name(f"{output_path.name}.part").unlink(missing_ok=True)
+        if not keep_source:
+            shutil.rmtree(self._build_source_dir(output_path), ignore_errors=True)
+
+    def download_audio(
+        self,
+        video_id: str,
+        format_id: str,
+        output_policy: AudioOutputPolicy | None = None,
+    ) -> Path:
         """Download a single audio format for a video."""
-        download_dir_path: Path = Path(self.download_dir)
-        download_dir_path.mkdir(parents=True, exist_ok=True)
-        output_path: Path = download_dir_path / f"{video_id}.mp3"
-        if output_path.exists():
-            return output_path
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_dir_path: Path = Path(temp_dir)
-            temp_output_path: Path = temp_dir_path / f"{video_id}.%(ext)s"
-            command: list[str] = [
-                self.ytdl_executable_path,
-                "--no-playlist",
-                "--quiet",
-                "--no-warnings",
-                "-f",
-                format_id,
-                "-o",
-                str(temp_output_path),
-                self._build_video_url(video_id),
-            ]
-            self._run_command(command)
+        download: AudioDownloadResponse = self.download_best_audio(
+            video_id,
+            format_id,
+            output_policy,
+        )
+        return Path(download.get_path())
+
+    def download_best_audio(
+        self,
+        video_id: str,
+        format_selector: str,
+        output_policy: AudioOutputPolicy | None = None,
+    ) -> AudioDownloadResponse:
+        """Resolve a format selector and download it in a single yt-dlp run.
+
+        yt-dlp picks the format itself and reports the one it downloaded, so
+        no separate metadata extraction is needed before the download.
+        """
+        policy: AudioOutputPolicy = output_policy or self.output_policy
+        existing_path: Path | None = self.find_downloaded_audio(video_id, policy)
+        if existing_path is not None:
+            return AudioDownloadResponse(path=str(existing_path))
+        output_path: Path = self._build_output_path(video_id, policy)
+        staging_path: Path = self._build_staging_path(output_path)
+        source_dir: Path = self._build_source_dir(output_path)
+        source_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            info: dict[str, Any] = self._download_source(
+                video_id,
+                format_selector,
+                source_dir / f"{video_id}.%(ext)s",
+            )
             downloaded_files: list[Path] = [
-                path for path in temp_dir_path.iterdir() if path.is_file()
+                path
+                for path in source_dir.iterdir()
+                if path.is_file() and path.suffix not in (".part", ".ytdl")
             ]
             if not downloaded_files:
                 raise ValueError("Download completed but no output file was found.")
-            source_path: Path = downloaded_files[0]
-            self._convert_to_mp3(source_path, output_path)
-        if not output_path.exists():
-            raise ValueError("MP3 conversion completed but no output file was found.")
-        return output_path
+            source_path: Path = max(downloaded_files, key=lambda path: path.stat().st_mtime)
+            self._convert_audio(
+                source_path,
+                staging_path,
+                policy,
+                duration_seconds=info.get("duration"),
+                sample_rate=info.get("asr"),
+            )
+            if not staging_path.exists():
+                raise ValueError("Audio conversion completed but no output file was found.")
+            if self.audio_integrity_manager is not None:
+                self.audio_integrity_manager.record(staging_path, output_path)
+            staging_path.replace(output_path)
+        finally:
+            staging_path.unlink(missing_ok=True)
+            shutil.rmtree(source_dir, ignore_errors=True)
+        return AudioDownloadResponse(
+            path=str(output_path),
+            audio_format=self._create_audio_format(info),
+        )
+
+    def stream_audio(
+        self,
+        video_id: str,
+        format_id: str,
+        source_extension: str,
+        output_policy: AudioOutputPolicy | None = None,
+    ) -> Iterator[bytes]:
+        """Yield encoded audio bytes while yt-dlp downloads and ffmpeg encodes.
+
+        yt-dlp writes the selected format to stdout, which is piped straight
+        into ffmpeg's stdin. Closing the iterator early stops both processes.
+        """
+        policy: AudioOutputPolicy = output_policy or self.output_policy
+        download_command: list[str] = [
+            self.ytdl_executable_path,
+            "--no-playlist",
+            "--quiet",
+            "--no-warnings",
+            "-f",
+            format_id,
+            "-o",
+            "-",
+            self._build_video_url(video_id),
+        ]
+        convert_command: list[str] = [
+            self.ffmpeg_executable_path,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-i",
+            "pipe:0",
+            "-vn",
+            *self._build_codec_arguments(policy, source_extension),
+            *self._build_stream_muxer_arguments(policy),
+            "pipe:1",
+        ]
+        # pylint: disable=consider-using-with
+        download_process: subprocess.Popen[bytes] = subprocess.Popen(
+            download_command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        convert_process: subprocess.Popen[bytes] = subprocess.Popen(
+            convert_command,
+            stdin=download_process.stdout,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        # pylint: enable=consider-using-with
+        if download_process.stdout is not None:
+            download_process.stdout.close()
+        completed: bool = False
+        try:
+            assert convert_process.stdout is not None
+            while True:
+                chunk: bytes = convert_process.stdout.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+            download_code: int = download_process.wait()
+            convert_code: int = convert_process.wait()
+            if download_code != 0:
+                raise ValueError(f"yt-dlp exited with status {download_code}.")
+            if convert_code != 0:
+                raise ValueError(f"ffmpeg exited with status {convert_code}.")
+            completed = True
+        finally:
+            if not completed:
+                download_process.kill()
+                convert_process.kill()
+            download_process.wait()
+            convert_process.wait()
+            if convert_process.stdout is not None:
+                convert_process.stdout.close()
+
+    def _get_cached_audio_formats(self, video_id: str) -> list[AudioFormatResponse] | None:
+        """Return cached audio formats for a video, if present and fresh."""
+        if self.cache_manager is None or self.info_cache_ttl_seconds <= 0:
+            return None
+        cache_key: str = self.cache_manager.create_cache_key("ytdl_formats", video_id)
+        cached_value: str | None = self.cache_manager.get(cache_key)
+        with self._stats_lock:
+            if cached_value is None:
+                self._info_cache_misses += 1
+            else:
+                self._info_cache_hits += 1
+        if cached_value is None:
+            return None
+        payload: list[dict[str, Any]] = json.loads(cached_value)
+        return [AudioFormatResponse.model_validate(item) for item in payload]
+
+    def _set_cached_audio_formats(
+        self,
+        video_id: str,
+        audio_formats: list[AudioFormatResponse],
+    ) -> None:
+        """Store the audio formats of a video in the info cache."""
+        if self.cache_manager is None or self.info_cache_ttl_seconds <= 0:
+            return
+        cache_key: str = self.cache_manager.create_cache_key("ytdl_formats", video_id)
+        value: str = json.dumps([item.model_dump(mode="json") for item in audio_formats])
+        self.cache_manager.set(cache_key, value, ttl_seconds=self.info_cache_ttl_seconds)
+
+    def _download_source(
+        self,
+        video_id: str,
+        format_selector: str,
+        output_template: Path,
+    ) -> dict[str, Any]:
+        """Download the selected format and return the info of the chosen format."""
+        command: list[str] = [
+            self.ytdl_executable_path,
+            "--no-playlist",
+            "--quiet",
+            "--no-warnings",
+            "--dump-json",
+            "--no-simulate",
+            "-f",
+            format_selector,
+            "-o",
+            str(output_template),
+            self._build_video_url(video_id),
+        ]
+        output: str = self._run_command(command)
+        lines: list[str] = [line for line in output.splitlines() if line.strip()]
+        if not lines:
+            return {}
+        return json.loads(lines[-1])
 
     def _extract_info(self, video_id: str) -> dict[str, Any]:
         """Extract metadata from a video without downloading."""
@@ -108,6 +373,20 @@ class YtDlClient:
         output: str = self._run_command(command)
         return json.loads(output)
 
+    def _build_output_path(self, video_id: str, output_policy: AudioOutputPolicy) -> Path:
+        """Build the final audio path for a video and output variant."""
+        variant_name: str = output_policy.get_variant_name()
+        extension: str = output_policy.get_extension()
+        return Path(self.download_dir) / f"{video_id}.{variant_name}.{extension}"
+
+    def _build_staging_path(self, output_path: Path) -> Path:
+        """Build the path a file is written to before it is published."""
+        return output_path.parent / ".staging" / output_path.name
+
+    def _build_source_dir(self, output_path: Path) -> Path:
+        """Build the directory yt-dlp downloads the source of an output into."""
+        return output_path.parent / ".staging" / f"{output_path.name}.d"
+
     def _build_video_url(self, video_id: str) -> str:
         """Build a YouTube watch URL for a video."""
         return f"https://www.youtube.com/watch?v={video_id}"
@@ -122,13 +401,72 @@ class YtDlClient:
         )
         return result.stdout
 
-    def _convert_to_mp3(self, source_path: Path, output_path: Path) -> None:
-        """Convert a downloaded audio file to MP3."""
+    def _convert_audio(
+        self,
+        source_path: Path,
+        output_path: Path,
+        output_policy: AudioOutputPolicy,
+        duration_seconds: float | None = None,
+        sample_rate: int | None = None,
+    ) -> None:
+        """Turn a downloaded source into the served file per the output policy.
+
+        Long sources that need re-encoding are encoded as parallel segments
+        when a segmented transcoder is configured.
+        """
+        source_extension: str = source_path.suffix.lstrip(".")
+        if (
+            output_policy.get_mode() == AudioOutputMode.PASSTHROUGH
+            and source_extension.lower() == output_policy.get_extension()
+        ):
+            shutil.move(str(source_path), str(output_path))
+            return
+        codec_arguments: list[str] = self._build_codec_arguments(output_policy, source_extension)
+        if (
+            self.segmented_transcode_manager is not None
+            and "copy" not in codec_arguments
+            and self.segmented_transcode_manager.supports(output_policy, duration_seconds)
+        ):
+            assert duration_seconds is not None
+            self.segmented_transcode_manager.transcode(
+                source_path,
+                output_path,
+                output_policy,
+                codec_arguments,
+                duration_seconds,
+                sample_rate,
+            )
+            return
         command: list[str] = [
             self.ffmpeg_executable_path,
             "-y",
             "-i",
             str(source_path),
+            "-vn",
+            *codec_arguments,
             str(output_path),
         ]
         self._run_command(command)
+
+    def _build_codec_arguments(
+        self,
+        output_policy: AudioOutputPolicy,
+        source_extension: str,
+    ) -> list[str]:
+        """Return ffmpeg audio codec arguments, copying the stream when possible."""
+        if output_policy.get_mode() != AudioOutputMode.TRANSCODE and (
+            output_policy.is_source_compatible(source_extension)
+        ):
+            return ["-c:a", "copy"]
+        arguments: list[str] = ["-c:a", output_policy.get_encoder()]
+        bitrate_kbps: int | None = output_policy.get_bitrate_kbps()
+        if bitrate_kbps:
+            arguments.extend(["-b:a", f"{bitrate_kbps}k"])
+        return arguments
+
+    def _build_stream_muxer_arguments(self, output_policy: AudioOutputPolicy) -> list[str]:
+        """Return ffmpeg muxer arguments for writing to a non-seekable pipe."""
+        arguments: list[str] = ["-f", output_policy.get_stream_muxer()]
+        if output_policy.get_codec() == AudioOutputCodec.AAC:
+            arguments.extend(["-movflags", "frag_keyframe+empty_moov"])
+        return arguments
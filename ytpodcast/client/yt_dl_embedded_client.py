@@ -0,0 +1,134 @@
+"""Module for ytpodcast.client.yt_dl_embedded_client."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from yt_dlp import YoutubeDL
+from yt_dlp.utils import YoutubeDLError
+
+from ytpodcast.client.yt_dl_client import YtDlClient
+from ytpodcast.manager.audio_integrity_manager import AudioIntegrityManager
+from ytpodcast.manager.cache_manager import CacheManager
+from ytpodcast.manager.segmented_transcode_manager import SegmentedTranscodeManager
+from ytpodcast.model.service.audio_output_policy import AudioOutputPolicy
+
+
+class YtDlEmbeddedClient(YtDlClient):
+    """yt-dlp client that runs extraction and downloads in-process.
+
+    Calls run on a bounded thread pool. Each pool thread keeps its own warm
+    YoutubeDL instance, so extractor setup is paid once per thread instead of
+    once per call. Streaming still pipes a yt-dlp subprocess into ffmpeg,
+    because it needs the media bytes on a pipe.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        default_format: str,
+        download_dir: str,
+        ytdl_executable_path: str,
+        ffmpeg_executable_path: str,
+        output_policy: AudioOutputPolicy | None = None,
+        cache_manager: CacheManager | None = None,
+        info_cache_ttl_seconds: int = 0,
+        segmented_transcode_manager: SegmentedTranscodeManager | None = None,
+        audio_integrity_manager: AudioIntegrityManager | None = None,
+        worker_count: int = 2,
+    ) -> None:
+        """Store client settings and create the extraction pool."""
+        super().__init__(
+            default_format,
+            download_dir,
+            ytdl_executable_path,
+            ffmpeg_executable_path,
+            output_policy=output_policy,
+            cache_manager=cache_manager,
+            info_cache_ttl_seconds=info_cache_ttl_seconds,
+            segmented_transcode_manager=segmented_transcode_manager,
+            audio_integrity_manager=audio_integrity_manager,
+        )
+        self.worker_count = max(worker_count, 1)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.worker_count,
+            thread_name_prefix="ytdl-embedded",
+        )
+        self._local = threading.local()
+
+    def _extract_info(self, video_id: str) -> dict[str, Any]:
+        """Extract metadata from a video without downloading."""
+        return self._executor.submit(self._extract_info_in_worker, video_id).result()
+
+    def _download_source(
+        self,
+        video_id: str,
+        format_selector: str,
+        output_template: Path,
+    ) -> dict[str, Any]:
+        """Download the selected format and return the info of the chosen format."""
+        return self._executor.submit(
+            self._download_source_in_worker,
+            video_id,
+            format_selector,
+            output_template,
+        ).result()
+
+    def _extract_info_in_worker(self, video_id: str) -> dict[str, Any]:
+        """Run extraction on the calling pool thread."""
+        youtube_dl: YoutubeDL = self._get_youtube_dl()
+        try:
+            info: Any = youtube_dl.extract_info(self._build_video_url(video_id), download=False)
+        except YoutubeDLError as exc:
+            raise ValueError(f"yt-dlp extraction failed for '{video_id}'.") from exc
+        return youtube_dl.sanitize_info(info)
+
+    def _download_source_in_worker(
+        self,
+        video_id: str,
+        format_selector: str,
+        output_template: Path,
+    ) -> dict[str, Any]:
+        """Run a download on the calling pool thread.
+
+        The warm instance is shared by later calls on this thread, so the
+        download settings are restored once the download ends.
+        """
+        youtube_dl: YoutubeDL = self._get_youtube_dl()
+        original_format: Any = youtube_dl.params.get("format")
+        original_format_selector: Any = youtube_dl.format_selector
+        original_template: Any = youtube_dl.params["outtmpl"].get("default")
+        youtube_dl.params["format"] = format_selector
+        youtube_dl.format_selector = youtube_dl.build_format_selector(format_selector)
+        youtube_dl.params["outtmpl"]["default"] = str(output_template)
+        try:
+            info: Any = youtube_dl.extract_info(self._build_video_url(video_id), download=True)
+        except YoutubeDLError as exc:
+            raise ValueError(f"yt-dlp download failed for '{video_id}'.") from exc
+        finally:
+            if original_format is None:
+                youtube_dl.params.pop("format", None)
+            else:
+                youtube_dl.params["format"] = original_format
+            youtube_dl.format_selector = original_format_selector
+            if original_template is None:
+                youtube_dl.params["outtmpl"].pop("default", None)
+            else:
+                youtube_dl.params["outtmpl"]["default"] = original_template
+        return youtube_dl.sanitize_info(info)
+
+    def _get_youtube_dl(self) -> YoutubeDL:
+        """Return the warm YoutubeDL instance owned by the current thread."""
+        youtube_dl: YoutubeDL | None = getattr(self._local, "youtube_dl", None)
+        if youtube_dl is None:
+            youtube_dl = YoutubeDL(
+                {
+                    "quiet": True,
+                    "no_warnings": True,
+                    "noplaylist": True,
+                    "noprogress": True,
+                }
+            )
+            self._local.youtube_dl = youtube_dl
+        return youtube_dl
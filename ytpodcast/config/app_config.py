@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 
 
+# pylint: disable=too-many-instance-attributes
 @dataclass(frozen=True)
 class AppConfig:
     """Application configuration values."""
@@ -15,3 +16,6 @@ class AppConfig:
     yt_api_base_url: str
     yt_api_key: str | None
     ytdl_default_format: str
+    download_wait_seconds: float = 25.0
+    download_retry_after_seconds: int = 10
+    download_streaming: bool = False
@@ -1,6 +1,7 @@
 """Module for ytpodcast.container.default_container."""
 
 import os
+from functools import partial
 from typing import Any, TypeVar
 
 from dotenv import load_dotenv
@@ -8,19 +9,40 @@ from injector import Injector
 
 from ytpodcast.client.yt_api_client import YtApiClient
 from ytpodcast.client.yt_dl_client import YtDlClient
+from ytpodcast.client.yt_dl_embedded_client import YtDlEmbeddedClient
 from ytpodcast.config.app_config import AppConfig
 from ytpodcast.controller.channel_controller import ChannelController
 from ytpodcast.controller.video_controller import VideoController
 from ytpodcast.controller.feed_controller import FeedController
+from ytpodcast.controller.stats_controller import StatsController
 from ytpodcast.mapper.controller.get_channel_response_mapper import GetChannelResponseMapper
 from ytpodcast.mapper.controller.get_video_response_mapper import GetVideoResponseMapper
 from ytpodcast.mapper.controller.rss_feed_response_mapper import RssFeedResponseMapper
 from ytpodcast.mapper.controller.file_response_mapper import FileResponseMapper
+from ytpodcast.mapper.controller.get_download_job_response_mapper import (
+    GetDownloadJobResponseMapper,
+)
 from ytpodcast.mapper.client.ytapi.channel_response_mapper import ChannelResponseMapper
 from ytpodcast.mapper.client.ytapi.video_response_mapper import VideoResponseMapper
+from ytpodcast.manager.audio_integrity_manager import AudioIntegrityManager
+from ytpodcast.manager.audio_store_manager import AudioStoreManager
+from ytpodcast.manager.audio_stream_manager import AudioStreamManager
 from ytpodcast.manager.cache_manager import CacheManager
+from ytpodcast.manager.channel_index_manager import ChannelIndexManager
+from ytpodcast.manager.channel_metadata_manager import ChannelMetadataManager
+from ytpodcast.manager.download_job_manager import DownloadJobManager
+from ytpodcast.manager.download_journal_manager import DownloadJournalManager
+from ytpodcast.manager.feed_cursor_manager import FeedCursorManager
+from ytpodcast.manager.feed_refresh_manager import FeedRefreshManager
+from ytpodcast.manager.segmented_transcode_manager import SegmentedTranscodeManager
+from ytpodcast.manager.single_flight_manager import SingleFlightManager
+from ytpodcast.manager.video_metadata_manager import VideoMetadataManager
 from ytpodcast.mapper.service.channel_mapper import ChannelMapper
 from ytpodcast.mapper.service.video_mapper import VideoMapper
+from ytpodcast.model.service.audio_format_preference import AudioFormatPreference
+from ytpodcast.model.service.audio_output_policy import AudioOutputCodec
+from ytpodcast.model.service.audio_output_policy import AudioOutputMode
+from ytpodcast.model.service.audio_output_policy import AudioOutputPolicy
 from ytpodcast.mapper.service.feed_item_mapper import FeedItemMapper
 from ytpodcast.service.channel_service import ChannelService
 from ytpodcast.service.video_service import VideoService
@@ -60,6 +82,7 @@ class DefaultContainer:
         """Return a stored environment variable by key."""
         return self.__dict__[key]
 
+    # pylint: disable=too-many-statements
     def _init_environment_variables(self) -> None:
         """Load environment variables into container fields."""
         self.app_name = os.environ.get("APP_NAME", "YT Podcast API")
@@ -72,12 +95,130 @@ class DefaultContainer:
         )
         self.yt_api_base_url = os.environ.get("YT_API_BASE_URL", "https://youtube.googleapis.com")
         self.yt_api_key = os.environ.get("YT_API_KEY")
+        self.yt_api_channel_listing = os.environ.get("YT_API_CHANNEL_LISTING", "playlist").lower()
         self.ytdl_default_format = os.environ.get("YTDL_DEFAULT_FORMAT", "bestaudio")
         self.download_dir = os.environ.get("DOWNLOAD_DIR", os.path.join("var", "downloads"))
         self.cache_dir = os.environ.get("CACHE_DIR", os.path.join("var", "cache"))
+        self.cache_memory_max_entries = int(os.environ.get("CACHE_MEMORY_MAX_ENTRIES", "2048"))
+        self.cache_memory_max_mb = int(os.environ.get("CACHE_MEMORY_MAX_MB", "64"))
+        self.yt_api_timeout_seconds = float(os.environ.get("YT_API_TIMEOUT_SECONDS", "10"))
+        self.yt_api_max_connections = int(os.environ.get("YT_API_MAX_CONNECTIONS", "20"))
+        self.yt_api_max_concurrent_requests = int(
+            os.environ.get("YT_API_MAX_CONCURRENT_REQUESTS", "100")
+        )
+        self.yt_api_http2 = os.environ.get("YT_API_HTTP2", "true").lower() == "true"
+        self.video_metadata_db_path = os.environ.get(
+            "VIDEO_METADATA_DB_PATH",
+            os.path.join(self.cache_dir, "video_metadata.sqlite3"),
+        )
+        self.video_metadata_max_age_seconds = int(
+            os.environ.get("VIDEO_METADATA_MAX_AGE_SECONDS", "604800")
+        )
+        self.channel_metadata_db_path = os.environ.get(
+            "CHANNEL_METADATA_DB_PATH",
+            os.path.join(self.cache_dir, "channel_metadata.sqlite3"),
+        )
+        self.channel_identifier_max_age_seconds = int(
+            os.environ.get("CHANNEL_IDENTIFIER_MAX_AGE_SECONDS", "2592000")
+        )
+        self.channel_snippet_max_age_seconds = int(
+            os.environ.get("CHANNEL_SNIPPET_MAX_AGE_SECONDS", "86400")
+        )
+        self.channel_index_enabled = (
+            os.environ.get("CHANNEL_INDEX_ENABLED", "true").lower() == "true"
+        )
+        self.channel_index_db_path = os.environ.get(
+            "CHANNEL_INDEX_DB_PATH",
+            os.path.join(self.cache_dir, "channel_index.sqlite3"),
+        )
+        self.channel_index_sync_interval_seconds = int(
+            os.environ.get("CHANNEL_INDEX_SYNC_INTERVAL_SECONDS", "900")
+        )
+        self.feed_cursor_ttl_seconds = int(os.environ.get("FEED_CURSOR_TTL_SECONDS", "900"))
+        self.feed_cache_ttl_seconds = int(os.environ.get("FEED_CACHE_TTL_SECONDS", "10800"))
+        self.feed_max_stale_seconds = int(os.environ.get("FEED_MAX_STALE_SECONDS", "86400"))
+        self.feed_stale_if_error_seconds = int(
+            os.environ.get("FEED_STALE_IF_ERROR_SECONDS", "604800")
+        )
+        self.feed_adaptive_ttl_enabled = (
+            os.environ.get("FEED_ADAPTIVE_TTL_ENABLED", "true").lower() == "true"
+        )
+        self.feed_min_ttl_seconds = int(os.environ.get("FEED_MIN_TTL_SECONDS", "900"))
+        self.feed_max_ttl_seconds = int(os.environ.get("FEED_MAX_TTL_SECONDS", "86400"))
+        self.feed_ttl_gap_fraction = float(os.environ.get("FEED_TTL_GAP_FRACTION", "0.25"))
+        self.feed_refresh_track_seconds = int(
+            os.environ.get("FEED_REFRESH_TRACK_SECONDS", "172800")
+        )
+        self.feed_refresh_lead_seconds = int(os.environ.get("FEED_REFRESH_LEAD_SECONDS", "600"))
+        self.feed_refresh_stagger_seconds = int(
+            os.environ.get("FEED_REFRESH_STAGGER_SECONDS", "300")
+        )
+        self.feed_refresh_quota_per_hour = int(
+            os.environ.get("FEED_REFRESH_QUOTA_PER_HOUR", "1000")
+        )
+        self.feed_refresh_interval_seconds = float(
+            os.environ.get("FEED_REFRESH_INTERVAL_SECONDS", "30")
+        )
+        self.feed_refresh_max_tracked = int(os.environ.get("FEED_REFRESH_MAX_TRACKED", "1000"))
         self.ytdl_executable_path = os.environ.get("YTDL_EXECUTABLE_PATH", "yt-dlp")
+        self.ytdl_backend = os.environ.get("YTDL_BACKEND", "subprocess").lower()
+        self.ytdl_embedded_worker_count = int(os.environ.get("YTDL_EMBEDDED_WORKER_COUNT", "2"))
+        self.ytdl_info_cache_ttl_seconds = int(
+            os.environ.get("YTDL_INFO_CACHE_TTL_SECONDS", "21600")
+        )
         self.ffmpeg_executable_path = os.environ.get("FFMPEG_EXECUTABLE_PATH", "ffmpeg")
+        self.ffprobe_executable_path = os.environ.get("FFPROBE_EXECUTABLE_PATH", "ffprobe")
+        self.transcode_segment_min_duration_seconds = int(
+            os.environ.get("TRANSCODE_SEGMENT_MIN_DURATION_SECONDS", "3600")
+        )
+        transcode_segment_worker_count: str = os.environ.get(
+            "TRANSCODE_SEGMENT_WORKER_COUNT",
+            "",
+        )
+        self.transcode_segment_worker_count = (
+            int(transcode_segment_worker_count) if transcode_segment_worker_count else None
+        )
+        self.download_worker_count = int(os.environ.get("DOWNLOAD_WORKER_COUNT", "2"))
+        self.download_queue_size = int(os.environ.get("DOWNLOAD_QUEUE_SIZE", "100"))
+        self.download_job_retention_seconds = int(
+            os.environ.get("DOWNLOAD_JOB_RETENTION_SECONDS", "3600")
+        )
+        self.download_wait_seconds = float(os.environ.get("DOWNLOAD_WAIT_SECONDS", "25"))
+        self.download_retry_after_seconds = int(
+            os.environ.get("DOWNLOAD_RETRY_AFTER_SECONDS", "10")
+        )
+        self.download_streaming = os.environ.get("DOWNLOAD_STREAMING", "false").lower() == "true"
+        self.download_resume_on_startup = (
+            os.environ.get("DOWNLOAD_RESUME_ON_STARTUP", "true").lower() == "true"
+        )
+        self.audio_store_max_mb = int(os.environ.get("AUDIO_STORE_MAX_MB", "10240"))
+        self.audio_store_pin_latest = int(os.environ.get("AUDIO_STORE_PIN_LATEST", "3"))
+        self.audio_store_pin_ttl_seconds = int(
+            os.environ.get("AUDIO_STORE_PIN_TTL_SECONDS", "172800")
+        )
+        self.audio_store_sweep_interval_seconds = int(
+            os.environ.get("AUDIO_STORE_SWEEP_INTERVAL_SECONDS", "300")
+        )
+        self.audio_store_default_reservation_mb = int(
+            os.environ.get("AUDIO_STORE_DEFAULT_RESERVATION_MB", "200")
+        )
+        self.audio_output_mode = os.environ.get("AUDIO_OUTPUT_MODE", "transcode")
+        self.audio_output_codec = os.environ.get("AUDIO_OUTPUT_CODEC", "mp3")
+        audio_output_bitrate_kbps: str = os.environ.get("AUDIO_OUTPUT_BITRATE_KBPS", "")
+        self.audio_output_bitrate_kbps = (
+            int(audio_output_bitrate_kbps) if audio_output_bitrate_kbps else None
+        )
+        self.ytdl_preferred_languages = [
+            language.strip()
+            for language in os.environ.get("YTDL_PREFERRED_LANGUAGES", "it").split(",")
+            if language.strip()
+        ]
+        ytdl_max_audio_bitrate_kbps: str = os.environ.get("YTDL_MAX_AUDIO_BITRATE_KBPS", "")
+        self.ytdl_max_audio_bitrate_kbps = (
+            int(ytdl_max_audio_bitrate_kbps) if ytdl_max_audio_bitrate_kbps else None
+        )
 
+    # pylint: disable=too-many-locals,too-many-statements
     def _init_bindings(self) -> None:
         """Bind configured services, mappers, and clients."""
         app_config = AppConfig(
@@ -89,9 +230,25 @@ class DefaultContainer:
             yt_api_base_url=self.yt_api_base_url,
             yt_api_key=self.yt_api_key,
             ytdl_default_format=self.ytdl_default_format,
+            download_wait_seconds=self.download_wait_seconds,
+            download_retry_after_seconds=self.download_retry_after_seconds,
+            download_streaming=self.download_streaming,
         )
         self.injector.binder.bind(AppConfig, to=app_config)
 
+        output_policy = AudioOutputPolicy(
+            mode=AudioOutputMode(self.audio_output_mode),
+            codec=AudioOutputCodec(self.audio_output_codec),
+            bitrate_kbps=self.audio_output_bitrate_kbps,
+        )
+        self.injector.binder.bind(AudioOutputPolicy, to=output_policy)
+
+        format_preference = AudioFormatPreference(
+            preferred_languages=self.ytdl_preferred_languages,
+            max_bitrate_kbps=self.ytdl_max_audio_bitrate_kbps,
+        )
+        self.injector.binder.bind(AudioFormatPreference, to=format_preference)
+
         channel_mapper = ChannelMapper()
 
         video_mapper = VideoMapper()
@@ -104,40 +261,154 @@ class DefaultContainer:
 
         file_response_mapper = FileResponseMapper(file_helper)
 
+        download_job_response_mapper = GetDownloadJobResponseMapper()
+
         feed_item_mapper = FeedItemMapper()
 
-        rss_feed_response_mapper = RssFeedResponseMapper(app_config)
+        rss_feed_response_mapper = RssFeedResponseMapper(app_config, output_policy, file_helper)
 
-        cache_manager = CacheManager(cache_dir=self.cache_dir)
+        cache_manager = CacheManager(
+            cache_dir=self.cache_dir,
+            memory_max_entries=self.cache_memory_max_entries,
+            memory_max_bytes=self.cache_memory_max_mb * 1024 * 1024,
+        )
+        self.injector.binder.bind(CacheManager, to=cache_manager)
 
         yt_channel_response_mapper = ChannelResponseMapper()
 
         yt_video_response_mapper = VideoResponseMapper()
 
+        video_metadata_manager = VideoMetadataManager(
+            database_path=self.video_metadata_db_path,
+            max_age_seconds=self.video_metadata_max_age_seconds,
+        )
+        self.injector.binder.bind(VideoMetadataManager, to=video_metadata_manager)
+
+        channel_metadata_manager = ChannelMetadataManager(
+            database_path=self.channel_metadata_db_path,
+            identifier_max_age_seconds=self.channel_identifier_max_age_seconds,
+            snippet_max_age_seconds=self.channel_snippet_max_age_seconds,
+        )
+        self.injector.binder.bind(ChannelMetadataManager, to=channel_metadata_manager)
+
         yt_api_client = YtApiClient(
             base_url=self.yt_api_base_url,
             api_key=self.yt_api_key,
             channel_response_mapper=yt_channel_response_mapper,
             video_response_mapper=yt_video_response_mapper,
+            channel_listing=self.yt_api_channel_listing,
+            video_metadata_manager=video_metadata_manager,
+            channel_metadata_manager=channel_metadata_manager,
+            timeout_seconds=self.yt_api_timeout_seconds,
+            max_connections=self.yt_api_max_connections,
+            max_concurrent_requests=self.yt_api_max_concurrent_requests,
+            http2=self.yt_api_http2,
         )
         self.injector.binder.bind(YtApiClient, to=yt_api_client)
 
-        yt_dl_client = YtDlClient(
-            default_format=self.ytdl_default_format,
-            download_dir=self.download_dir,
-            ytdl_executable_path=self.ytdl_executable_path,
+        segmented_transcode_manager = SegmentedTranscodeManager(
             ffmpeg_executable_path=self.ffmpeg_executable_path,
+            min_duration_seconds=self.transcode_segment_min_duration_seconds,
+            worker_count=self.transcode_segment_worker_count,
+        )
+        self.injector.binder.bind(SegmentedTranscodeManager, to=segmented_transcode_manager)
+
+        audio_integrity_manager = AudioIntegrityManager(
+            download_dir=self.download_dir,
+            ffprobe_executable_path=self.ffprobe_executable_path,
         )
+        audio_integrity_manager.prune()
+        self.injector.binder.bind(AudioIntegrityManager, to=audio_integrity_manager)
+
+        yt_dl_client: YtDlClient
+        if self.ytdl_backend == "embedded":
+            yt_dl_client = YtDlEmbeddedClient(
+                default_format=self.ytdl_default_format,
+                download_dir=self.download_dir,
+                ytdl_executable_path=self.ytdl_executable_path,
+                ffmpeg_executable_path=self.ffmpeg_executable_path,
+                output_policy=output_policy,
+                cache_manager=cache_manager,
+                info_cache_ttl_seconds=self.ytdl_info_cache_ttl_seconds,
+                segmented_transcode_manager=segmented_transcode_manager,
+                audio_integrity_manager=audio_integrity_manager,
+                worker_count=self.ytdl_embedded_worker_count,
+            )
+        else:
+            yt_dl_client = YtDlClient(
+                default_format=self.ytdl_default_format,
+                download_dir=self.download_dir,
+                ytdl_executable_path=self.ytdl_executable_path,
+                ffmpeg_executable_path=self.ffmpeg_executable_path,
+                output_policy=output_policy,
+                cache_manager=cache_manager,
+                info_cache_ttl_seconds=self.ytdl_info_cache_ttl_seconds,
+                segmented_transcode_manager=segmented_transcode_manager,
+                audio_integrity_manager=audio_integrity_manager,
+            )
+        self.injector.binder.bind(YtDlClient, to=yt_dl_client)
 
         channel_service = ChannelService(yt_api_client, channel_mapper)
 
+        audio_store_manager = AudioStoreManager(
+            download_dir=self.download_dir,
+            max_bytes=self.audio_store_max_mb * 1024 * 1024,
+            pin_latest_count=self.audio_store_pin_latest,
+            pin_ttl_seconds=self.audio_store_pin_ttl_seconds,
+            sweep_interval_seconds=self.audio_store_sweep_interval_seconds,
+            default_reservation_bytes=self.audio_store_default_reservation_mb * 1024 * 1024,
+            audio_integrity_manager=audio_integrity_manager,
+        )
+        audio_store_manager.start_sweeper()
+        self.injector.binder.bind(AudioStoreManager, to=audio_store_manager)
+
+        lock_dir: str = os.path.join(self.download_dir, ".locks")
+
+        single_flight_manager = SingleFlightManager(lock_dir=lock_dir)
+        self.injector.binder.bind(SingleFlightManager, to=single_flight_manager)
+
+        audio_stream_manager = AudioStreamManager(
+            lock_dir=lock_dir,
+            audio_integrity_manager=audio_integrity_manager,
+        )
+        self.injector.binder.bind(AudioStreamManager, to=audio_stream_manager)
+
+        download_journal_manager = DownloadJournalManager(
+            journal_dir=os.path.join(self.download_dir, ".journal"),
+            lock_dir=lock_dir,
+        )
+        self.injector.binder.bind(DownloadJournalManager, to=download_journal_manager)
+
         video_service = VideoService(
             yt_api_client,
             yt_dl_client,
             video_mapper,
+            single_flight_manager,
+            audio_stream_manager,
+            audio_store_manager,
+            output_policy,
+            format_preference,
+            download_journal_manager,
+        )
+
+        channel_index_manager = ChannelIndexManager(database_path=self.channel_index_db_path)
+        self.injector.binder.bind(ChannelIndexManager, to=channel_index_manager)
+
+        feed_cursor_manager = FeedCursorManager(
+            cache_manager=cache_manager,
+            ttl_seconds=self.feed_cursor_ttl_seconds,
         )
+        self.injector.binder.bind(FeedCursorManager, to=feed_cursor_manager)
 
-        feed_service = FeedService(yt_api_client, channel_mapper, feed_item_mapper)
+        feed_service = FeedService(
+            yt_api_client,
+            channel_mapper,
+            feed_item_mapper,
+            audio_store_manager,
+            channel_index_manager if self.channel_index_enabled else None,
+            self.channel_index_sync_interval_seconds,
+            feed_cursor_manager,
+        )
 
         channel_controller = ChannelController(
             channel_service,
@@ -145,12 +416,72 @@ class DefaultContainer:
         )
         self.injector.binder.bind(ChannelController, to=channel_controller)
 
+        download_job_manager = DownloadJobManager(
+            worker_count=self.download_worker_count,
+            queue_size=self.download_queue_size,
+            retention_seconds=self.download_job_retention_seconds,
+        )
+        self.injector.binder.bind(DownloadJobManager, to=download_job_manager)
+
+        for video_id, interrupted_policy in video_service.recover_interrupted_downloads(
+            resume=self.download_resume_on_startup,
+        ):
+            download_job_manager.submit(
+                video_service.get_download_key(video_id, interrupted_policy),
+                partial(video_service.download_audio, video_id, interrupted_policy),
+            )
+
         video_controller = VideoController(
             video_service,
             video_response_mapper,
             file_response_mapper,
+            download_job_manager,
+            download_job_response_mapper,
+            app_config,
         )
         self.injector.binder.bind(VideoController, to=video_controller)
 
-        feed_controller = FeedController(feed_service, rss_feed_response_mapper, cache_manager)
+        feed_refresh_manager = FeedRefreshManager(
+            ttl_seconds=self.feed_cache_ttl_seconds,
+            max_stale_seconds=self.feed_max_stale_seconds,
+            stale_if_error_seconds=self.feed_stale_if_error_seconds,
+            quota_usage=yt_api_client.get_quota_units_used,
+            track_seconds=self.feed_refresh_track_seconds,
+            lead_seconds=self.feed_refresh_lead_seconds,
+            stagger_seconds=self.feed_refresh_stagger_seconds,
+            quota_budget_per_hour=self.feed_refresh_quota_per_hour,
+            interval_seconds=self.feed_refresh_interval_seconds,
+            max_tracked=self.feed_refresh_max_tracked,
+            adaptive_ttl=self.feed_adaptive_ttl_enabled,
+            min_ttl_seconds=self.feed_min_ttl_seconds,
+            max_ttl_seconds=self.feed_max_ttl_seconds,
+            ttl_gap_fraction=self.feed_ttl_gap_fraction,
+        )
+        self.injector.binder.bind(FeedRefreshManager, to=feed_refresh_manager)
+
+        feed_controller = FeedController(
+            feed_service,
+            rss_feed_response_mapper,
+            cache_manager,
+            feed_cursor_manager,
+            feed_refresh_manager,
+        )
         self.injector.binder.bind(FeedController, to=feed_controller)
+
+        stats_controller = StatsController(
+            single_flight_manager,
+            download_job_manager,
+            audio_stream_manager,
+            audio_store_manager,
+            yt_api_client,
+            yt_dl_client,
+            segmented_transcode_manager,
+            audio_integrity_manager,
+            video_metadata_manager,
+            channel_index_manager,
+            feed_cursor_manager,
+            channel_metadata_manager,
+            feed_refresh_manager,
+            cache_manager,
+        )
+        self.injector.binder.bind(StatsController, to=stats_controller)
@@ -39,5 +39,5 @@ class ChannelController:
         identifier: str,
     ) -> GetChannelResponse:
         """Return a channel response in JSON."""
-        service_model = self.channel_service.get_channel(identifier)
+        service_model = await self.channel_service.get_channel(identifier)
         return self.service_to_controller_mapper.create_from_channel(service_model)
@@ -1,33 +1,57 @@
 """Module for ytpodcast.controller.feed_controller."""
 
+import asyncio
+import logging
 from datetime import datetime
+from datetime import timezone
+from functools import partial
 
 from fastapi import APIRouter
+from fastapi import HTTPException
 from fastapi import Query
+from fastapi import Request
 from fastapi.responses import Response
 from injector import inject
 
+from ytpodcast.helper.content_encoding import SUPPORTED_CONTENT_ENCODINGS
+from ytpodcast.helper.content_encoding import select_content_encoding
+from ytpodcast.helper.http_validators import create_encoded_etag
+from ytpodcast.helper.http_validators import create_etag
+from ytpodcast.helper.http_validators import format_http_date
+from ytpodcast.helper.http_validators import is_not_modified
 from ytpodcast.manager.cache_manager import CacheManager
+from ytpodcast.manager.feed_cursor_manager import FeedCursorManager
+from ytpodcast.manager.feed_refresh_manager import FeedRefreshManager
 from ytpodcast.mapper.controller.rss_feed_response_mapper import RssFeedResponseMapper
+from ytpodcast.model.service.cache_entry_header import CacheEntryHeader
 from ytpodcast.model.service.channel_feed import ChannelFeed
+from ytpodcast.model.service.feed_cursor import FeedCursor
 from ytpodcast.service.feed_service import FeedService
 
 
+logger = logging.getLogger(__name__)
+
+
 # pylint: disable=too-few-public-methods
 class FeedController:
     """Feed API routes."""
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     @inject  # type: ignore[reportUntypedFunctionDecorator]
     def __init__(
         self,
         feed_service: FeedService,
         feed_response_mapper: RssFeedResponseMapper,
         cache_manager: CacheManager,
+        feed_cursor_manager: FeedCursorManager,
+        feed_refresh_manager: FeedRefreshManager,
     ) -> None:
         """Wire dependencies and register routes."""
         self.feed_service = feed_service
         self.feed_response_mapper = feed_response_mapper
         self.cache_manager = cache_manager
+        self.feed_cursor_manager = feed_cursor_manager
+        self.feed_refresh_manager = feed_refresh_manager
         self.router = APIRouter(prefix="/feeds", tags=["Feeds"])
         self._register_routes()
 
@@ -40,18 +64,42 @@ class FeedController:
             summary="Fetch channel RSS feed as XML",
         )
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
     async def get_feed_xml(
         self,
+        request: Request,
         channel_id: str,
         limit: int | None = Query(default=None, ge=1),
         offset: int | None = Query(default=None, ge=0),
         from_date: datetime | None = Query(default=None, alias="fromDate"),
         to_date: datetime | None = Query(default=None, alias="toDate"),
         include_shorts: bool = Query(default=False, alias="includeShorts"),
+        cursor: str | None = Query(default=None),
     ) -> Response:
-        """Return a channel feed response in RSS XML."""
-        cache_key: str = self.cache_manager.create_cache_key(
-            "feed_xml",
+        """Return a channel feed response in RSS XML.
+
+        A cursor from the next link of a previous page replaces the paging
+        and filter parameters. Responses carry an ETag and a Last-Modified
+        taken from the newest item, and conditional requests that match the
+        cached validators get a 304 without the body being loaded. Feeds are
+        compressed once when cached and sent in the encoding the client
+        prefers. Expired feeds are served stale while they are rebuilt in the
+        background, and the last good feed is served if a rebuild fails.
+        Requested feeds are tracked so they are refreshed before they expire.
+        """
+        feed_cursor: FeedCursor | None = None
+        if cursor is not None:
+            try:
+                feed_cursor = self.feed_cursor_manager.decode(cursor)
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+            limit = feed_cursor.get_limit()
+            offset = feed_cursor.get_offset()
+            from_date = feed_cursor.get_from_date()
+            to_date = feed_cursor.get_to_date()
+            include_shorts = feed_cursor.get_include_shorts()
+
+        query: FeedCursor = self.feed_service.create_feed_query(
             channel_id,
             limit,
             offset,
@@ -59,18 +107,212 @@ class FeedController:
             to_date,
             include_shorts,
         )
-        cached_value: str | None = self.cache_manager.get(cache_key)
-        if cached_value is not None:
-            return Response(content=cached_value, media_type="application/rss+xml")
+        cache_key: str = self.cache_manager.create_cache_key(
+            "feed_xml",
+            query.model_dump(mode="json"),
+            feed_cursor.get_page_token() if feed_cursor is not None else None,
+            feed_cursor.get_page_position() if feed_cursor is not None else 0,
+        )
+        header: CacheEntryHeader | None = self.cache_manager.get_header(
+            cache_key,
+            max_stale_seconds=self.feed_refresh_manager.get_retention_seconds(),
+        )
+        self.feed_refresh_manager.track(
+            cache_key,
+            partial(self._rebuild_feed, cache_key, query, feed_cursor),
+            header.get_expires_at() if header is not None else None,
+        )
+        if header is not None:
+            stale_seconds: float = (
+                datetime.now(timezone.utc) - header.get_expires_at()
+            ).total_seconds()
+            if 0 <= stale_seconds <= self.feed_refresh_manager.max_stale_seconds:
+                self.feed_refresh_manager.schedule(
+                    cache_key,
+                    partial(self._rebuild_feed, cache_key, query, feed_cursor),
+                )
+            elif stale_seconds > 0:
+                try:
+                    return await self._create_rebuilt_response(
+                        request,
+                        cache_key,
+                        query,
+                        feed_cursor,
+                    )
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.warning("Feed rebuild failed; serving the stale feed.", exc_info=True)
+                    self.feed_refresh_manager.record_error_hit()
+            cached_response: Response | None = self._create_cached_response(
+                request,
+                cache_key,
+                header,
+            )
+            if cached_response is not None:
+                return cached_response
+            cached_value: str | None = self.cache_manager.get(
+                cache_key,
+                max_stale_seconds=self.feed_refresh_manager.get_retention_seconds(),
+            )
+            if cached_value is not None:
+                return self._create_feed_response(
+                    request,
+                    cached_value,
+                    header.get_etag(),
+                    header.get_last_modified(),
+                )
+        else:
+            cached_value = self.cache_manager.get(cache_key)
+            if cached_value is not None:
+                return Response(content=cached_value, media_type="application/rss+xml")
+        return await self._create_rebuilt_response(request, cache_key, query, feed_cursor)
 
-        feed: ChannelFeed = self.feed_service.get_channel_feed(
-            channel_id,
-            limit=limit,
-            offset=offset,
-            from_date=from_date,
-            to_date=to_date,
-            include_shorts=include_shorts,
+    async def _create_rebuilt_response(
+        self,
+        request: Request,
+        cache_key: str,
+        query: FeedCursor,
+        feed_cursor: FeedCursor | None,
+    ) -> Response:
+        """Rebuild a feed and answer with it."""
+        xml_body, etag, last_modified = await self._rebuild_feed(cache_key, query, feed_cursor)
+        header: CacheEntryHeader | None = self.cache_manager.get_header(cache_key)
+        if header is not None:
+            cached_response: Response | None = self._create_cached_response(
+                request,
+                cache_key,
+                header,
+            )
+            if cached_response is not None:
+                return cached_response
+        return self._create_feed_response(request, xml_body, etag, last_modified)
+
+    async def _rebuild_feed(
+        self,
+        cache_key: str,
+        query: FeedCursor,
+        feed_cursor: FeedCursor | None,
+    ) -> tuple[str, str, datetime | None]:
+        """Fetch and render a feed, cache it, and return it with its validators."""
+        quota_before: int = self.feed_refresh_manager.get_quota_units_used()
+        feed: ChannelFeed = await self.feed_service.get_channel_feed(
+            query.get_channel_id(),
+            limit=query.get_limit(),
+            offset=query.get_offset(),
+            from_date=query.get_from_date(),
+            to_date=query.get_to_date(),
+            include_shorts=query.get_include_shorts(),
+            cursor=feed_cursor,
         )
         xml_body: str = self.feed_response_mapper.create_from_feed(feed)
-        self.cache_manager.set(cache_key, xml_body, ttl_seconds=10800)
-        return Response(content=xml_body, media_type="application/rss+xml")
+        etag: str = create_etag(xml_body)
+        last_modified: datetime | None = max(
+            (item.get_published_at() for item in feed.get_items()),
+            default=None,
+        )
+        ttl_seconds: int = self.feed_refresh_manager.compute_ttl_seconds(
+            [item.get_published_at() for item in feed.get_items()],
+            to_date=query.get_to_date(),
+        )
+        # Compressing every encoding is CPU-bound, so it runs off the event loop.
+        await asyncio.to_thread(
+            self.cache_manager.set,
+            cache_key,
+            xml_body,
+            ttl_seconds=ttl_seconds,
+            etag=etag,
+            last_modified=last_modified,
+            content_encodings=SUPPORTED_CONTENT_ENCODINGS,
+        )
+        self.feed_refresh_manager.record_rebuild(
+            cache_key,
+            ttl_seconds,
+            self.feed_refresh_manager.get_quota_units_used() - quota_before,
+        )
+        return xml_body, etag, last_modified
+
+    def _create_cached_response(
+        self,
+        request: Request,
+        cache_key: str,
+        header: CacheEntryHeader,
+    ) -> Response | None:
+        """Answer from the cached validators and compressed bodies if possible.
+
+        Returns None when the client takes the identity encoding and the
+        request is not conditional-matched, so the caller loads the value.
+        """
+        content_encoding: str | None = select_content_encoding(
+            request.headers.get("accept-encoding"),
+            header.get_content_encodings(),
+        )
+        encoded_body: bytes | None = None
+        if content_encoding is not None:
+            encoded_body = self.cache_manager.get_encoded(
+                cache_key, content_encoding, header.get_etag()
+            )
+            if encoded_body is None:
+                content_encoding = None
+        etag: str = create_encoded_etag(header.get_etag(), content_encoding)
+        if self._is_not_modified(request, etag, header.get_last_modified()):
+            return self._create_not_modified_response(etag, header.get_last_modified())
+        if encoded_body is None:
+            return None
+        headers: dict[str, str] = self._build_validator_headers(etag, header.get_last_modified())
+        headers["Content-Encoding"] = str(content_encoding)
+        return Response(
+            content=encoded_body,
+            media_type="application/rss+xml",
+            headers=headers,
+        )
+
+    def _is_not_modified(
+        self,
+        request: Request,
+        etag: str,
+        last_modified: datetime | None,
+    ) -> bool:
+        """Return whether the client already holds the current feed."""
+        return is_not_modified(
+            request.headers.get("if-none-match"),
+            request.headers.get("if-modified-since"),
+            etag,
+            last_modified,
+        )
+
+    def _create_feed_response(
+        self,
+        request: Request,
+        xml_body: str,
+        etag: str,
+        last_modified: datetime | None,
+    ) -> Response:
+        """Build an uncompressed feed response with its validators."""
+        if self._is_not_modified(request, etag, last_modified):
+            return self._create_not_modified_response(etag, last_modified)
+        return Response(
+            content=xml_body,
+            media_type="application/rss+xml",
+            headers=self._build_validator_headers(etag, last_modified),
+        )
+
+    def _create_not_modified_response(
+        self,
+        etag: str,
+        last_modified: datetime | None,
+    ) -> Response:
+        """Build a bodiless 304 response with the current validators."""
+        return Response(
+            status_code=304,
+            headers=self._build_validator_headers(etag, last_modified),
+        )
+
+    def _build_validator_headers(
+        self,
+        etag: str,
+        last_modified: datetime | None,
+    ) -> dict[str, str]:
+        """Return the ETag, Last-Modified and Vary headers of a feed."""
+        headers: dict[str, str] = {"ETag": etag, "Vary": "Accept-Encoding"}
+        if last_modified is not None:
+            headers["Last-Modified"] = format_http_date(last_modified)
+        return headers
@@ -0,0 +1,207 @@
+"""Module for ytpodcast.controller.stats_controller."""
+
+import asyncio
+from typing import Any
+
+from fastapi import APIRouter
+from injector import inject
+
+from ytpodcast.client.yt_api_client import YtApiClient
+from ytpodcast.client.yt_dl_client import YtDlClient
+from ytpodcast.manager.audio_integrity_manager import AudioIntegrityManager
+from ytpodcast.manager.audio_store_manager import AudioStoreManager
+from ytpodcast.manager.audio_stream_manager import AudioStreamManager
+from ytpodcast.manager.cache_manager import CacheManager
+from ytpodcast.manager.channel_index_manager import ChannelIndexManager
+from ytpodcast.manager.channel_metadata_manager import ChannelMetadataManager
+from ytpodcast.manager.download_job_manager import DownloadJobManager
+from ytpodcast.manager.feed_cursor_manager import FeedCursorManager
+from ytpodcast.manager.feed_refresh_manager import FeedRefreshManager
+from ytpodcast.manager.segmented_transcode_manager import SegmentedTranscodeManager
+from ytpodcast.manager.single_flight_manager import SingleFlightManager
+from ytpodcast.manager.video_metadata_manager import VideoMetadataManager
+
+
+# pylint: disable=too-few-public-methods,too-many-instance-attributes
+class StatsController:
+    """Operational statistics routes."""
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    @inject  # type: ignore[reportUntypedFunctionDecorator]
+    def __init__(
+        self,
+        single_flight_manager: SingleFlightManager,
+        download_job_manager: DownloadJobManager,
+        audio_stream_manager: AudioStreamManager,
+        audio_store_manager: AudioStoreManager,
+        yt_api_client: YtApiClient,
+        yt_dl_client: YtDlClient,
+        segmented_transcode_manager: SegmentedTranscodeManager,
+        audio_integrity_manager: AudioIntegrityManager,
+        video_metadata_manager: VideoMetadataManager,
+        channel_index_manager: ChannelIndexManager,
+        feed_cursor_manager: FeedCursorManager,
+        channel_metadata_manager: ChannelMetadataManager,
+        feed_refresh_manager: FeedRefreshManager,
+        cache_manager: CacheManager,
+    ) -> None:
+        """Wire dependencies and register routes."""
+        self.single_flight_manager = single_flight_manager
+        self.download_job_manager = download_job_manager
+        self.audio_stream_manager = audio_stream_manager
+        self.audio_store_manager = audio_store_manager
+        self.yt_api_client = yt_api_client
+        self.yt_dl_client = yt_dl_client
+        self.segmented_transcode_manager = segmented_transcode_manager
+        self.audio_integrity_manager = audio_integrity_manager
+        self.video_metadata_manager = video_metadata_manager
+        self.channel_index_manager = channel_index_manager
+        self.feed_cursor_manager = feed_cursor_manager
+        self.channel_metadata_manager = channel_metadata_manager
+        self.feed_refresh_manager = feed_refresh_manager
+        self.cache_manager = cache_manager
+        self.router = APIRouter(prefix="/stats", tags=["Stats"])
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        """Register FastAPI routes for statistics."""
+        self.router.add_api_route(
+            "/downloads",
+            self.get_download_stats,
+            methods=["GET"],
+            summary="Fetch in-flight download statistics",
+        )
+        self.router.add_api_route(
+            "/jobs",
+            self.get_job_stats,
+            methods=["GET"],
+            summary="Fetch download job queue statistics",
+        )
+        self.router.add_api_route(
+            "/streams",
+            self.get_stream_stats,
+            methods=["GET"],
+            summary="Fetch live audio stream statistics",
+        )
+        self.router.add_api_route(
+            "/store",
+            self.get_store_stats,
+            methods=["GET"],
+            summary="Fetch audio store usage statistics",
+        )
+        self.router.add_api_route(
+            "/ytapi",
+            self.get_ytapi_stats,
+            methods=["GET"],
+            summary="Fetch YouTube Data API quota usage",
+        )
+        self.router.add_api_route(
+            "/ytdl",
+            self.get_ytdl_stats,
+            methods=["GET"],
+            summary="Fetch yt-dlp info cache statistics",
+        )
+        self.router.add_api_route(
+            "/transcode",
+            self.get_transcode_stats,
+            methods=["GET"],
+            summary="Fetch segmented transcode statistics",
+        )
+        self.router.add_api_route(
+            "/integrity",
+            self.get_integrity_stats,
+            methods=["GET"],
+            summary="Fetch audio integrity check statistics",
+        )
+        self.router.add_api_route(
+            "/videos",
+            self.get_video_metadata_stats,
+            methods=["GET"],
+            summary="Fetch video metadata store statistics",
+        )
+        self.router.add_api_route(
+            "/channels",
+            self.get_channel_index_stats,
+            methods=["GET"],
+            summary="Fetch channel index statistics",
+        )
+        self.router.add_api_route(
+            "/cursors",
+            self.get_feed_cursor_stats,
+            methods=["GET"],
+            summary="Fetch feed cursor statistics",
+        )
+        self.router.add_api_route(
+            "/channel-metadata",
+            self.get_channel_metadata_stats,
+            methods=["GET"],
+            summary="Fetch channel metadata store statistics",
+        )
+        self.router.add_api_route(
+            "/feeds",
+            self.get_feed_refresh_stats,
+            methods=["GET"],
+            summary="Fetch stale feed serving and refresh statistics",
+        )
+        self.router.add_api_route(
+            "/cache",
+            self.get_cache_stats,
+            methods=["GET"],
+            summary="Fetch memory and file cache tier statistics",
+        )
+
+    async def get_download_stats(self) -> dict[str, Any]:
+        """Return in-flight downloads and how many waiters joined each."""
+        return self.single_flight_manager.get_stats()
+
+    async def get_job_stats(self) -> dict[str, Any]:
+        """Return download queue depth and job counts by status."""
+        return self.download_job_manager.get_stats()
+
+    async def get_stream_stats(self) -> dict[str, Any]:
+        """Return live audio streams and how many readers joined each."""
+        return self.audio_stream_manager.get_stats()
+
+    async def get_store_stats(self) -> dict[str, Any]:
+        """Return audio store usage, hit rate, and eviction counters."""
+        return await asyncio.to_thread(self.audio_store_manager.get_stats)
+
+    async def get_ytapi_stats(self) -> dict[str, Any]:
+        """Return YouTube Data API request counts and quota units used."""
+        return self.yt_api_client.get_stats()
+
+    async def get_ytdl_stats(self) -> dict[str, Any]:
+        """Return yt-dlp info cache hit and miss counters."""
+        return self.yt_dl_client.get_stats()
+
+    async def get_transcode_stats(self) -> dict[str, Any]:
+        """Return segmented transcode counters."""
+        return self.segmented_transcode_manager.get_stats()
+
+    async def get_integrity_stats(self) -> dict[str, Any]:
+        """Return audio integrity verification counters."""
+        return self.audio_integrity_manager.get_stats()
+
+    async def get_video_metadata_stats(self) -> dict[str, Any]:
+        """Return video metadata store size and hit rates."""
+        return await asyncio.to_thread(self.video_metadata_manager.get_stats)
+
+    async def get_channel_index_stats(self) -> dict[str, Any]:
+        """Return channel index size and activity counters."""
+        return await asyncio.to_thread(self.channel_index_manager.get_stats)
+
+    async def get_feed_cursor_stats(self) -> dict[str, Any]:
+        """Return how often deep feed pages resumed from a remembered position."""
+        return self.feed_cursor_manager.get_stats()
+
+    async def get_channel_metadata_stats(self) -> dict[str, Any]:
+        """Return channel resolution and snippet hit counters."""
+        return await asyncio.to_thread(self.channel_metadata_manager.get_stats)
+
+    async def get_feed_refresh_stats(self) -> dict[str, Any]:
+        """Return stale feed hits and background refresh counters."""
+        return self.feed_refresh_manager.get_stats()
+
+    async def get_cache_stats(self) -> dict[str, Any]:
+        """Return memory tier usage and hit counters of both cache tiers."""
+        return self.cache_manager.get_stats()
@@ -1,14 +1,30 @@
 """Module for ytpodcast.controller.video_controller."""
 
+import asyncio
+import queue
 from pathlib import Path
 
 from fastapi import APIRouter
-from fastapi.responses import FileResponse
+from fastapi import HTTPException
+from fastapi import Query
+from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from injector import inject
 
+from ytpodcast.config.app_config import AppConfig
+from ytpodcast.manager.download_job_manager import DownloadJobManager
 from ytpodcast.mapper.controller.file_response_mapper import FileResponseMapper
+from ytpodcast.mapper.controller.get_download_job_response_mapper import (
+    GetDownloadJobResponseMapper,
+)
 from ytpodcast.mapper.controller.get_video_response_mapper import GetVideoResponseMapper
+from ytpodcast.model.controller.get_download_job_response import GetDownloadJobResponse
 from ytpodcast.model.controller.get_video_response import GetVideoResponse
+from ytpodcast.model.service.audio_output_policy import AudioOutputCodec
+from ytpodcast.model.service.audio_output_policy import AudioOutputMode
+from ytpodcast.model.service.audio_output_policy import AudioOutputPolicy
+from ytpodcast.model.service.download_job import DownloadJob
+from ytpodcast.model.service.download_job import DownloadJobStatus
 from ytpodcast.service.video_service import VideoService
 
 
@@ -16,17 +32,24 @@ from ytpodcast.service.video_service import VideoService
 class VideoController:
     """Video API routes."""
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     @inject  # type: ignore[reportUntypedFunctionDecorator]
     def __init__(
         self,
         video_service: VideoService,
         service_to_controller_mapper: GetVideoResponseMapper,
         file_response_mapper: FileResponseMapper,
+        download_job_manager: DownloadJobManager,
+        download_job_response_mapper: GetDownloadJobResponseMapper,
+        app_config: AppConfig,
     ) -> None:
         """Wire dependencies and register routes."""
         self.video_service = video_service
         self.service_to_controller_mapper = service_to_controller_mapper
         self.file_response_mapper = file_response_mapper
+        self.download_job_manager = download_job_manager
+        self.download_job_response_mapper = download_job_response_mapper
+        self.app_config = app_config
         self.router = APIRouter(prefix="/videos", tags=["Videos"])
         self._register_routes()
 
@@ -44,6 +67,7 @@ class VideoController:
             self.download_video,
             methods=["GET"],
             summary="Download video audio",
+            responses={202: {"model": GetDownloadJobResponse}},
         )
 
     async def get_video(
@@ -51,10 +75,90 @@ class VideoController:
         video_id: str,
     ) -> GetVideoResponse:
         """Return a video response in JSON."""
-        service_model = self.video_service.get_video(video_id)
+        service_model = await self.video_service.get_video(video_id)
         return self.service_to_controller_mapper.create_from_video(service_model)
 
-    async def download_video(self, video_id: str) -> FileResponse:
-        """Download a single audio file for a video."""
-        download_path: Path = self.video_service.download_audio(video_id)
-        return self.file_response_mapper.create_from_path(download_path)
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    async def download_video(
+        self,
+        video_id: str,
+        wait_seconds: float | None = Query(default=None, ge=0, alias="wait"),
+        stream: bool | None = Query(default=None),
+        output_mode: AudioOutputMode | None = Query(default=None, alias="outputMode"),
+        output_codec: AudioOutputCodec | None = Query(default=None, alias="outputCodec"),
+        output_bitrate_kbps: int | None = Query(
+            default=None,
+            ge=8,
+            le=512,
+            alias="outputBitrateKbps",
+        ),
+    ) -> Response:
+        """Download a single audio file for a video.
+
+        Uncached downloads either stream the encoder output as it is produced
+        or run on the job queue. Queued requests wait up to the given deadline
+        and answer 202 with Retry-After if the job is still running.
+        """
+        output_policy: AudioOutputPolicy = self.video_service.resolve_output_policy(
+            output_mode,
+            output_codec,
+            output_bitrate_kbps,
+        )
+        # The lookup can run ffprobe on files without an integrity record.
+        existing_path: Path | None = await asyncio.to_thread(
+            self.video_service.find_downloaded_audio,
+            video_id,
+            output_policy,
+        )
+        if existing_path is not None:
+            return self.file_response_mapper.create_from_path(existing_path)
+
+        use_streaming: bool = self.app_config.download_streaming if stream is None else stream
+        if use_streaming:
+            return self.file_response_mapper.create_from_stream(
+                self.video_service.stream_audio(video_id, output_policy),
+                output_policy.get_extension(),
+            )
+
+        retry_after_seconds: int = self.app_config.download_retry_after_seconds
+        job_key: str = self.video_service.get_download_key(video_id, output_policy)
+        try:
+            self.download_job_manager.submit(
+                job_key,
+                lambda: self.video_service.download_audio(video_id, output_policy),
+            )
+        except queue.Full:
+            return JSONResponse(
+                status_code=503,
+                content={"detail": "Download queue is full."},
+                headers={"Retry-After": str(retry_after_seconds)},
+            )
+
+        max_wait_seconds: float = self.app_config.download_wait_seconds
+        timeout_seconds: float = (
+            max_wait_seconds if wait_seconds is None else min(wait_seconds, max_wait_seconds)
+        )
+        job: DownloadJob | None = await self.download_job_manager.wait(
+            job_key,
+            timeout_seconds,
+        )
+        if job is None:
+            raise HTTPException(status_code=500, detail="Download job was lost.")
+        if job.get_status() == DownloadJobStatus.FAILED:
+            raise HTTPException(status_code=502, detail=job.get_error())
+        job_path: str | None = job.get_path()
+        if job.get_status() == DownloadJobStatus.COMPLETED and job_path:
+            return self.file_response_mapper.create_from_path(Path(job_path))
+
+        response_model: GetDownloadJobResponse = (
+            self.download_job_response_mapper.create_from_download_job(
+                video_id,
+                job,
+                retry_after_seconds,
+            )
+        )
+        return JSONResponse(
+            status_code=202,
+            content=response_model.model_dump(mode="json"),
+            headers={"Retry-After": str(retry_after_seconds)},
+        )
@@ -4,11 +4,26 @@ import mimetypes
 from pathlib import Path
 
 
+# Served audio types, independent of the host's mime.types database.
+AUDIO_MEDIA_TYPES: dict[str, str] = {
+    ".mp3": "audio/mpeg",
+    ".m4a": "audio/mp4",
+    ".opus": "audio/ogg",
+}
+
+
 # pylint: disable=too-few-public-methods
 class FileHelper:
     """Helper for file-related operations."""
 
     def resolve_media_type(self, file_path: Path) -> str:
         """Resolve a media type from a file path."""
+        audio_media_type: str | None = AUDIO_MEDIA_TYPES.get(file_path.suffix.lower())
+        if audio_media_type is not None:
+            return audio_media_type
         media_type, _ = mimetypes.guess_type(str(file_path))
         return media_type or "application/octet-stream"
+
+    def resolve_media_type_for_extension(self, extension: str) -> str:
+        """Resolve a media type from a bare file extension."""
+        return self.resolve_media_type(Path(f"file.{extension.lstrip('.')}"))
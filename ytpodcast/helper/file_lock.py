@@ -0,0 +1,43 @@
+"""Module for ytpodcast.helper.file_lock."""
+
+import fcntl
+from pathlib import Path
+from typing import Any
+
+
+class FileLock:
+    """Exclusive advisory lock on a file shared between worker processes."""
+
+    def __init__(self, lock_path: Path) -> None:
+        """Store the lock file path."""
+        self.lock_path = lock_path
+        self._handle: Any = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """Take the lock, returning False if non-blocking and already held."""
+        handle: Any = self.lock_path.open("a", encoding="utf-8")
+        flags: int = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(handle.fileno(), flags)
+        except BlockingIOError:
+            handle.close()
+            return False
+        self._handle = handle
+        return True
+
+    def release(self) -> None:
+        """Release the lock and close the file handle."""
+        if self._handle is None:
+            return
+        fcntl.flock(self._handle.fileno(), fcntl.LOCK_UN)
+        self._handle.close()
+        self._handle = None
+
+    def __enter__(self) -> "FileLock":
+        """Block until the exclusive lock is held."""
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Release the lock."""
+        self.release()
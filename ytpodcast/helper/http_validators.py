@@ -0,0 +1,60 @@
+"""Module for ytpodcast.helper.http_validators."""
+
+from datetime import datetime
+from datetime import timezone
+from email.utils import format_datetime
+from email.utils import parsedate_to_datetime
+from hashlib import sha256
+
+
+def create_etag(content: str) -> str:
+    """Return a strong entity tag for a response body."""
+    return f'"{sha256(content.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def create_encoded_etag(etag: str, content_encoding: str | None) -> str:
+    """Return the entity tag of a compressed representation of a body.
+
+    Each content coding is a different representation, so it needs its own
+    strong tag; the identity representation keeps the plain tag.
+    """
+    if content_encoding is None:
+        return etag
+    return f'{etag[:-1]}-{content_encoding}"'
+
+
+def format_http_date(value: datetime) -> str:
+    """Format a datetime as an HTTP date."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def is_not_modified(
+    if_none_match: str | None,
+    if_modified_since: str | None,
+    etag: str,
+    last_modified: datetime | None,
+) -> bool:
+    """Evaluate conditional GET headers against the current validators.
+
+    If-None-Match takes precedence over If-Modified-Since, as RFC 9110
+    requires, and matches entity tags with the weak comparison.
+    """
+    if if_none_match is not None:
+        candidates: list[str] = [candidate.strip() for candidate in if_none_match.split(",")]
+        return "*" in candidates or any(
+            candidate.removeprefix("W/") == etag for candidate in candidates
+        )
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since: datetime = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP dates have whole-second precision.
+    return last_modified.replace(microsecond=0) <= since
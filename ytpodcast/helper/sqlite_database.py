@@ -0,0 +1,22 @@
+"""Module for ytpodcast.helper.sqlite_database."""
+
+import sqlite3
+from pathlib import Path
+
+
+def open_sqlite_database(database_path: Path) -> sqlite3.Connection:
+    """Open a SQLite database shared by threads and worker processes.
+
+    The connection runs in autocommit mode with WAL journaling, so readers
+    never block the writer. Callers serialize access with their own lock.
+    """
+    database_path.parent.mkdir(parents=True, exist_ok=True)
+    connection: sqlite3.Connection = sqlite3.connect(
+        database_path,
+        timeout=30,
+        check_same_thread=False,
+        isolation_level=None,
+    )
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
@@ -0,0 +1,140 @@
+"""Module for ytpodcast.manager.audio_integrity_manager."""
+
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+
+class AudioIntegrityManager:
+    """Integrity records for finished audio files.
+
+    Every file is probed with ffprobe once, before it is published, and its
+    size and duration are stored in a sidecar record. Later lookups only
+    compare the file size with the record, so serving never re-probes.
+    Files without a record, such as ones written before records existed,
+    are probed on first use and recorded if they decode.
+    """
+
+    def __init__(self, download_dir: str, ffprobe_executable_path: str) -> None:
+        """Store probing settings and initialize counters."""
+        self.records_dir = Path(download_dir) / ".integrity"
+        self.records_dir.mkdir(parents=True, exist_ok=True)
+        self.ffprobe_executable_path = ffprobe_executable_path
+        self._lock = threading.Lock()
+        self._verified: int = 0
+        self._probed: int = 0
+        self._rejected: int = 0
+
+    def record(self, staged_path: Path, output_path: Path) -> None:
+        """Probe a staged file and store the record for its final path.
+
+        Raises ValueError when the file cannot be decoded.
+        """
+        duration_seconds: float = self._probe_duration_seconds(staged_path)
+        payload: dict[str, Any] = {
+            "size_bytes": staged_path.stat().st_size,
+            "duration_seconds": duration_seconds,
+            "recorded_at": time.time(),
+        }
+        record_path: Path = self._build_record_path(output_path)
+        temp_path: Path = record_path.with_name(f"{record_path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(payload), encoding="utf-8")
+        temp_path.replace(record_path)
+
+    def verify(self, path: Path) -> bool:
+        """Return whether a published file matches its integrity record."""
+        try:
+            payload: dict[str, Any] = json.loads(
+                self._build_record_path(path).read_text(encoding="utf-8")
+            )
+        except (OSError, json.JSONDecodeError):
+            return self._verify_unrecorded(path)
+        try:
+            size_bytes: int = path.stat().st_size
+        except FileNotFoundError:
+            return False
+        is_valid: bool = size_bytes == payload.get("size_bytes")
+        with self._lock:
+            if is_valid:
+                self._verified += 1
+            else:
+                self._rejected += 1
+        return is_valid
+
+    def remove(self, path: Path) -> None:
+        """Delete the record of a file."""
+        self._build_record_path(path).unlink(missing_ok=True)
+
+    def prune(self) -> int:
+        """Delete records whose audio file no longer exists."""
+        removed: int = 0
+        for record_path in self.records_dir.glob("*.json"):
+            if not (self.records_dir.parent / record_path.stem).exists():
+                record_path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return verification counters."""
+        with self._lock:
+            return {
+                "verified": self._verified,
+                "probed": self._probed,
+                "rejected": self._rejected,
+            }
+
+    def _verify_unrecorded(self, path: Path) -> bool:
+        """Probe a file that has no record and record it if it decodes."""
+        try:
+            self.record(path, path)
+        except FileNotFoundError:
+            if not path.exists():
+                return False
+            # ffprobe itself is missing; trust the file rather than drop it.
+            logger.warning("ffprobe is not available; serving %s unverified.", path)
+            return True
+        except ValueError:
+            logger.warning("Discarding %s, it failed the integrity probe.", path)
+            with self._lock:
+                self._rejected += 1
+            return False
+        return True
+
+    def _probe_duration_seconds(self, path: Path) -> float:
+        """Return the decoded duration of an audio file."""
+        with self._lock:
+            self._probed += 1
+        result: subprocess.CompletedProcess[str] = subprocess.run(
+            [
+                self.ffprobe_executable_path,
+                "-v",
+                "error",
+                "-show_entries",
+                "format=duration",
+                "-of",
+                "default=noprint_wrappers=1:nokey=1",
+                str(path),
+            ],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+        try:
+            duration_seconds: float = float(result.stdout.strip())
+        except ValueError:
+            duration_seconds = 0.0
+        if result.returncode != 0 or duration_seconds <= 0:
+            raise ValueError(f"ffprobe could not read a duration from '{path.name}'.")
+        return duration_seconds
+
+    def _build_record_path(self, path: Path) -> Path:
+        """Return the record path for an audio file."""
+        return self.records_dir / f"{path.name}.json"
@@ -0,0 +1,216 @@
+"""Module for ytpodcast.manager.audio_store_manager."""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+
+from ytpodcast.manager.audio_integrity_manager import AudioIntegrityManager
+
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=too-many-instance-attributes
+class AudioStoreManager:
+    """Disk quota, LRU eviction and feed pinning for the download directory.
+
+    Last access is tracked through the file atime, which is set explicitly on
+    every hit so it works on noatime mounts and is shared between workers.
+    Pins are stored as small JSON files next to the audio so every worker
+    honours them and they survive restarts. Evicted files lose their
+    integrity record too.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        download_dir: str,
+        max_bytes: int,
+        pin_latest_count: int,
+        pin_ttl_seconds: int,
+        sweep_interval_seconds: int,
+        default_reservation_bytes: int,
+        audio_integrity_manager: AudioIntegrityManager | None = None,
+    ) -> None:
+        """Store quota settings and initialize counters."""
+        self.download_dir = Path(download_dir)
+        self.download_dir.mkdir(parents=True, exist_ok=True)
+        self.pins_dir = self.download_dir / ".pins"
+        self.pins_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.pin_latest_count = pin_latest_count
+        self.pin_ttl_seconds = pin_ttl_seconds
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.default_reservation_bytes = default_reservation_bytes
+        self.audio_integrity_manager = audio_integrity_manager
+        self._lock = threading.Lock()
+        self._reserved_bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._evicted_bytes: int = 0
+        self._sweeper: threading.Thread | None = None
+
+    def record_hit(self, path: Path) -> None:
+        """Mark a stored file as just accessed."""
+        with self._lock:
+            self._hits += 1
+        with suppress(OSError):
+            stat_result: os.stat_result = path.stat()
+            os.utime(path, (time.time(), stat_result.st_mtime))
+
+    def record_miss(self) -> None:
+        """Count a request that was not served from the store."""
+        with self._lock:
+            self._misses += 1
+
+    def pin_feed(self, channel_id: str, video_ids: list[str]) -> None:
+        """Protect the latest episodes of a requested feed from eviction."""
+        if self.pin_latest_count <= 0:
+            return
+        payload: dict[str, Any] = {
+            "video_ids": video_ids[: self.pin_latest_count],
+            "expires_at": time.time() + self.pin_ttl_seconds,
+        }
+        pin_path: Path = self.pins_dir / f"{channel_id}.json"
+        temp_path: Path = pin_path.with_name(f"{pin_path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(payload), encoding="utf-8")
+        temp_path.replace(pin_path)
+
+    @contextmanager
+    def reserve(self, size_bytes: int | None) -> Iterator[None]:
+        """Hold space for a download, evicting old files to make room.
+
+        Raises ValueError when the quota or the disk cannot fit the download.
+        """
+        reservation: int = size_bytes or self.default_reservation_bytes
+        with self._lock:
+            if self.max_bytes > 0:
+                self._evict_until(self.max_bytes - self._reserved_bytes - reservation)
+                used_bytes: int = sum(size for _, size, _ in self._list_entries())
+                if used_bytes + self._reserved_bytes + reservation > self.max_bytes:
+                    raise ValueError("Audio store quota cannot fit the download.")
+            free_bytes: int = shutil.disk_usage(self.download_dir).free
+            if free_bytes - self._reserved_bytes < reservation:
+                raise ValueError("Not enough free disk space for the download.")
+            self._reserved_bytes += reservation
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._reserved_bytes -= reservation
+
+    def sweep(self) -> None:
+        """Evict least recently used files until the store is within quota."""
+        if self.max_bytes <= 0:
+            return
+        with self._lock:
+            self._evict_until(self.max_bytes - self._reserved_bytes)
+            self._remove_expired_pins()
+
+    def start_sweeper(self) -> None:
+        """Run sweep periodically on a background thread."""
+        if self._sweeper is not None or self.sweep_interval_seconds <= 0:
+            return
+        self._sweeper = threading.Thread(
+            target=self._run_sweeper,
+            name="audio-store-sweeper",
+            daemon=True,
+        )
+        self._sweeper.start()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return usage, hit rate, and eviction counters."""
+        entries: list[tuple[Path, int, float]] = self._list_entries()
+        with self._lock:
+            lookups: int = self._hits + self._misses
+            return {
+                "bytes_used": sum(size for _, size, _ in entries),
+                "max_bytes": self.max_bytes,
+                "file_count": len(entries),
+                "reserved_bytes": self._reserved_bytes,
+                "pinned_video_ids": len(self._load_pinned_video_ids()),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "evicted_bytes": self._evicted_bytes,
+            }
+
+    def _run_sweeper(self) -> None:
+        """Sweep forever at the configured interval."""
+        while True:
+            time.sleep(self.sweep_interval_seconds)
+            try:
+                self.sweep()
+            except OSError:
+                logger.exception("Audio store sweep failed.")
+
+    def _evict_until(self, target_bytes: int) -> None:
+        """Delete unpinned files, oldest access first, until usage fits target_bytes."""
+        entries: list[tuple[Path, int, float]] = self._list_entries()
+        used_bytes: int = sum(size for _, size, _ in entries)
+        if used_bytes <= target_bytes:
+            return
+        pinned_video_ids: set[str] = self._load_pinned_video_ids()
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if used_bytes <= target_bytes:
+                break
+            if path.name.split(".", 1)[0] in pinned_video_ids:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            if self.audio_integrity_manager is not None:
+                self.audio_integrity_manager.remove(path)
+            used_bytes -= size
+            self._evictions += 1
+            self._evicted_bytes += size
+
+    def _list_entries(self) -> list[tuple[Path, int, float]]:
+        """Return finished audio files with their size and last access time."""
+        entries: list[tuple[Path, int, float]] = []
+        for path in self.download_dir.iterdir():
+            if path.name.startswith(".") or path.suffix == ".part":
+                continue
+            try:
+                stat_result: os.stat_result = path.stat()
+            except FileNotFoundError:
+                continue
+            if not path.is_file():
+                continue
+            entries.append((path, stat_result.st_size, stat_result.st_atime))
+        return entries
+
+    def _load_pinned_video_ids(self) -> set[str]:
+        """Return video ids pinned by feeds that were requested recently."""
+        now: float = time.time()
+        pinned: set[str] = set()
+        for pin_path in self.pins_dir.glob("*.json"):
+            try:
+                payload: dict[str, Any] = json.loads(pin_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                continue
+            if float(payload.get("expires_at", 0)) > now:
+                pinned.update(str(video_id) for video_id in payload.get("video_ids", []))
+        return pinned
+
+    def _remove_expired_pins(self) -> None:
+        """Delete pin files whose feeds have not been requested recently."""
+        now: float = time.time()
+        for pin_path in self.pins_dir.glob("*.json"):
+            try:
+                payload: dict[str, Any] = json.loads(pin_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                continue
+            if float(payload.get("expires_at", 0)) <= now:
+                pin_path.unlink(missing_ok=True)
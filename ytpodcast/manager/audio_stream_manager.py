@@ -0,0 +1,203 @@
+"""Module for ytpodcast.manager.audio_stream_manager."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from ytpodcast.helper.file_lock import FileLock
+from ytpodcast.manager.audio_integrity_manager import AudioIntegrityManager
+
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=too-few-public-methods,too-many-instance-attributes
+class _LiveStream:
+    """Encoder output being written to disk while readers follow it."""
+
+    def __init__(self, partial_path: Path, output_path: Path) -> None:
+        """Initialize progress tracking for the stream."""
+        self.partial_path = partial_path
+        self.output_path = output_path
+        self.condition = threading.Condition()
+        self.bytes_written: int = 0
+        self.done: bool = False
+        self.error: BaseException | None = None
+        self.readers: int = 0
+        self.started_at: datetime = datetime.now(timezone.utc)
+
+
+# pylint: disable=too-many-instance-attributes
+class AudioStreamManager:
+    """Share a single live encode between every reader of the same key.
+
+    The producer appends encoder output to a partial file next to the final
+    path and renames it once the encode succeeds. Readers in this process
+    follow the partial file as it grows; readers in other worker processes
+    detect the producer through the shared lock file and tail the same file.
+    Finished encodes get an integrity record before they are renamed.
+    """
+
+    def __init__(
+        self,
+        lock_dir: str,
+        chunk_size: int = 64 * 1024,
+        poll_interval_seconds: float = 0.25,
+        audio_integrity_manager: AudioIntegrityManager | None = None,
+    ) -> None:
+        """Store lock and polling settings."""
+        self.lock_dir = Path(lock_dir)
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = chunk_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.audio_integrity_manager = audio_integrity_manager
+        self._lock = threading.Lock()
+        self._streams: dict[str, _LiveStream] = {}
+        self._total_streams: int = 0
+        self._total_joined: int = 0
+
+    def open(
+        self,
+        key: str,
+        output_path: Path,
+        source: Callable[[], Iterator[bytes]],
+    ) -> Iterator[bytes]:
+        """Return an iterator over the audio for key, starting the encode if needed."""
+        with self._lock:
+            stream: _LiveStream | None = self._streams.get(key)
+            if stream is None:
+                if output_path.exists():
+                    return self._read_file(output_path)
+                file_lock: FileLock = FileLock(self.lock_dir / f"{key}.lock")
+                if not file_lock.acquire(blocking=False):
+                    return self._follow_remote(output_path, file_lock)
+                if output_path.exists():
+                    file_lock.release()
+                    return self._read_file(output_path)
+                stream = _LiveStream(self._build_partial_path(output_path), output_path)
+                stream.partial_path.write_bytes(b"")
+                self._streams[key] = stream
+                self._total_streams += 1
+                threading.Thread(
+                    target=self._produce,
+                    args=(key, stream, source, file_lock),
+                    name=f"audio-stream-{key}",
+                    daemon=True,
+                ).start()
+            else:
+                self._total_joined += 1
+            stream.readers += 1
+            handle: BinaryIO = stream.partial_path.open("rb")
+        return self._follow_local(stream, handle)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return live streams with their reader counts."""
+        with self._lock:
+            live: list[dict[str, Any]] = [
+                {
+                    "key": key,
+                    "readers": stream.readers,
+                    "bytes_written": stream.bytes_written,
+                    "started_at": stream.started_at.isoformat(),
+                }
+                for key, stream in self._streams.items()
+            ]
+            return {
+                "live": live,
+                "total_streams": self._total_streams,
+                "total_joined": self._total_joined,
+            }
+
+    def _produce(
+        self,
+        key: str,
+        stream: _LiveStream,
+        source: Callable[[], Iterator[bytes]],
+        file_lock: FileLock,
+    ) -> None:
+        """Write encoder output to the partial file and publish progress."""
+        try:
+            with stream.partial_path.open("ab") as handle:
+                for chunk in source():
+                    handle.write(chunk)
+                    handle.flush()
+                    with stream.condition:
+                        stream.bytes_written += len(chunk)
+                        stream.condition.notify_all()
+            if self.audio_integrity_manager is not None:
+                self.audio_integrity_manager.record(stream.partial_path, stream.output_path)
+            with self._lock:
+                stream.partial_path.replace(stream.output_path)
+                self._streams.pop(key, None)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.exception("Audio stream %s failed.", key)
+            stream.error = exc
+            with self._lock:
+                stream.partial_path.unlink(missing_ok=True)
+                self._streams.pop(key, None)
+        finally:
+            with stream.condition:
+                stream.done = True
+                stream.condition.notify_all()
+            file_lock.release()
+
+    def _follow_local(self, stream: _LiveStream, handle: BinaryIO) -> Iterator[bytes]:
+        """Yield bytes from a stream produced in this process."""
+        with handle:
+            while True:
+                chunk: bytes = handle.read(self.chunk_size)
+                if chunk:
+                    yield chunk
+                    continue
+                with stream.condition:
+                    if handle.tell() < stream.bytes_written:
+                        continue
+                    if stream.done:
+                        break
+                    stream.condition.wait(self.poll_interval_seconds)
+        if stream.error is not None:
+            raise ValueError("Audio stream failed before completion.") from stream.error
+
+    def _follow_remote(self, output_path: Path, file_lock: FileLock) -> Iterator[bytes]:
+        """Yield bytes from a download owned by another process."""
+        partial_path: Path = self._build_partial_path(output_path)
+        try:
+            handle: BinaryIO = partial_path.open("rb")
+        except FileNotFoundError:
+            # The owner is not streaming; wait for it and serve the result.
+            with file_lock:
+                pass
+            yield from self._read_file(output_path)
+            return
+        with handle:
+            while True:
+                chunk: bytes = handle.read(self.chunk_size)
+                if chunk:
+                    yield chunk
+                    continue
+                if file_lock.acquire(blocking=False):
+                    file_lock.release()
+                    while chunk := handle.read(self.chunk_size):
+                        yield chunk
+                    break
+                time.sleep(self.poll_interval_seconds)
+        if not output_path.exists():
+            raise ValueError("Audio stream failed before completion.")
+
+    def _read_file(self, path: Path) -> Iterator[bytes]:
+        """Yield a finished file in chunks."""
+        if not path.exists():
+            raise ValueError("Audio download failed before completion.")
+        with path.open("rb") as handle:
+            while chunk := handle.read(self.chunk_size):
+                yield chunk
+
+    def _build_partial_path(self, output_path: Path) -> Path:
+        """Return the in-progress path for an output file."""
+        return output_path.with_name(f"{output_path.name}.part")
@@ -1,25 +1,65 @@
 """Module for ytpodcast.manager.cache_manager."""
 
 import json
+import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from datetime import timezone
 from hashlib import sha256
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from pydantic import ValidationError
 
+from ytpodcast.helper.content_encoding import compress
 from ytpodcast.model.service.cache_entry import CacheEntry
+from ytpodcast.model.service.cache_entry_header import CacheEntryHeader
 
 
-# pylint: disable=too-few-public-methods
+# Memory charged for a decoded header, which has no natural byte size.
+_HEADER_SIZE = 512
+
+
+class _MemoryEntry(NamedTuple):
+    """Decoded cache content held in memory until it expires."""
+
+    expires_at: float
+    value: Any
+    size: int
+
+
+# pylint: disable=too-many-instance-attributes
 class CacheManager:
-    """Filesystem-backed cache storage."""
+    """Filesystem-backed cache storage with an in-memory LRU tier.
 
-    def __init__(self, cache_dir: str) -> None:
-        """Store the cache directory."""
+    Files are the persistent store shared by every worker process. Values,
+    headers and compressed bodies that were read or written recently are
+    also kept decoded in memory, bounded by memory_max_entries and
+    memory_max_bytes, so hot hits skip the file read, JSON decoding and
+    validation. Only fresh entries are served from memory; expired ones
+    fall through to the files, which another worker may have refreshed.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        memory_max_entries: int = 0,
+        memory_max_bytes: int = 0,
+    ) -> None:
+        """Store the cache directory and the memory tier bounds."""
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.memory_max_entries = memory_max_entries
+        self.memory_max_bytes = memory_max_bytes
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, _MemoryEntry] = OrderedDict()
+        self._memory_bytes: int = 0
+        self._memory_hits: int = 0
+        self._memory_misses: int = 0
+        self._memory_evictions: int = 0
+        self._file_hits: int = 0
+        self._file_misses: int = 0
 
     def create_cache_key(self, *args: Any, **kwargs: Any) -> str:
         """Return a deterministic cache key from inputs."""
@@ -34,36 +74,230 @@ class CacheManager:
         """Backwards-compatible typo alias for create_cache_key."""
         return self.create_cache_key(*args, **kwargs)
 
-    def get(self, key: str) -> str | None:
-        """Return cached content if it is still valid."""
+    def get(self, key: str, max_stale_seconds: int = 0) -> str | None:
+        """Return cached content if it is still valid.
+
+        With max_stale_seconds, content that expired at most that long ago
+        is returned too.
+        """
         cache_path: Path = self._build_cache_path(key)
-        if not cache_path.exists():
-            return None
+        memory_value: Any = self._get_from_memory(cache_path.name)
+        if memory_value is not None:
+            return memory_value
         try:
             data: dict[str, Any] = json.loads(cache_path.read_text(encoding="utf-8"))
             entry: CacheEntry = CacheEntry.model_validate(data)
         except (json.JSONDecodeError, OSError, ValidationError):
+            self._count_file_lookup(False)
             return None
-        expires_at: datetime = entry.get_expires_at()
-        if expires_at <= self._now_utc():
+        expires_at: float = entry.get_expires_at().timestamp()
+        if expires_at + max_stale_seconds <= self._now_utc().timestamp():
+            self._count_file_lookup(False)
             return None
-        return entry.get_value()
+        self._count_file_lookup(True)
+        value: str = entry.get_value()
+        self._put_in_memory(cache_path.name, value, expires_at, len(value))
+        return value
 
-    def set(self, key: str, value: str, ttl_seconds: int) -> None:
-        """Store content with a TTL in seconds."""
+    def get_header(self, key: str, max_stale_seconds: int = 0) -> CacheEntryHeader | None:
+        """Return the validators of a valid entry without loading its value.
+
+        With max_stale_seconds, validators of entries that expired at most
+        that long ago are returned too.
+        """
+        header_path: Path = self._build_header_path(key)
+        memory_header: Any = self._get_from_memory(header_path.name)
+        if memory_header is not None:
+            return memory_header
+        try:
+            data: dict[str, Any] = json.loads(header_path.read_text(encoding="utf-8"))
+            header: CacheEntryHeader = CacheEntryHeader.model_validate(data)
+        except (json.JSONDecodeError, OSError, ValidationError):
+            self._count_file_lookup(False)
+            return None
+        expires_at: float = header.get_expires_at().timestamp()
+        if expires_at + max_stale_seconds <= self._now_utc().timestamp():
+            self._count_file_lookup(False)
+            return None
+        self._count_file_lookup(True)
+        self._put_in_memory(header_path.name, header, expires_at, _HEADER_SIZE)
+        return header
+
+    def get_encoded(self, key: str, content_encoding: str, etag: str) -> bytes | None:
+        """Return the value as stored compressed for etag, or None if it is missing.
+
+        Callers check validity through get_header, which lists the encodings
+        and gives the etag. Each body is stored with the etag it was written
+        for, so a body that another worker rewrote since the header was read
+        is never paired with that header. Bodies read from files are kept in
+        memory while their header is.
+        """
+        encoded_path: Path = self._build_encoded_path(key, content_encoding)
+        memory_body: Any = self._get_from_memory(encoded_path.name)
+        if memory_body is not None and memory_body[0] == etag:
+            return memory_body[1]
+        try:
+            stored_etag, _, body = encoded_path.read_bytes().partition(b"\n")
+        except OSError:
+            self._count_file_lookup(False)
+            return None
+        if stored_etag.decode("utf-8", errors="replace") != etag:
+            self._count_file_lookup(False)
+            return None
+        self._count_file_lookup(True)
+        with self._lock:
+            header_entry: _MemoryEntry | None = self._memory.get(
+                self._build_header_path(key).name
+            )
+        if header_entry is not None and header_entry.value.get_etag() == etag:
+            self._put_in_memory(
+                encoded_path.name, (etag, body), header_entry.expires_at, len(body)
+            )
+        return body
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    def set(
+        self,
+        key: str,
+        value: str,
+        ttl_seconds: int,
+        etag: str | None = None,
+        last_modified: datetime | None = None,
+        content_encodings: tuple[str, ...] = (),
+    ) -> None:
+        """Store content with a TTL in seconds, and its validators if given.
+
+        With an etag, the value is also stored compressed in each of
+        content_encodings, once, so responses can send those bytes as is.
+        Each compressed file starts with the etag line it belongs to.
+        The value and its compressed forms are written before the header,
+        and every file is replaced atomically, so a header never lists
+        content that is not stored.
+        """
         expires_at: float = self._now_utc().timestamp() + ttl_seconds
         expires_at_value: datetime = datetime.fromtimestamp(expires_at, tz=timezone.utc)
         entry: CacheEntry = CacheEntry(expires_at=expires_at_value, value=value)
         cache_path: Path = self._build_cache_path(key)
-        cache_path.write_text(
-            json.dumps(entry.model_dump(mode="json"), ensure_ascii=True),
-            encoding="utf-8",
+        self._write_json(cache_path, entry.model_dump(mode="json"))
+        self._put_in_memory(cache_path.name, value, expires_at, len(value))
+        if etag is None:
+            return
+        encoded_value: bytes = value.encode("utf-8")
+        for content_encoding in content_encodings:
+            encoded_path: Path = self._build_encoded_path(key, content_encoding)
+            body: bytes = compress(encoded_value, content_encoding)
+            self._write_bytes(encoded_path, etag.encode("utf-8") + b"\n" + body)
+            self._put_in_memory(encoded_path.name, (etag, body), expires_at, len(body))
+        header: CacheEntryHeader = CacheEntryHeader(
+            expires_at=expires_at_value,
+            etag=etag,
+            last_modified=last_modified,
+            content_encodings=list(content_encodings),
+        )
+        header_path: Path = self._build_header_path(key)
+        self._write_json(header_path, header.model_dump(mode="json"))
+        self._put_in_memory(header_path.name, header, expires_at, _HEADER_SIZE)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return memory tier usage and hit counters of both tiers."""
+        with self._lock:
+            memory_lookups: int = self._memory_hits + self._memory_misses
+            file_lookups: int = self._file_hits + self._file_misses
+            return {
+                "memory": {
+                    "entries": len(self._memory),
+                    "bytes": self._memory_bytes,
+                    "max_entries": self.memory_max_entries,
+                    "max_bytes": self.memory_max_bytes,
+                    "hits": self._memory_hits,
+                    "misses": self._memory_misses,
+                    "hit_rate": self._memory_hits / memory_lookups if memory_lookups else 0.0,
+                    "evictions": self._memory_evictions,
+                },
+                "file": {
+                    "hits": self._file_hits,
+                    "misses": self._file_misses,
+                    "hit_rate": self._file_hits / file_lookups if file_lookups else 0.0,
+                },
+            }
+
+    def _get_from_memory(self, name: str) -> Any:
+        """Return fresh decoded content from the memory tier, or None."""
+        if self.memory_max_entries <= 0:
+            return None
+        now: float = self._now_utc().timestamp()
+        with self._lock:
+            entry: _MemoryEntry | None = self._memory.get(name)
+            if entry is not None and entry.expires_at <= now:
+                self._remove_from_memory(name)
+                entry = None
+            if entry is None:
+                self._memory_misses += 1
+                return None
+            self._memory.move_to_end(name)
+            self._memory_hits += 1
+            return entry.value
+
+    def _put_in_memory(self, name: str, value: Any, expires_at: float, size: int) -> None:
+        """Keep fresh decoded content in memory, evicting the least recently used.
+
+        Content that cannot be kept still drops the previous version of name,
+        so memory never serves a value older than the file.
+        """
+        if self.memory_max_entries <= 0:
+            return
+        with self._lock:
+            self._remove_from_memory(name)
+            if size > self.memory_max_bytes or expires_at <= self._now_utc().timestamp():
+                return
+            self._memory[name] = _MemoryEntry(expires_at=expires_at, value=value, size=size)
+            self._memory_bytes += size
+            while (
+                len(self._memory) > self.memory_max_entries
+                or self._memory_bytes > self.memory_max_bytes
+            ):
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted.size
+                self._memory_evictions += 1
+
+    def _remove_from_memory(self, name: str) -> None:
+        """Drop an entry from the memory tier; the caller holds the lock."""
+        entry: _MemoryEntry | None = self._memory.pop(name, None)
+        if entry is not None:
+            self._memory_bytes -= entry.size
+
+    def _count_file_lookup(self, hit: bool) -> None:
+        """Count a lookup that reached the file tier."""
+        with self._lock:
+            if hit:
+                self._file_hits += 1
+            else:
+                self._file_misses += 1
+
+    def _write_json(self, path: Path, payload: dict[str, Any]) -> None:
+        """Atomically replace a JSON file."""
+        self._write_bytes(path, json.dumps(payload, ensure_ascii=True).encode("utf-8"))
+
+    def _write_bytes(self, path: Path, content: bytes) -> None:
+        """Atomically replace a file."""
+        temp_path: Path = path.with_name(
+            f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
         )
+        temp_path.write_bytes(content)
+        temp_path.replace(path)
 
     def _build_cache_path(self, key: str) -> Path:
         """Return the filesystem path for the cache key."""
         return self.cache_dir / f"{key}.json"
 
+    def _build_header_path(self, key: str) -> Path:
+        """Return the filesystem path for the validators of a cache key."""
+        return self.cache_dir / f"{key}.head.json"
+
+    def _build_encoded_path(self, key: str, content_encoding: str) -> Path:
+        """Return the filesystem path for a compressed form of a cache key."""
+        return self.cache_dir / f"{key}.{content_encoding}"
+
     def _now_utc(self) -> datetime:
         """Return the current UTC timestamp."""
         return datetime.now(timezone.utc)
@@ -0,0 +1,249 @@
+"""Module for ytpodcast.manager.channel_index_manager."""
+
+import threading
+import time
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from ytpodcast.helper.sqlite_database import open_sqlite_database
+from ytpodcast.model.client.ytapi.channel_video_response import ChannelVideoResponse
+
+
+class ChannelSyncState(NamedTuple):
+    """How far the index of a channel has been synced."""
+
+    synced_at: float
+    backfill_page_token: str | None
+    is_complete: bool
+
+
+class ChannelIndexManager:
+    """Persistent index of the videos of each channel.
+
+    Rows are ordered by publish date through a (channel_id, published_at)
+    index, so feed queries by date range, limit and offset are range scans.
+    The sync state records when the newest uploads were last listed and the
+    page token from which older uploads continue to be backfilled.
+    """
+
+    def __init__(self, database_path: str) -> None:
+        """Open the database and create the schema if needed."""
+        self.database_path = Path(database_path)
+        self._lock = threading.Lock()
+        self._connection = open_sqlite_database(self.database_path)
+        self._connection.executescript(
+            "CREATE TABLE IF NOT EXISTS channel_videos ("
+            "channel_id TEXT NOT NULL, "
+            "video_id TEXT NOT NULL, "
+            "published_at REAL NOT NULL, "
+            "title TEXT NOT NULL, "
+            "description TEXT NOT NULL, "
+            "duration_seconds INTEGER, "
+            "is_short INTEGER NOT NULL, "
+            "PRIMARY KEY (channel_id, video_id)"
+            ") WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS channel_videos_by_date "
+            "ON channel_videos (channel_id, published_at);"
+            "CREATE TABLE IF NOT EXISTS channel_sync ("
+            "channel_id TEXT PRIMARY KEY, "
+            "synced_at REAL NOT NULL, "
+            "backfill_page_token TEXT, "
+            "is_complete INTEGER NOT NULL"
+            ");"
+        )
+        self._queries: int = 0
+        self._indexed_videos: int = 0
+
+    def get_sync_state(self, channel_id: str) -> ChannelSyncState | None:
+        """Return the sync state of a channel, or None if it was never indexed."""
+        with self._lock:
+            row: Any = self._connection.execute(
+                "SELECT synced_at, backfill_page_token, is_complete "
+                "FROM channel_sync WHERE channel_id = ?",
+                (channel_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return ChannelSyncState(
+            synced_at=row[0],
+            backfill_page_token=row[1],
+            is_complete=bool(row[2]),
+        )
+
+    def set_sync_state(
+        self,
+        channel_id: str,
+        backfill_page_token: str | None,
+        is_complete: bool,
+    ) -> None:
+        """Record how far the channel has been synced."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO channel_sync "
+                "(channel_id, synced_at, backfill_page_token, is_complete) VALUES (?, ?, ?, ?)",
+                (channel_id, time.time(), backfill_page_token, int(is_complete)),
+            )
+
+    def touch_sync_state(self, channel_id: str) -> None:
+        """Mark the newest uploads of a channel as just listed."""
+        with self._lock:
+            self._connection.execute(
+                "UPDATE channel_sync SET synced_at = ? WHERE channel_id = ?",
+                (time.time(), channel_id),
+            )
+
+    def find_known_video_ids(self, channel_id: str, video_ids: list[str]) -> set[str]:
+        """Return the ids that are already in the index."""
+        if not video_ids:
+            return set()
+        placeholders: str = ",".join("?" for _ in video_ids)
+        with self._lock:
+            rows: list[Any] = self._connection.execute(
+                "SELECT video_id FROM channel_videos "
+                f"WHERE channel_id = ? AND video_id IN ({placeholders})",
+                (channel_id, *video_ids),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def put_videos(
+        self,
+        channel_id: str,
+        videos: list[ChannelVideoResponse],
+        durations: dict[str, int],
+        max_shorts_seconds: int,
+    ) -> None:
+        """Insert or refresh listed videos with their durations."""
+        if not videos:
+            return
+        rows: list[tuple[Any, ...]] = []
+        for video in videos:
+            duration_seconds: int | None = durations.get(video.get_video_id())
+            rows.append(
+                (
+                    channel_id,
+                    video.get_video_id(),
+                    self._to_timestamp(video.get_published_at()),
+                    video.get_title(),
+                    video.get_description(),
+                    duration_seconds,
+                    int(duration_seconds is not None and duration_seconds <= max_shorts_seconds),
+                )
+            )
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO channel_videos (channel_id, video_id, published_at, "
+                "title, description, duration_seconds, is_short) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._indexed_videos += len(rows)
+
+    def count_videos(
+        self,
+        channel_id: str,
+        from_date: datetime | None,
+        to_date: datetime | None,
+        include_shorts: bool,
+    ) -> int:
+        """Count indexed videos matching the feed filters."""
+        where_clause, parameters = self._build_filter(
+            channel_id,
+            from_date,
+            to_date,
+            include_shorts,
+        )
+        with self._lock:
+            row: Any = self._connection.execute(
+                f"SELECT COUNT(*) FROM channel_videos WHERE {where_clause}",
+                parameters,
+            ).fetchone()
+        return int(row[0])
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def list_videos(
+        self,
+        channel_id: str,
+        from_date: datetime | None,
+        to_date: datetime | None,
+        include_shorts: bool,
+        limit: int,
+        offset: int,
+    ) -> list[ChannelVideoResponse]:
+        """Return indexed videos matching the feed filters, newest first."""
+        where_clause, parameters = self._build_filter(
+            channel_id,
+            from_date,
+            to_date,
+            include_shorts,
+        )
+        with self._lock:
+            rows: list[Any] = self._connection.execute(
+                "SELECT video_id, published_at, title, description FROM channel_videos "
+                f"WHERE {where_clause} ORDER BY published_at DESC LIMIT ? OFFSET ?",
+                (*parameters, limit, offset),
+            ).fetchall()
+            self._queries += 1
+        return [
+            ChannelVideoResponse(
+                video_id=video_id,
+                title=title,
+                description=description,
+                url=f"https://www.youtube.com/watch?v={video_id}",
+                published_at=datetime.fromtimestamp(published_at, tz=timezone.utc),
+            )
+            for video_id, published_at, title, description in rows
+        ]
+
+    def get_oldest_published_at(self, channel_id: str) -> datetime | None:
+        """Return the publish date of the oldest indexed video."""
+        with self._lock:
+            row: Any = self._connection.execute(
+                "SELECT MIN(published_at) FROM channel_videos WHERE channel_id = ?",
+                (channel_id,),
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return datetime.fromtimestamp(row[0], tz=timezone.utc)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return index size and activity counters."""
+        with self._lock:
+            channel_count: int = self._connection.execute(
+                "SELECT COUNT(*) FROM channel_sync"
+            ).fetchone()[0]
+            video_count: int = self._connection.execute(
+                "SELECT COUNT(*) FROM channel_videos"
+            ).fetchone()[0]
+            return {
+                "channels": channel_count,
+                "videos": video_count,
+                "queries": self._queries,
+                "indexed_videos": self._indexed_videos,
+            }
+
+    def _build_filter(
+        self,
+        channel_id: str,
+        from_date: datetime | None,
+        to_date: datetime | None,
+        include_shorts: bool,
+    ) -> tuple[str, tuple[Any, ...]]:
+        """Build the WHERE clause and parameters for feed filters."""
+        conditions: list[str] = ["channel_id = ?"]
+        parameters: list[Any] = [channel_id]
+        if from_date is not None:
+            conditions.append("published_at >= ?")
+            parameters.append(self._to_timestamp(from_date))
+        if to_date is not None:
+            conditions.append("published_at <= ?")
+            parameters.append(self._to_timestamp(to_date))
+        if not include_shorts:
+            conditions.append("is_short = 0")
+        return " AND ".join(conditions), tuple(parameters)
+
+    def _to_timestamp(self, value: datetime) -> float:
+        """Convert a datetime into UTC epoch seconds, treating naive values as UTC."""
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
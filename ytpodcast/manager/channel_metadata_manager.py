@@ -0,0 +1,138 @@
+"""Module for ytpodcast.manager.channel_metadata_manager."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from ytpodcast.helper.sqlite_database import open_sqlite_database
+from ytpodcast.model.client.ytapi.channel_response import ChannelResponse
+
+
+# pylint: disable=too-many-instance-attributes
+class ChannelMetadataManager:
+    """Persistent channel identifier resolutions and channel snippets.
+
+    A handle or username almost never moves to another channel, so its
+    resolution to a channel id is kept for identifier_max_age_seconds. The
+    snippet (title, description, thumbnail) is edited more often and is
+    served for snippet_max_age_seconds. Rows live in SQLite in WAL mode, so
+    they are shared by worker processes and survive restarts.
+    """
+
+    def __init__(
+        self,
+        database_path: str,
+        identifier_max_age_seconds: int,
+        snippet_max_age_seconds: int,
+    ) -> None:
+        """Open the database and create the schema if needed."""
+        self.database_path = Path(database_path)
+        self.identifier_max_age_seconds = identifier_max_age_seconds
+        self.snippet_max_age_seconds = snippet_max_age_seconds
+        self._lock = threading.Lock()
+        self._connection = open_sqlite_database(self.database_path)
+        self._connection.executescript(
+            "CREATE TABLE IF NOT EXISTS channel_identifiers ("
+            "identifier TEXT PRIMARY KEY, "
+            "channel_id TEXT NOT NULL, "
+            "resolved_at REAL NOT NULL"
+            ") WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS channels ("
+            "channel_id TEXT PRIMARY KEY, "
+            "title TEXT NOT NULL, "
+            "description TEXT NOT NULL, "
+            "image_url TEXT NOT NULL, "
+            "refreshed_at REAL NOT NULL"
+            ") WITHOUT ROWID;"
+        )
+        self._resolution_hits: int = 0
+        self._resolution_misses: int = 0
+        self._snippet_hits: int = 0
+        self._snippet_misses: int = 0
+
+    def resolve(self, identifier: str) -> str | None:
+        """Return the channel id a handle or username resolved to recently."""
+        if self.is_channel_id(identifier):
+            return identifier
+        oldest_fresh: float = time.time() - self.identifier_max_age_seconds
+        with self._lock:
+            row: Any = self._connection.execute(
+                "SELECT channel_id FROM channel_identifiers "
+                "WHERE identifier = ? AND resolved_at >= ?",
+                (self._normalize_identifier(identifier), oldest_fresh),
+            ).fetchone()
+            if row is None:
+                self._resolution_misses += 1
+                return None
+            self._resolution_hits += 1
+        return str(row[0])
+
+    def get(self, channel_id: str) -> ChannelResponse | None:
+        """Return the stored snippet of a channel unless it is outdated."""
+        oldest_fresh: float = time.time() - self.snippet_max_age_seconds
+        with self._lock:
+            row: Any = self._connection.execute(
+                "SELECT channel_id, title, description, image_url FROM channels "
+                "WHERE channel_id = ? AND refreshed_at >= ?",
+                (channel_id, oldest_fresh),
+            ).fetchone()
+            if row is None:
+                self._snippet_misses += 1
+                return None
+            self._snippet_hits += 1
+        return ChannelResponse(
+            channel_id=row[0],
+            title=row[1],
+            description=row[2],
+            url=f"https://www.youtube.com/channel/{row[0]}",
+            image_url=row[3],
+        )
+
+    def put(self, identifier: str, channel: ChannelResponse) -> None:
+        """Store a channel fetched from the API and what it was looked up by."""
+        now: float = time.time()
+        with self._lock:
+            if not self.is_channel_id(identifier):
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO channel_identifiers "
+                    "(identifier, channel_id, resolved_at) VALUES (?, ?, ?)",
+                    (self._normalize_identifier(identifier), channel.get_channel_id(), now),
+                )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO channels "
+                "(channel_id, title, description, image_url, refreshed_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    channel.get_channel_id(),
+                    channel.get_title(),
+                    channel.get_description(),
+                    channel.get_image_url(),
+                    now,
+                ),
+            )
+
+    def is_channel_id(self, identifier: str) -> bool:
+        """Return whether an identifier already is a channel id."""
+        return identifier.startswith("UC") and len(identifier) == 24
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return row counts and lookup hit counters."""
+        with self._lock:
+            identifier_count: int = self._connection.execute(
+                "SELECT COUNT(*) FROM channel_identifiers"
+            ).fetchone()[0]
+            channel_count: int = self._connection.execute(
+                "SELECT COUNT(*) FROM channels"
+            ).fetchone()[0]
+            return {
+                "identifiers": identifier_count,
+                "channels": channel_count,
+                "resolution_hits": self._resolution_hits,
+                "resolution_misses": self._resolution_misses,
+                "snippet_hits": self._snippet_hits,
+                "snippet_misses": self._snippet_misses,
+            }
+
+    def _normalize_identifier(self, identifier: str) -> str:
+        """Fold case, since handles and usernames are matched case-insensitively."""
+        return identifier.casefold()
@@ -0,0 +1,179 @@
+"""Module for ytpodcast.manager.download_job_manager."""
+
+import asyncio
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from contextlib import suppress
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from pathlib import Path
+from typing import Any
+
+from ytpodcast.model.service.download_job import DownloadJob
+from ytpodcast.model.service.download_job import DownloadJobStatus
+
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=too-many-instance-attributes
+class DownloadJobManager:
+    """Bounded queue of download jobs served by a fixed pool of worker threads.
+
+    Finished jobs are kept for retention_seconds so clients can poll their
+    outcome, then forgotten. Waiters are woken on their own event loop, so
+    waiting never holds a thread.
+    """
+
+    def __init__(self, worker_count: int, queue_size: int, retention_seconds: int = 3600) -> None:
+        """Store pool sizing; workers are started on the first submission."""
+        self.worker_count = max(worker_count, 1)
+        self.queue_size = max(queue_size, 1)
+        self.retention_seconds = max(retention_seconds, 0)
+        self._queue: queue.Queue[str] = queue.Queue(maxsize=self.queue_size)
+        self._lock = threading.Lock()
+        self._jobs: dict[str, DownloadJob] = {}
+        self._work: dict[str, Callable[[], Path]] = {}
+        self._waiters: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        self._workers: list[threading.Thread] = []
+
+    def submit(self, key: str, work: Callable[[], Path]) -> DownloadJob:
+        """Queue work for key, or return the job already pending for it.
+
+        Raises queue.Full when the queue has no room for a new job.
+        """
+        with self._lock:
+            self._ensure_workers()
+            self._remove_expired_jobs()
+            job: DownloadJob | None = self._jobs.get(key)
+            if job is not None and not job.is_finished():
+                return job.model_copy()
+            new_job: DownloadJob = DownloadJob(
+                key=key,
+                status=DownloadJobStatus.QUEUED,
+                created_at=self._now_utc(),
+            )
+            self._queue.put_nowait(key)
+            self._jobs[key] = new_job
+            self._work[key] = work
+            return new_job.model_copy()
+
+    def get_job(self, key: str) -> DownloadJob | None:
+        """Return a snapshot of the latest job for key."""
+        with self._lock:
+            job: DownloadJob | None = self._jobs.get(key)
+            return job.model_copy() if job is not None else None
+
+    async def wait(self, key: str, timeout_seconds: float) -> DownloadJob | None:
+        """Wait up to timeout_seconds for the job to finish and return it."""
+        if timeout_seconds <= 0:
+            return self.get_job(key)
+        waiter: tuple[asyncio.AbstractEventLoop, asyncio.Event] = (
+            asyncio.get_running_loop(),
+            asyncio.Event(),
+        )
+        with self._lock:
+            job: DownloadJob | None = self._jobs.get(key)
+            if job is None or job.is_finished():
+                return job.model_copy() if job is not None else None
+            self._waiters.setdefault(key, []).append(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout_seconds)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = (
+                    self._waiters.get(key, [])
+                )
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                if not waiters:
+                    self._waiters.pop(key, None)
+        return self.get_job(key)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return queue depth, pool size, and job counts by status."""
+        with self._lock:
+            self._remove_expired_jobs()
+            counts: dict[str, int] = {status.value: 0 for status in DownloadJobStatus}
+            for job in self._jobs.values():
+                counts[job.get_status().value] += 1
+            return {
+                "worker_count": self.worker_count,
+                "queue_size": self.queue_size,
+                "queued": self._queue.qsize(),
+                "jobs": counts,
+            }
+
+    def _ensure_workers(self) -> None:
+        """Start the worker pool if it is not running yet."""
+        if self._workers:
+            return
+        for index in range(self.worker_count):
+            worker = threading.Thread(
+                target=self._run_worker,
+                name=f"download-worker-{index}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _run_worker(self) -> None:
+        """Process queued jobs until the process exits."""
+        while True:
+            key: str = self._queue.get()
+            try:
+                self._run_job(key)
+            finally:
+                self._queue.task_done()
+
+    def _run_job(self, key: str) -> None:
+        """Execute a single job and record its outcome."""
+        with self._lock:
+            job: DownloadJob = self._jobs[key]
+            work: Callable[[], Path] = self._work.pop(key)
+            job.status = DownloadJobStatus.RUNNING
+            job.started_at = self._now_utc()
+        try:
+            path: Path = work()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.exception("Download job %s failed.", key)
+            with self._lock:
+                job.status = DownloadJobStatus.FAILED
+                job.error = str(exc) or exc.__class__.__name__
+                job.finished_at = self._now_utc()
+        else:
+            with self._lock:
+                job.status = DownloadJobStatus.COMPLETED
+                job.path = str(path)
+                job.finished_at = self._now_utc()
+        with self._lock:
+            waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = self._waiters.pop(
+                key,
+                [],
+            )
+        for loop, event in waiters:
+            # The waiter's loop may already be closed if its request went away.
+            with suppress(RuntimeError):
+                loop.call_soon_threadsafe(event.set)
+
+    def _remove_expired_jobs(self) -> None:
+        """Forget jobs finished more than retention_seconds ago; the caller holds the lock."""
+        oldest_kept: datetime = self._now_utc() - timedelta(seconds=self.retention_seconds)
+        expired_keys: list[str] = [
+            key
+            for key, job in self._jobs.items()
+            if job.is_finished()
+            and job.get_finished_at() is not None
+            and job.get_finished_at() <= oldest_kept
+        ]
+        for key in expired_keys:
+            del self._jobs[key]
+
+    def _now_utc(self) -> datetime:
+        """Return the current UTC timestamp."""
+        return datetime.now(timezone.utc)
@@ -0,0 +1,64 @@
+"""Module for ytpodcast.manager.download_journal_manager."""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from ytpodcast.helper.file_lock import FileLock
+
+
+class DownloadJournalManager:
+    """Journal of downloads in progress, shared between worker processes.
+
+    An entry is written when a download or live encode starts and removed
+    when it ends, successfully or not. An entry that is still present while
+    nobody holds its download lock belongs to a worker that died mid-job.
+    """
+
+    def __init__(self, journal_dir: str, lock_dir: str) -> None:
+        """Store journal and lock locations."""
+        self.journal_dir = Path(journal_dir)
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        self.lock_dir = Path(lock_dir)
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+
+    def begin(self, key: str, payload: dict[str, Any]) -> None:
+        """Record that the job for key has started."""
+        entry: dict[str, Any] = {
+            **payload,
+            "key": key,
+            "pid": os.getpid(),
+            "started_at": time.time(),
+        }
+        entry_path: Path = self._build_entry_path(key)
+        temp_path: Path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(entry), encoding="utf-8")
+        temp_path.replace(entry_path)
+
+    def end(self, key: str) -> None:
+        """Remove the entry for a job that has finished."""
+        self._build_entry_path(key).unlink(missing_ok=True)
+
+    def collect_interrupted(self) -> list[dict[str, Any]]:
+        """Remove and return the entries of jobs whose worker is gone."""
+        interrupted: list[dict[str, Any]] = []
+        for entry_path in sorted(self.journal_dir.glob("*.json")):
+            key: str = entry_path.stem
+            file_lock: FileLock = FileLock(self.lock_dir / f"{key}.lock")
+            if not file_lock.acquire(blocking=False):
+                continue
+            try:
+                entry: dict[str, Any] = json.loads(entry_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                entry = {"key": key}
+            finally:
+                entry_path.unlink(missing_ok=True)
+                file_lock.release()
+            interrupted.append(entry)
+        return interrupted
+
+    def _build_entry_path(self, key: str) -> Path:
+        """Return the journal entry path for a key."""
+        return self.journal_dir / f"{key}.json"
@@ -0,0 +1,140 @@
+"""Module for ytpodcast.manager.feed_cursor_manager."""
+
+import base64
+import json
+import threading
+from datetime import datetime
+from typing import Any
+
+from ytpodcast.manager.cache_manager import CacheManager
+from ytpodcast.model.service.feed_cursor import FeedCursor
+
+
+# Deep enough for ten thousand items at one checkpoint per full page.
+MAX_CHECKPOINTS = 200
+
+
+class FeedCursorManager:
+    """Remembered listing positions and opaque cursors for channel feeds.
+
+    Every feed collection remembers where each upstream page started in the
+    filtered listing, keyed by channel and filters, so a later request for
+    a deep offset resumes from the nearest checkpoint. Checkpoints live in
+    the shared file cache and expire after ttl_seconds, because new uploads
+    shift logical offsets against upstream positions.
+    """
+
+    def __init__(self, cache_manager: CacheManager, ttl_seconds: int) -> None:
+        """Store the checkpoint cache and its TTL."""
+        self.cache_manager = cache_manager
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._lookups: int = 0
+        self._resumed: int = 0
+        self._skipped_items: int = 0
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def find_nearest(
+        self,
+        channel_id: str,
+        from_date: datetime | None,
+        to_date: datetime | None,
+        include_shorts: bool,
+        offset: int,
+    ) -> FeedCursor | None:
+        """Return the deepest remembered checkpoint at or before offset."""
+        if self.ttl_seconds <= 0 or offset <= 0:
+            return None
+        checkpoints: list[FeedCursor] = self._load_checkpoints(
+            self._create_key(channel_id, from_date, to_date, include_shorts)
+        )
+        candidates: list[FeedCursor] = [
+            checkpoint for checkpoint in checkpoints if 0 < checkpoint.get_offset() <= offset
+        ]
+        nearest: FeedCursor | None = max(
+            candidates,
+            key=lambda checkpoint: checkpoint.get_offset(),
+            default=None,
+        )
+        with self._lock:
+            self._lookups += 1
+            if nearest is not None:
+                self._resumed += 1
+                self._skipped_items += nearest.get_offset()
+        return nearest
+
+    def remember(self, checkpoints: list[FeedCursor]) -> None:
+        """Merge listing positions of one channel query into the stored checkpoints."""
+        if self.ttl_seconds <= 0 or not checkpoints:
+            return
+        first: FeedCursor = checkpoints[0]
+        key: str = self._create_key(
+            first.get_channel_id(),
+            first.get_from_date(),
+            first.get_to_date(),
+            first.get_include_shorts(),
+        )
+        with self._lock:
+            merged: dict[int, FeedCursor] = {
+                checkpoint.get_offset(): checkpoint for checkpoint in self._load_checkpoints(key)
+            }
+            for checkpoint in checkpoints:
+                if checkpoint.get_offset() > 0:
+                    merged[checkpoint.get_offset()] = checkpoint.model_copy(update={"limit": None})
+            kept: list[FeedCursor] = [merged[offset] for offset in sorted(merged)][
+                -MAX_CHECKPOINTS:
+            ]
+            self.cache_manager.set(
+                key,
+                json.dumps([checkpoint.model_dump(mode="json") for checkpoint in kept]),
+                ttl_seconds=self.ttl_seconds,
+            )
+
+    def encode(self, cursor: FeedCursor) -> str:
+        """Serialize a cursor into an opaque URL-safe token."""
+        payload: bytes = cursor.model_dump_json(exclude_defaults=True).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+    def decode(self, token: str) -> FeedCursor:
+        """Parse a token created by encode, raising ValueError if it is malformed."""
+        try:
+            payload: bytes = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            return FeedCursor.model_validate_json(payload)
+        except ValueError as exc:
+            raise ValueError("Invalid feed cursor.") from exc
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return checkpoint lookup counters."""
+        with self._lock:
+            return {
+                "ttl_seconds": self.ttl_seconds,
+                "lookups": self._lookups,
+                "resumed": self._resumed,
+                "skipped_items": self._skipped_items,
+            }
+
+    def _load_checkpoints(self, key: str) -> list[FeedCursor]:
+        """Return the stored checkpoints of a channel query."""
+        cached_value: str | None = self.cache_manager.get(key)
+        if cached_value is None:
+            return []
+        try:
+            return [FeedCursor.model_validate(item) for item in json.loads(cached_value)]
+        except ValueError:
+            return []
+
+    def _create_key(
+        self,
+        channel_id: str,
+        from_date: datetime | None,
+        to_date: datetime | None,
+        include_shorts: bool,
+    ) -> str:
+        """Return the cache key of a channel query."""
+        return self.cache_manager.create_cache_key(
+            "feed_cursors",
+            channel_id,
+            from_date,
+            to_date,
+            include_shorts,
+        )
@@ -0,0 +1,383 @@
+"""Module for ytpodcast.manager.feed_refresh_manager."""
+
+import asyncio
+import logging
+import statistics
+import time
+import zlib
+from collections import OrderedDict
+from collections import deque
+from collections.abc import Awaitable
+from collections.abc import Callable
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+# Quota spent by proactive refreshes is limited over this rolling window.
+_BUDGET_WINDOW_SECONDS = 3600
+
+
+# pylint: disable=too-few-public-methods
+class _TrackedFeed:
+    """Feed requested recently, with how to rebuild it and when."""
+
+    def __init__(self, rebuild: Callable[[], Awaitable[Any]]) -> None:
+        """Initialize the schedule state."""
+        self.rebuild = rebuild
+        self.requested_at: float = time.time()
+        self.request_count: int = 0
+        self.next_run_at: float = 0.0
+        self.last_cost: int = 0
+        self.ttl_seconds: int | None = None
+
+
+# pylint: disable=too-many-instance-attributes
+class FeedRefreshManager:
+    """Freshness policy, background rebuilds and proactive refreshes of feeds.
+
+    A feed is fresh for ttl_seconds. For max_stale_seconds after that it is
+    still served at once while a background task rebuilds it, at most one
+    task per key and process. Up to stale_if_error_seconds after expiry the
+    last good feed is also served when a rebuild fails. Rebuilds run on the
+    serving event loop, so they share the pooled upstream client.
+
+    Feeds requested more than once within track_seconds are also rebuilt
+    before they expire, lead_seconds ahead plus a per-key offset of up to
+    stagger_seconds, so entries cached together do not all refresh at once.
+    At most max_tracked feeds are tracked, dropping the least recently
+    requested, so one-off query variants neither grow the set nor spend quota.
+    Proactive rebuilds stop while the quota they used over the last hour,
+    plus the last cost of the next feed, would exceed quota_budget_per_hour.
+    Costs are read from the process-wide quota counter around each rebuild,
+    so concurrent polls can make them look higher, never lower.
+
+    With adaptive_ttl, each feed gets its own TTL instead of ttl_seconds: a
+    ttl_gap_fraction of the median gap between its uploads, or of the time
+    since the last upload when that is longer, within min_ttl_seconds and
+    max_ttl_seconds. Feeds whose date range has closed get the maximum.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        ttl_seconds: int,
+        max_stale_seconds: int,
+        stale_if_error_seconds: int,
+        quota_usage: Callable[[], int] | None = None,
+        track_seconds: int = 0,
+        lead_seconds: int = 600,
+        stagger_seconds: int = 300,
+        quota_budget_per_hour: int = 1000,
+        interval_seconds: float = 30.0,
+        adaptive_ttl: bool = False,
+        min_ttl_seconds: int = 900,
+        max_ttl_seconds: int = 86400,
+        ttl_gap_fraction: float = 0.25,
+        max_tracked: int = 1000,
+    ) -> None:
+        """Store the freshness and scheduling policy and initialize counters."""
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self.stale_if_error_seconds = stale_if_error_seconds
+        self.quota_usage = quota_usage
+        self.track_seconds = track_seconds
+        self.lead_seconds = lead_seconds
+        self.stagger_seconds = stagger_seconds
+        self.quota_budget_per_hour = quota_budget_per_hour
+        self.interval_seconds = interval_seconds
+        self.adaptive_ttl = adaptive_ttl
+        self.min_ttl_seconds = min_ttl_seconds
+        self.max_ttl_seconds = max_ttl_seconds
+        self.ttl_gap_fraction = ttl_gap_fraction
+        self.max_tracked = max_tracked
+        self._tasks: dict[str, asyncio.Task[Any]] = {}
+        self._tracked: OrderedDict[str, _TrackedFeed] = OrderedDict()
+        self._spent: deque[list[float]] = deque()
+        self._scheduler: asyncio.Task[None] | None = None
+        self._stale_hits: int = 0
+        self._error_hits: int = 0
+        self._refreshes: int = 0
+        self._refresh_failures: int = 0
+        self._proactive_refreshes: int = 0
+        self._skipped_for_budget: int = 0
+        self._rebuilds: int = 0
+        self._fixed_ttl_rebuilds: float = 0.0
+        self._quota_units_saved: float = 0.0
+
+    def compute_ttl_seconds(
+        self,
+        published_at: list[datetime],
+        to_date: datetime | None = None,
+    ) -> int:
+        """Return how long a feed with these upload dates stays fresh."""
+        if not self.adaptive_ttl:
+            return self.ttl_seconds
+        now: float = time.time()
+        if to_date is not None and self._to_timestamp(to_date) < now:
+            return self.max_ttl_seconds
+        if not published_at:
+            return self.ttl_seconds
+        timestamps: list[float] = sorted(
+            (self._to_timestamp(value) for value in published_at),
+            reverse=True,
+        )
+        interval: float = max(now - timestamps[0], 0.0)
+        if len(timestamps) > 1:
+            gaps: list[float] = [
+                newer - older for newer, older in zip(timestamps, timestamps[1:])
+            ]
+            interval = max(statistics.median(gaps), interval)
+        ttl_seconds: int = int(interval * self.ttl_gap_fraction)
+        return min(max(ttl_seconds, self.min_ttl_seconds), self.max_ttl_seconds)
+
+    def get_quota_units_used(self) -> int:
+        """Return the quota units used by the process so far."""
+        return self.quota_usage() if self.quota_usage is not None else 0
+
+    def record_rebuild(self, key: str, ttl_seconds: int, quota_cost: int) -> None:
+        """Count a rebuild cached for ttl_seconds and plan its next refresh.
+
+        Over ttl_seconds the fixed TTL would have rebuilt the feed
+        ttl_seconds / self.ttl_seconds times at the same cost, which is
+        what the savings counters compare against. Without a fixed TTL
+        there is nothing to compare, so a rebuild counts as one.
+        """
+        fixed_ttl_rebuilds: float = (
+            ttl_seconds / self.ttl_seconds if self.ttl_seconds > 0 else 1.0
+        )
+        self._rebuilds += 1
+        self._fixed_ttl_rebuilds += fixed_ttl_rebuilds
+        self._quota_units_saved += (fixed_ttl_rebuilds - 1) * quota_cost
+        tracked: _TrackedFeed | None = self._tracked.get(key)
+        if tracked is not None:
+            tracked.ttl_seconds = ttl_seconds
+            tracked.next_run_at = self._plan_run_at(key, time.time() + ttl_seconds, ttl_seconds)
+
+    def get_retention_seconds(self) -> int:
+        """Return how long after expiry a cached feed can still be served."""
+        return max(self.max_stale_seconds, self.stale_if_error_seconds)
+
+    def schedule(self, key: str, rebuild: Callable[[], Awaitable[Any]]) -> bool:
+        """Serve a stale feed and rebuild it in the background.
+
+        Returns False when a rebuild of the key is already running.
+        """
+        self._stale_hits += 1
+        return self._start(key, rebuild, proactive=False)
+
+    def track(
+        self,
+        key: str,
+        rebuild: Callable[[], Awaitable[Any]],
+        expires_at: datetime | None,
+    ) -> None:
+        """Remember a requested feed so it is refreshed before it expires.
+
+        Without expires_at the feed is being built now and expires after a
+        full TTL.
+        """
+        if self.track_seconds <= 0 or self.max_tracked <= 0:
+            return
+        tracked: _TrackedFeed | None = self._tracked.get(key)
+        if tracked is None:
+            tracked = _TrackedFeed(rebuild)
+            self._tracked[key] = tracked
+            while len(self._tracked) > self.max_tracked:
+                self._tracked.popitem(last=False)
+        self._tracked.move_to_end(key)
+        tracked.rebuild = rebuild
+        tracked.requested_at = time.time()
+        tracked.request_count += 1
+        expires_at_value: float = (
+            expires_at.timestamp()
+            if expires_at is not None
+            else tracked.requested_at + (tracked.ttl_seconds or self.ttl_seconds)
+        )
+        tracked.next_run_at = self._plan_run_at(
+            key,
+            expires_at_value,
+            tracked.ttl_seconds or self.ttl_seconds,
+        )
+
+    def record_error_hit(self) -> None:
+        """Count a stale feed served because its rebuild failed."""
+        self._error_hits += 1
+
+    def start_scheduler(self) -> None:
+        """Run proactive refreshes periodically on the running event loop."""
+        if self._scheduler is not None or self.track_seconds <= 0:
+            return
+        self._scheduler = asyncio.get_running_loop().create_task(
+            self._run_scheduler(),
+            name="feed-refresh-scheduler",
+        )
+
+    def run_due(self) -> None:
+        """Start the proactive refreshes that are due and fit the budget."""
+        now: float = time.time()
+        for key, tracked in sorted(self._tracked.items(), key=lambda item: item[1].next_run_at):
+            if tracked.requested_at + self.track_seconds <= now:
+                del self._tracked[key]
+                continue
+            if tracked.next_run_at > now or key in self._tasks:
+                continue
+            if tracked.request_count < 2:
+                continue
+            if self._get_spent_quota(now) + tracked.last_cost > self.quota_budget_per_hour:
+                self._skipped_for_budget += 1
+                continue
+            # Until the rebuild reschedules it, retry after a full interval.
+            tracked.next_run_at = now + self.interval_seconds
+            self._start(key, tracked.rebuild, proactive=True)
+
+    async def aclose(self) -> None:
+        """Stop the scheduler and cancel running rebuilds."""
+        tasks: list[asyncio.Task[Any]] = list(self._tasks.values())
+        if self._scheduler is not None:
+            tasks.append(self._scheduler)
+            self._scheduler = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return the policy, the refresh queue and stale serving counters."""
+        now: float = time.time()
+        queue: list[dict[str, Any]] = [
+            {
+                "key": key,
+                "next_run_at": self._format_timestamp(tracked.next_run_at),
+                "requested_at": self._format_timestamp(tracked.requested_at),
+                "request_count": tracked.request_count,
+                "last_cost": tracked.last_cost,
+                "ttl_seconds": tracked.ttl_seconds,
+                "in_flight": key in self._tasks,
+            }
+            for key, tracked in sorted(
+                self._tracked.items(),
+                key=lambda item: item[1].next_run_at,
+            )
+        ]
+        return {
+            "ttl_seconds": self.ttl_seconds,
+            "max_stale_seconds": self.max_stale_seconds,
+            "stale_if_error_seconds": self.stale_if_error_seconds,
+            "quota_budget_per_hour": self.quota_budget_per_hour,
+            "max_tracked": self.max_tracked,
+            "quota_spent_last_hour": self._get_spent_quota(now),
+            "queue": queue,
+            "in_flight": len(self._tasks),
+            "stale_hits": self._stale_hits,
+            "error_hits": self._error_hits,
+            "refreshes": self._refreshes,
+            "refresh_failures": self._refresh_failures,
+            "proactive_refreshes": self._proactive_refreshes,
+            "skipped_for_budget": self._skipped_for_budget,
+            "adaptive_ttl": {
+                "enabled": self.adaptive_ttl,
+                "min_ttl_seconds": self.min_ttl_seconds,
+                "max_ttl_seconds": self.max_ttl_seconds,
+                "rebuilds": self._rebuilds,
+                "fixed_ttl_rebuilds": round(self._fixed_ttl_rebuilds, 2),
+                "rebuilds_saved": round(self._fixed_ttl_rebuilds - self._rebuilds, 2),
+                "quota_units_saved": round(self._quota_units_saved, 2),
+            },
+        }
+
+    def _start(self, key: str, rebuild: Callable[[], Awaitable[Any]], proactive: bool) -> bool:
+        """Start a rebuild task unless one is already running for the key."""
+        if key in self._tasks:
+            return False
+        task: asyncio.Task[Any] = asyncio.get_running_loop().create_task(
+            self._run(key, rebuild, proactive),
+            name=f"feed-refresh-{key[:12]}",
+        )
+        self._tasks[key] = task
+        return True
+
+    async def _run(
+        self,
+        key: str,
+        rebuild: Callable[[], Awaitable[Any]],
+        proactive: bool,
+    ) -> None:
+        """Run a rebuild, keeping the stale entry if it fails."""
+        quota_before: int = self.get_quota_units_used()
+        # Reserve the last known cost so refreshes started together share the budget.
+        tracked: _TrackedFeed | None = self._tracked.get(key)
+        spent: list[float] = [time.time(), tracked.last_cost if tracked is not None else 0]
+        if proactive:
+            self._spent.append(spent)
+        succeeded: bool = False
+        try:
+            await rebuild()
+            succeeded = True
+            self._refreshes += 1
+            if proactive:
+                self._proactive_refreshes += 1
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Any failure keeps the stale entry; cancellation still propagates.
+            self._refresh_failures += 1
+            logger.warning("Background feed refresh failed for key %s.", key, exc_info=True)
+        finally:
+            self._tasks.pop(key, None)
+            self._record_run(key, quota_before, succeeded, proactive, spent)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def _record_run(
+        self,
+        key: str,
+        quota_before: int,
+        succeeded: bool,
+        proactive: bool,
+        spent: list[float],
+    ) -> None:
+        """Record the cost of a rebuild and plan the next proactive one."""
+        now: float = time.time()
+        cost: int = self.get_quota_units_used() - quota_before
+        spent[1] = cost
+        tracked: _TrackedFeed | None = self._tracked.get(key)
+        if tracked is None:
+            return
+        tracked.last_cost = cost
+        if not succeeded and proactive:
+            # Leave a failing feed to stale serving instead of retrying every tick.
+            tracked.next_run_at = now + self.lead_seconds
+
+    async def _run_scheduler(self) -> None:
+        """Start due refreshes forever at the configured interval."""
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            self.run_due()
+
+    def _plan_run_at(self, key: str, expires_at: float, ttl_seconds: int) -> float:
+        """Return when to refresh an entry expiring at expires_at.
+
+        Lead and stagger are each capped at a quarter of the TTL, so short
+        TTLs are not refreshed right after they are built.
+        """
+        lead: float = min(self.lead_seconds, ttl_seconds / 4)
+        stagger_window: float = min(self.stagger_seconds, ttl_seconds / 4)
+        stagger: float = 0.0
+        if stagger_window > 0:
+            stagger = zlib.crc32(key.encode("utf-8")) % 1000 / 1000 * stagger_window
+        return expires_at - lead - stagger
+
+    def _get_spent_quota(self, now: float) -> int:
+        """Return the quota used by proactive refreshes over the budget window."""
+        while self._spent and self._spent[0][0] <= now - _BUDGET_WINDOW_SECONDS:
+            self._spent.popleft()
+        return int(sum(cost for _, cost in self._spent))
+
+    def _to_timestamp(self, value: datetime) -> float:
+        """Convert a datetime into UTC epoch seconds, treating naive values as UTC."""
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+
+    def _format_timestamp(self, value: float) -> str:
+        """Format epoch seconds as an ISO 8601 UTC timestamp."""
+        return datetime.fromtimestamp(value, tz=timezone.utc).isoformat()
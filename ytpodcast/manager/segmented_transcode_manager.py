@@ -0,0 +1,233 @@
+"""Module for ytpodcast.manager.segmented_transcode_manager."""
+
+import math
+import os
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from ytpodcast.model.service.audio_output_policy import AudioOutputCodec
+from ytpodcast.model.service.audio_output_policy import AudioOutputPolicy
+
+
+DEFAULT_SAMPLE_RATE = 48000
+
+# codec -> (raw segment muxer, samples per encoded frame, extra encoder arguments)
+_SEGMENT_FORMATS: dict[AudioOutputCodec, tuple[str, int, tuple[str, ...]]] = {
+    AudioOutputCodec.MP3: ("mp3", 1152, ("-reservoir", "0", "-write_xing", "0")),
+    AudioOutputCodec.AAC: ("adts", 1024, ()),
+}
+
+
+class TranscodeSegment(NamedTuple):
+    """Frame-aligned slice of the source, in encoded frames."""
+
+    start_frame: int
+    frame_count: int | None
+    preroll_frames: int
+
+
+# pylint: disable=too-many-instance-attributes
+class SegmentedTranscodeManager:
+    """Encode long sources as parallel segments joined without re-encoding.
+
+    Every segment starts a few frames early so the encoder is warmed up when
+    the kept audio begins, and all boundaries fall on encoded frame edges.
+    The pre-roll frames are dropped with a stream copy, so every segment
+    carries the same encoder delay and the joined file plays without gaps.
+    Segment encodes are separate ffmpeg processes run from a shared pool, so
+    concurrent downloads never run more encoders than there are workers.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        ffmpeg_executable_path: str,
+        min_duration_seconds: int,
+        worker_count: int | None = None,
+        min_segment_seconds: int = 120,
+        preroll_seconds: float = 2.0,
+    ) -> None:
+        """Store segmenting settings and create the encoder pool."""
+        self.ffmpeg_executable_path = ffmpeg_executable_path
+        self.min_duration_seconds = min_duration_seconds
+        self.worker_count = max(worker_count or os.cpu_count() or 1, 1)
+        self.min_segment_seconds = min_segment_seconds
+        self.preroll_seconds = preroll_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.worker_count,
+            thread_name_prefix="segmented-transcode",
+        )
+        self._lock = threading.Lock()
+        self._total_transcodes: int = 0
+        self._total_segments: int = 0
+
+    def supports(self, output_policy: AudioOutputPolicy, duration_seconds: float | None) -> bool:
+        """Return whether a source is long enough and its codec can be segmented."""
+        if self.min_duration_seconds <= 0 or self.worker_count < 2 or not duration_seconds:
+            return False
+        if output_policy.get_codec() not in _SEGMENT_FORMATS:
+            return False
+        return duration_seconds >= self.min_duration_seconds
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    def transcode(
+        self,
+        source_path: Path,
+        output_path: Path,
+        output_policy: AudioOutputPolicy,
+        codec_arguments: list[str],
+        duration_seconds: float,
+        sample_rate: int | None = None,
+    ) -> None:
+        """Encode source_path into output_path using parallel segments."""
+        muxer, frame_samples, extra_arguments = _SEGMENT_FORMATS[output_policy.get_codec()]
+        rate: int = sample_rate or DEFAULT_SAMPLE_RATE
+        segments: list[TranscodeSegment] = self.plan_segments(
+            duration_seconds,
+            rate,
+            frame_samples,
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir_path: Path = Path(temp_dir)
+            futures = [
+                self._executor.submit(
+                    self._encode_segment,
+                    source_path,
+                    temp_dir_path / f"segment_{index:04d}.{muxer}",
+                    segment,
+                    [*codec_arguments, *extra_arguments, "-ar", str(rate)],
+                    muxer,
+                    rate,
+                    frame_samples,
+                )
+                for index, segment in enumerate(segments)
+            ]
+            segment_paths: list[Path] = [future.result() for future in futures]
+            list_path: Path = temp_dir_path / "segments.txt"
+            list_path.write_text(
+                "".join(f"file '{path.as_posix()}'\n" for path in segment_paths),
+                encoding="utf-8",
+            )
+            self._run(
+                [
+                    self.ffmpeg_executable_path,
+                    "-y",
+                    "-hide_banner",
+                    "-loglevel",
+                    "error",
+                    "-f",
+                    "concat",
+                    "-safe",
+                    "0",
+                    "-i",
+                    str(list_path),
+                    "-c",
+                    "copy",
+                    str(output_path),
+                ]
+            )
+        with self._lock:
+            self._total_transcodes += 1
+            self._total_segments += len(segments)
+
+    def plan_segments(
+        self,
+        duration_seconds: float,
+        sample_rate: int,
+        frame_samples: int,
+    ) -> list[TranscodeSegment]:
+        """Split a duration into contiguous, frame-aligned segments."""
+        total_frames: int = math.ceil(duration_seconds * sample_rate / frame_samples)
+        min_segment_frames: int = max(
+            math.ceil(self.min_segment_seconds * sample_rate / frame_samples),
+            1,
+        )
+        segment_count: int = max(min(self.worker_count, total_frames // min_segment_frames), 1)
+        segment_frames: int = math.ceil(total_frames / segment_count)
+        preroll_frames: int = math.ceil(self.preroll_seconds * sample_rate / frame_samples)
+        segments: list[TranscodeSegment] = []
+        for index in range(segment_count):
+            start_frame: int = index * segment_frames
+            if start_frame >= total_frames:
+                break
+            is_last: bool = index == segment_count - 1
+            segments.append(
+                TranscodeSegment(
+                    start_frame=start_frame,
+                    frame_count=None if is_last else segment_frames,
+                    preroll_frames=min(preroll_frames, start_frame),
+                )
+            )
+        return segments
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return transcode counters."""
+        with self._lock:
+            return {
+                "worker_count": self.worker_count,
+                "min_duration_seconds": self.min_duration_seconds,
+                "total_transcodes": self._total_transcodes,
+                "total_segments": self._total_segments,
+            }
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def _encode_segment(
+        self,
+        source_path: Path,
+        segment_path: Path,
+        segment: TranscodeSegment,
+        encoder_arguments: list[str],
+        muxer: str,
+        sample_rate: int,
+        frame_samples: int,
+    ) -> Path:
+        """Encode one segment with its pre-roll, then cut the pre-roll away."""
+        frame_seconds: float = frame_samples / sample_rate
+        encode_start: float = (segment.start_frame - segment.preroll_frames) * frame_seconds
+        raw_path: Path = segment_path.with_name(f"raw_{segment_path.name}")
+        encode_command: list[str] = [
+            self.ffmpeg_executable_path,
+            "-y",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-ss",
+            f"{encode_start:.6f}",
+            "-i",
+            str(source_path),
+            "-vn",
+        ]
+        if segment.frame_count is not None:
+            encode_frames: int = segment.preroll_frames + segment.frame_count
+            encode_command.extend(["-t", f"{encode_frames * frame_seconds:.6f}"])
+        encode_command.extend([*encoder_arguments, "-f", muxer, str(raw_path)])
+        self._run(encode_command)
+
+        # Cut half a frame early on both ends so rounding never moves a boundary.
+        trim_start: float = max(segment.preroll_frames - 0.5, 0) * frame_seconds
+        trim_command: list[str] = [
+            self.ffmpeg_executable_path,
+            "-y",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-i",
+            str(raw_path),
+        ]
+        if trim_start > 0:
+            trim_command.extend(["-ss", f"{trim_start:.6f}"])
+        if segment.frame_count is not None:
+            trim_end: float = (segment.preroll_frames + segment.frame_count - 0.5) * frame_seconds
+            trim_command.extend(["-t", f"{trim_end - trim_start:.6f}"])
+        trim_command.extend(["-c", "copy", "-f", muxer, str(segment_path)])
+        self._run(trim_command)
+        raw_path.unlink(missing_ok=True)
+        return segment_path
+
+    def _run(self, command: list[str]) -> None:
+        """Run an ffmpeg command, raising on failure."""
+        subprocess.run(command, check=True, capture_output=True)
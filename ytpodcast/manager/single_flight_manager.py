@@ -0,0 +1,96 @@
+"""Module for ytpodcast.manager.single_flight_manager."""
+
+import threading
+from collections.abc import Callable
+from datetime import datetime
+from datetime import timezone
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+from ytpodcast.helper.file_lock import FileLock
+
+
+T = TypeVar("T")
+
+
+# pylint: disable=too-few-public-methods
+class _Flight(Generic[T]):
+    """In-flight execution shared by every caller of the same key."""
+
+    def __init__(self) -> None:
+        """Initialize the completion state."""
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+        self.waiters: int = 0
+        self.started_at: datetime = datetime.now(timezone.utc)
+
+
+class SingleFlightManager:
+    """Coalesce concurrent work on the same key into a single execution.
+
+    Callers in the same process share one in-memory flight. Callers in other
+    processes are serialized by an exclusive lock file, so the leader of each
+    process runs the work only after the previous holder has finished.
+    """
+
+    def __init__(self, lock_dir: str) -> None:
+        """Store the lock directory and initialize flight tracking."""
+        self.lock_dir = Path(lock_dir)
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight[Any]] = {}
+        self._total_flights: int = 0
+        self._total_joined: int = 0
+
+    def run(self, key: str, work: Callable[[], T]) -> T:
+        """Run work once per key and share the result with concurrent callers."""
+        with self._lock:
+            flight: _Flight[Any] | None = self._flights.get(key)
+            is_leader: bool = flight is None
+            if flight is None:
+                flight = _Flight()
+                self._flights[key] = flight
+                self._total_flights += 1
+            else:
+                flight.waiters += 1
+                self._total_joined += 1
+
+        if not is_leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            with self._acquire_file_lock(key):
+                flight.result = work()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+        return flight.result
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return in-flight jobs with their joined waiter counts."""
+        with self._lock:
+            in_flight: list[dict[str, Any]] = [
+                {
+                    "key": key,
+                    "waiters": flight.waiters,
+                    "started_at": flight.started_at.isoformat(),
+                }
+                for key, flight in self._flights.items()
+            ]
+            return {
+                "in_flight": in_flight,
+                "total_flights": self._total_flights,
+                "total_joined": self._total_joined,
+            }
+
+    def _acquire_file_lock(self, key: str) -> FileLock:
+        """Return a context manager holding the cross-process lock for key."""
+        return FileLock(self.lock_dir / f"{key}.lock")
@@ -0,0 +1,129 @@
+"""Module for ytpodcast.manager.video_metadata_manager."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from ytpodcast.helper.sqlite_database import open_sqlite_database
+from ytpodcast.model.client.ytapi.video_response import VideoResponse
+
+
+# SQLite caps bound parameters per statement; stay well below it.
+_QUERY_BATCH_SIZE = 500
+
+
+class VideoMetadataManager:
+    """Persistent store of video metadata keyed by video id.
+
+    Duration and channel never change once a video is published, so they
+    are kept forever. Title and description can be edited and count as
+    fresh only for max_age_seconds; callers that need only the structural
+    fields can read stale rows. Rows live in a single SQLite table in WAL
+    mode, so they are shared by worker processes and survive restarts.
+    """
+
+    def __init__(self, database_path: str, max_age_seconds: int) -> None:
+        """Open the database and create the schema if needed."""
+        self.database_path = Path(database_path)
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._connection = open_sqlite_database(self.database_path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS videos ("
+            "video_id TEXT PRIMARY KEY, "
+            "channel_id TEXT NOT NULL, "
+            "duration_seconds INTEGER NOT NULL, "
+            "title TEXT NOT NULL, "
+            "description TEXT NOT NULL, "
+            "refreshed_at REAL NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self._hits: int = 0
+        self._stale_hits: int = 0
+        self._misses: int = 0
+
+    def get_many(
+        self,
+        video_ids: list[str],
+        structural_only: bool = False,
+    ) -> dict[str, VideoResponse]:
+        """Return stored videos keyed by id.
+
+        Unless structural_only is set, rows whose title and description are
+        older than max_age_seconds are left out so they get refreshed.
+        """
+        unique_ids: list[str] = list(dict.fromkeys(video_ids))
+        oldest_fresh: float = time.time() - self.max_age_seconds
+        videos: dict[str, VideoResponse] = {}
+        hits: int = 0
+        stale_hits: int = 0
+        with self._lock:
+            for start in range(0, len(unique_ids), _QUERY_BATCH_SIZE):
+                batch_ids: list[str] = unique_ids[start : start + _QUERY_BATCH_SIZE]
+                placeholders: str = ",".join("?" for _ in batch_ids)
+                rows: list[Any] = self._connection.execute(
+                    "SELECT video_id, channel_id, duration_seconds, title, description, "
+                    f"refreshed_at FROM videos WHERE video_id IN ({placeholders})",
+                    batch_ids,
+                ).fetchall()
+                for row in rows:
+                    is_fresh: bool = row[5] >= oldest_fresh
+                    if not is_fresh and not structural_only:
+                        continue
+                    if is_fresh:
+                        hits += 1
+                    else:
+                        stale_hits += 1
+                    videos[row[0]] = self._create_video_response(row)
+            self._hits += hits
+            self._stale_hits += stale_hits
+            self._misses += len(unique_ids) - len(videos)
+        return videos
+
+    def put_many(self, videos: list[VideoResponse]) -> None:
+        """Store or refresh videos fetched from the API."""
+        if not videos:
+            return
+        refreshed_at: float = time.time()
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO videos (video_id, channel_id, duration_seconds, "
+                "title, description, refreshed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        video.get_video_id(),
+                        video.get_channel_id(),
+                        video.get_duration_seconds(),
+                        video.get_title(),
+                        video.get_description(),
+                        refreshed_at,
+                    )
+                    for video in videos
+                ],
+            )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return row count and lookup hit rates."""
+        with self._lock:
+            row_count: int = self._connection.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
+            lookups: int = self._hits + self._stale_hits + self._misses
+            return {
+                "videos": row_count,
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "hit_rate": (self._hits + self._stale_hits) / lookups if lookups else 0.0,
+            }
+
+    def _create_video_response(self, row: Any) -> VideoResponse:
+        """Build a video payload from a stored row."""
+        video_id, channel_id, duration_seconds, title, description, _ = row
+        return VideoResponse(
+            video_id=video_id,
+            title=title,
+            description=description,
+            duration_seconds=duration_seconds,
+            url=f"https://www.youtube.com/watch?v={video_id}",
+            channel_id=channel_id,
+        )
@@ -24,7 +24,18 @@ class VideoResponseMapper:
         if not items:
             raise ValueError(f"Video not found for id '{video_id}'.")
 
-        item = items[0]
+        return self._create_from_item(items[0], video_id)
+
+    def create_list_from_video_list_response(
+        self,
+        response: VideoListResponse,
+    ) -> list[VideoResponse]:
+        """Convert every item of a video list response into a VideoResponse."""
+        items: list[Any] = response.items or []
+        return [self._create_from_item(item, item.id) for item in items if item.id]
+
+    def _create_from_item(self, item: Any, video_id: str) -> VideoResponse:
+        """Convert a single video item into a VideoResponse."""
         snippet = item.snippet
         content_details = item.contentDetails
         duration_seconds: int = self._parse_duration_seconds(content_details.duration)
@@ -1,8 +1,10 @@
 """Module for ytpodcast.mapper.controller.file_response_mapper."""
 
+from collections.abc import Iterator
 from pathlib import Path
 
 from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
 from ytpodcast.helper.file_helper import FileHelper
 
@@ -23,3 +25,8 @@ class FileResponseMapper:
             media_type=media_type,
             filename=download_path.name,
         )
+
+    def create_from_stream(self, chunks: Iterator[bytes], extension: str) -> StreamingResponse:
+        """Convert a live audio byte stream into a chunked response."""
+        media_type: str = self.file_helper.resolve_media_type_for_extension(extension)
+        return StreamingResponse(chunks, media_type=media_type)
@@ -0,0 +1,24 @@
+"""Module for ytpodcast.mapper.controller.get_download_job_response_mapper."""
+
+from ytpodcast.model.controller.get_download_job_response import GetDownloadJobResponse
+from ytpodcast.model.service.download_job import DownloadJob
+
+
+# pylint: disable=too-few-public-methods
+class GetDownloadJobResponseMapper:
+    """Build download job response payloads from service models."""
+
+    def create_from_download_job(
+        self,
+        video_id: str,
+        download_job: DownloadJob,
+        retry_after_seconds: int,
+    ) -> GetDownloadJobResponse:
+        """Convert a download job into a response payload."""
+        return GetDownloadJobResponse(
+            video_id=video_id,
+            status=download_job.get_status().value,
+            created_at=download_job.get_created_at(),
+            started_at=download_job.get_started_at(),
+            retry_after_seconds=retry_after_seconds,
+        )
@@ -8,23 +8,45 @@ from xml.etree import ElementTree
 from injector import inject
 
 from ytpodcast.config.app_config import AppConfig
+from ytpodcast.helper.file_helper import FileHelper
+from ytpodcast.model.service.audio_output_policy import AudioOutputPolicy
 from ytpodcast.model.service.channel_feed import ChannelFeed
 from ytpodcast.model.service.feed_item import FeedItem
 
 
+ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
+
+
 # pylint: disable=too-few-public-methods
 class RssFeedResponseMapper:
     """Build RSS XML responses from channel feeds."""
 
     @inject  # type: ignore[reportUntypedFunctionDecorator]
-    def __init__(self, app_config: AppConfig) -> None:
+    def __init__(
+        self,
+        app_config: AppConfig,
+        output_policy: AudioOutputPolicy,
+        file_helper: FileHelper,
+    ) -> None:
         """Store configuration for RSS rendering."""
         self.app_config = app_config
+        self.output_policy = output_policy
+        self.file_helper = file_helper
 
     def create_from_feed(self, feed: ChannelFeed) -> str:
         """Serialize a channel feed into RSS XML."""
         rss_element: ElementTree.Element = ElementTree.Element("rss", version="2.0")
         channel_element: ElementTree.Element = ElementTree.SubElement(rss_element, "channel")
+        next_cursor: str | None = feed.get_next_cursor()
+        if next_cursor is not None:
+            # RFC 5005 paged feed link to the next, older page.
+            rss_element.set("xmlns:atom", ATOM_NAMESPACE)
+            ElementTree.SubElement(
+                channel_element,
+                "atom:link",
+                rel="next",
+                href=self._build_next_page_url(feed, next_cursor),
+            )
 
         ElementTree.SubElement(channel_element, "title").text = feed.get_title()
         ElementTree.SubElement(channel_element, "link").text = feed.get_url()
@@ -38,6 +60,9 @@ class RssFeedResponseMapper:
             ElementTree.SubElement(image_element, "title").text = feed.get_title()
             ElementTree.SubElement(image_element, "link").text = feed.get_url()
 
+        enclosure_type: str = self.file_helper.resolve_media_type_for_extension(
+            self.output_policy.get_extension()
+        )
         feed_items: list[FeedItem] = feed.get_items()
         if feed_items:
             latest_item: FeedItem = max(
@@ -66,7 +91,7 @@ class RssFeedResponseMapper:
                 item_element,
                 "enclosure",
                 url=self._build_media_url(item),
-                type="audio/mpeg",
+                type=enclosure_type,
             )
 
         xml_body: str = ElementTree.tostring(rss_element, encoding="unicode")
@@ -80,6 +105,11 @@ class RssFeedResponseMapper:
         normalized_value = normalized_value.astimezone(timezone.utc)
         return format_datetime(normalized_value)
 
+    def _build_next_page_url(self, feed: ChannelFeed, next_cursor: str) -> str:
+        """Build the feed URL of the page after this one."""
+        base_url: str = self.app_config.api_base_url.rstrip("/")
+        return f"{base_url}/feeds/{feed.get_channel_id()}/xml?cursor={next_cursor}"
+
     def _build_media_url(self, item: FeedItem) -> str:
         """Build the download URL for the feed item media."""
         base_url: str = self.app_config.api_base_url.rstrip("/")
@@ -0,0 +1,20 @@
+"""Module for ytpodcast.model.client.ytdl.audio_download_response."""
+
+from pydantic import BaseModel
+
+from ytpodcast.model.client.ytdl.audio_format_response import AudioFormatResponse
+
+
+class AudioDownloadResponse(BaseModel):
+    """Result of a yt-dlp download with the format it resolved to."""
+
+    path: str
+    audio_format: AudioFormatResponse | None = None
+
+    def get_path(self) -> str:
+        """Return the path of the served audio file."""
+        return self.path
+
+    def get_audio_format(self) -> AudioFormatResponse | None:
+        """Return the downloaded source format, if a download ran."""
+        return self.audio_format
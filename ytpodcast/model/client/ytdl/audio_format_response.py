@@ -12,6 +12,7 @@ class AudioFormatResponse(BaseModel):
     is_audio_only: bool
     language: str | None = None
     note: str | None = None
+    file_size_bytes: int | None = None
 
     def get_format_id(self) -> str:
         """Return the format id for the audio payload."""
@@ -36,3 +37,7 @@ class AudioFormatResponse(BaseModel):
     def get_note(self) -> str | None:
         """Return the format note, if any."""
         return self.note
+
+    def get_file_size_bytes(self) -> int | None:
+        """Return the exact or approximate download size, if known."""
+        return self.file_size_bytes
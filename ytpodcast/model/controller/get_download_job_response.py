@@ -0,0 +1,35 @@
+"""Module for ytpodcast.model.controller.get_download_job_response."""
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class GetDownloadJobResponse(BaseModel):
+    """Response payload for pending download jobs."""
+
+    video_id: str
+    status: str
+    created_at: datetime
+    started_at: datetime | None
+    retry_after_seconds: int
+
+    def get_video_id(self) -> str:
+        """Return the video identifier."""
+        return self.video_id
+
+    def get_status(self) -> str:
+        """Return the job status."""
+        return self.status
+
+    def get_created_at(self) -> datetime:
+        """Return the creation timestamp."""
+        return self.created_at
+
+    def get_started_at(self) -> datetime | None:
+        """Return the start timestamp, if started."""
+        return self.started_at
+
+    def get_retry_after_seconds(self) -> int:
+        """Return the suggested polling delay in seconds."""
+        return self.retry_after_seconds
@@ -0,0 +1,18 @@
+"""Module for ytpodcast.model.service.audio_format_preference."""
+
+from pydantic import BaseModel
+
+
+class AudioFormatPreference(BaseModel):
+    """Preferences used to pick the source audio format of a download."""
+
+    preferred_languages: list[str] = ["it"]
+    max_bitrate_kbps: int | None = None
+
+    def get_preferred_languages(self) -> list[str]:
+        """Return language tags in order of preference."""
+        return self.preferred_languages
+
+    def get_max_bitrate_kbps(self) -> int | None:
+        """Return the preferred bitrate ceiling in kbps, if any."""
+        return self.max_bitrate_kbps
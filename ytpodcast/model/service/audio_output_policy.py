@@ -0,0 +1,79 @@
+"""Module for ytpodcast.model.service.audio_output_policy."""
+
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class AudioOutputMode(str, Enum):
+    """How downloaded audio is turned into the served file."""
+
+    PASSTHROUGH = "passthrough"
+    REMUX = "remux"
+    TRANSCODE = "transcode"
+
+
+class AudioOutputCodec(str, Enum):
+    """Codecs the served audio can be delivered in."""
+
+    MP3 = "mp3"
+    AAC = "aac"
+    OPUS = "opus"
+
+
+# codec -> (served extension, ffmpeg encoder, streaming muxer, source extensions with the codec)
+_CODEC_DETAILS: dict[AudioOutputCodec, tuple[str, str, str, tuple[str, ...]]] = {
+    AudioOutputCodec.MP3: ("mp3", "libmp3lame", "mp3", ("mp3",)),
+    AudioOutputCodec.AAC: ("m4a", "aac", "mp4", ("m4a", "mp4", "aac")),
+    AudioOutputCodec.OPUS: ("opus", "libopus", "ogg", ("opus", "webm", "ogg")),
+}
+
+
+class AudioOutputPolicy(BaseModel):
+    """Output policy applied to downloaded audio before it is served.
+
+    Passthrough keeps the downloaded file when it already has the served
+    extension, remux copies a compatible stream into the served container,
+    and transcode always re-encodes. Passthrough and remux fall back to the
+    next cheaper step when the source codec does not match.
+    """
+
+    mode: AudioOutputMode = AudioOutputMode.TRANSCODE
+    codec: AudioOutputCodec = AudioOutputCodec.MP3
+    bitrate_kbps: int | None = None
+
+    def get_mode(self) -> AudioOutputMode:
+        """Return the output mode."""
+        return self.mode
+
+    def get_codec(self) -> AudioOutputCodec:
+        """Return the output codec."""
+        return self.codec
+
+    def get_bitrate_kbps(self) -> int | None:
+        """Return the transcode bitrate in kbps, if set."""
+        return self.bitrate_kbps
+
+    def get_variant_name(self) -> str:
+        """Return the name that tells apart outputs of the same video."""
+        return f"{self.mode.value}-{self.bitrate_kbps or 'auto'}"
+
+    def get_extension(self) -> str:
+        """Return the extension of the served file."""
+        return _CODEC_DETAILS[self.codec][0]
+
+    def get_encoder(self) -> str:
+        """Return the ffmpeg encoder used when transcoding."""
+        return _CODEC_DETAILS[self.codec][1]
+
+    def get_stream_muxer(self) -> str:
+        """Return the ffmpeg muxer used when streaming to a pipe."""
+        return _CODEC_DETAILS[self.codec][2]
+
+    def get_source_extensions(self) -> tuple[str, ...]:
+        """Return downloaded extensions that already carry the output codec."""
+        return _CODEC_DETAILS[self.codec][3]
+
+    def is_source_compatible(self, source_extension: str) -> bool:
+        """Return whether a source can be served without re-encoding."""
+        return source_extension.lower().lstrip(".") in self.get_source_extensions()
@@ -0,0 +1,30 @@
+"""Module for ytpodcast.model.service.cache_entry_header."""
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class CacheEntryHeader(BaseModel):
+    """Validators of a cache entry, stored apart so they load without the value."""
+
+    expires_at: datetime
+    etag: str
+    last_modified: datetime | None = None
+    content_encodings: list[str] = []
+
+    def get_expires_at(self) -> datetime:
+        """Return the expiration timestamp."""
+        return self.expires_at
+
+    def get_etag(self) -> str:
+        """Return the strong entity tag of the cached value."""
+        return self.etag
+
+    def get_last_modified(self) -> datetime | None:
+        """Return when the cached content last changed."""
+        return self.last_modified
+
+    def get_content_encodings(self) -> list[str]:
+        """Return the encodings the value is also stored compressed in."""
+        return self.content_encodings
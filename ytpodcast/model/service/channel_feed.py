@@ -15,6 +15,7 @@ class ChannelFeed(BaseModel):
     author: str
     image_url: str
     items: list[FeedItem]
+    next_cursor: str | None = None
 
     def get_channel_id(self) -> str:
         """Return the channel identifier."""
@@ -43,3 +44,7 @@ class ChannelFeed(BaseModel):
     def get_items(self) -> list[FeedItem]:
         """Return the feed items."""
         return self.items
+
+    def get_next_cursor(self) -> str | None:
+        """Return the opaque cursor of the next page, if there may be one."""
+        return self.next_cursor
@@ -0,0 +1,59 @@
+"""Module for ytpodcast.model.service.download_job."""
+
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class DownloadJobStatus(str, Enum):
+    """Lifecycle states of a download job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class DownloadJob(BaseModel):
+    """Domain model for a queued audio download."""
+
+    key: str
+    status: DownloadJobStatus
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    path: str | None = None
+    error: str | None = None
+
+    def get_key(self) -> str:
+        """Return the job key."""
+        return self.key
+
+    def get_status(self) -> DownloadJobStatus:
+        """Return the job status."""
+        return self.status
+
+    def get_created_at(self) -> datetime:
+        """Return the creation timestamp."""
+        return self.created_at
+
+    def get_started_at(self) -> datetime | None:
+        """Return the start timestamp, if started."""
+        return self.started_at
+
+    def get_finished_at(self) -> datetime | None:
+        """Return the completion timestamp, if finished."""
+        return self.finished_at
+
+    def get_path(self) -> str | None:
+        """Return the downloaded file path, if completed."""
+        return self.path
+
+    def get_error(self) -> str | None:
+        """Return the failure message, if failed."""
+        return self.error
+
+    def is_finished(self) -> bool:
+        """Return whether the job reached a terminal state."""
+        return self.status in (DownloadJobStatus.COMPLETED, DownloadJobStatus.FAILED)
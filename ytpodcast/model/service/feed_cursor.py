@@ -0,0 +1,57 @@
+"""Module for ytpodcast.model.service.feed_cursor."""
+
+from datetime import datetime
+
+from pydantic import BaseModel
+from pydantic import Field
+
+
+class FeedCursor(BaseModel):
+    """Position in the filtered video listing of a channel feed.
+
+    The position is a logical offset into the filtered listing together with
+    the upstream page token and the index inside that page where the item
+    at that offset was listed, so collection can resume without paging from
+    the newest upload again.
+    """
+
+    channel_id: str
+    limit: int | None = Field(default=None, ge=1)
+    from_date: datetime | None = None
+    to_date: datetime | None = None
+    include_shorts: bool = True
+    offset: int = Field(default=0, ge=0)
+    page_token: str | None = None
+    page_position: int = Field(default=0, ge=0)
+
+    def get_channel_id(self) -> str:
+        """Return the channel identifier."""
+        return self.channel_id
+
+    def get_limit(self) -> int | None:
+        """Return the page size requested by the client."""
+        return self.limit
+
+    def get_from_date(self) -> datetime | None:
+        """Return the lower publish date bound."""
+        return self.from_date
+
+    def get_to_date(self) -> datetime | None:
+        """Return the upper publish date bound."""
+        return self.to_date
+
+    def get_include_shorts(self) -> bool:
+        """Return whether shorts are part of the listing."""
+        return self.include_shorts
+
+    def get_offset(self) -> int:
+        """Return the logical offset into the filtered listing."""
+        return self.offset
+
+    def get_page_token(self) -> str | None:
+        """Return the upstream page token to resume from."""
+        return self.page_token
+
+    def get_page_position(self) -> int:
+        """Return the index inside the upstream page to resume from."""
+        return self.page_position
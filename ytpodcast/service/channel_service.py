@@ -22,7 +22,7 @@ class ChannelService:
         self.yt_api_client = yt_api_client
         self.yt_api_mapper = yt_api_mapper
 
-    def get_channel(self, identifier: str) -> Channel:
+    async def get_channel(self, identifier: str) -> Channel:
         """Fetch and map channel data by identifier."""
-        channel_response: ChannelResponse = self.yt_api_client.fetch_channel(identifier)
+        channel_response: ChannelResponse = await self.yt_api_client.fetch_channel(identifier)
         return self.yt_api_mapper.create_from_channel_response(channel_response)
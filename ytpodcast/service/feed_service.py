@@ -1,38 +1,100 @@
 """Module for ytpodcast.service.feed_service."""
 
+import asyncio
+import time
 from datetime import datetime
 from datetime import timezone
+from typing import NamedTuple
 
 from injector import inject
 
 from ytpodcast.client.yt_api_client import YtApiClient
+from ytpodcast.manager.audio_store_manager import AudioStoreManager
+from ytpodcast.manager.channel_index_manager import ChannelIndexManager
+from ytpodcast.manager.channel_index_manager import ChannelSyncState
+from ytpodcast.manager.feed_cursor_manager import FeedCursorManager
 from ytpodcast.model.client.ytapi.channel_response import ChannelResponse
 from ytpodcast.model.client.ytapi.channel_video_response import ChannelVideoResponse
 from ytpodcast.model.client.ytapi.channel_videos_page_response import ChannelVideosPageResponse
+from ytpodcast.model.client.ytapi.video_response import VideoResponse
 from ytpodcast.model.service.channel import Channel
 from ytpodcast.model.service.channel_feed import ChannelFeed
+from ytpodcast.model.service.feed_cursor import FeedCursor
 from ytpodcast.mapper.service.channel_mapper import ChannelMapper
 from ytpodcast.model.service.feed_item import FeedItem
 from ytpodcast.mapper.service.feed_item_mapper import FeedItemMapper
 
 
+MAX_SHORTS_SECONDS = 240
+
+DEFAULT_FEED_LIMIT = 20
+
+# Listing pages cost the same quota whatever their size, so request full
+# pages whenever most listed items may be filtered away.
+FULL_PAGE_SIZE = 50
+
+
+class CollectedVideos(NamedTuple):
+    """Filtered listing videos with the listing position of each one."""
+
+    videos: list[ChannelVideoResponse]
+    positions: list[FeedCursor]
+    end: FeedCursor | None
+
+
 # pylint: disable=too-few-public-methods
 class FeedService:
     """Service layer for channel feeds."""
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     @inject  # type: ignore[reportUntypedFunctionDecorator]
     def __init__(
         self,
         yt_api_client: YtApiClient,
         channel_mapper: ChannelMapper,
         feed_item_mapper: FeedItemMapper,
+        audio_store_manager: AudioStoreManager,
+        channel_index_manager: ChannelIndexManager | None = None,
+        index_sync_interval_seconds: int = 0,
+        feed_cursor_manager: FeedCursorManager | None = None,
     ) -> None:
         """Store dependencies for feed operations."""
         self.yt_api_client = yt_api_client
         self.channel_mapper = channel_mapper
         self.feed_item_mapper = feed_item_mapper
+        self.audio_store_manager = audio_store_manager
+        self.channel_index_manager = channel_index_manager
+        self.index_sync_interval_seconds = index_sync_interval_seconds
+        self.feed_cursor_manager = feed_cursor_manager
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def create_feed_query(
+        self,
+        channel_id: str,
+        limit: int | None,
+        offset: int | None,
+        from_date: datetime | None,
+        to_date: datetime | None,
+        include_shorts: bool,
+    ) -> FeedCursor:
+        """Return the canonical form of feed query parameters.
 
-    def get_channel_feed(
+        Parameter combinations that select the same items map to equal
+        queries: defaults are filled in, dates are converted to UTC, and
+        handles and usernames, which match case-insensitively, are folded.
+        """
+        is_channel_id: bool = channel_id.startswith("UC") and len(channel_id) == 24
+        return FeedCursor(
+            channel_id=channel_id if is_channel_id else channel_id.casefold(),
+            limit=limit if limit is not None else DEFAULT_FEED_LIMIT,
+            from_date=self._normalize_filter_date(from_date),
+            to_date=self._normalize_filter_date(to_date),
+            include_shorts=include_shorts,
+            offset=offset or 0,
+        )
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    async def get_channel_feed(
         self,
         channel_id: str,
         limit: int | None = None,
@@ -40,27 +102,62 @@ class FeedService:
         from_date: datetime | None = None,
         to_date: datetime | None = None,
         include_shorts: bool = True,
+        cursor: FeedCursor | None = None,
     ) -> ChannelFeed:
-        """Fetch channel metadata and recent videos for feed rendering."""
-        channel_response: ChannelResponse = self.yt_api_client.fetch_channel(channel_id)
+        """Fetch channel metadata and recent videos for feed rendering.
+
+        A cursor returned with a previous page resumes the listing where that
+        page ended instead of paging from the newest upload again.
+        """
+        channel_response: ChannelResponse = await self.yt_api_client.fetch_channel(channel_id)
         channel: Channel = self.channel_mapper.create_from_channel_response(channel_response)
+        if limit is None:
+            limit = DEFAULT_FEED_LIMIT
         requested_total: int = self._resolve_requested_total(limit, offset)
-        filtered_responses: list[ChannelVideoResponse] = self._collect_filtered_videos(
-            channel.get_channel_id(),
-            requested_total,
-            from_date,
-            to_date,
-            include_shorts,
-        )
-        sliced_responses: list[ChannelVideoResponse] = self._apply_paging(
-            filtered_responses,
-            limit,
-            offset,
+        query: FeedCursor = FeedCursor(
+            channel_id=channel.get_channel_id(),
+            limit=limit,
+            from_date=self._normalize_filter_date(from_date),
+            to_date=self._normalize_filter_date(to_date),
+            include_shorts=include_shorts,
         )
+        sliced_responses: list[ChannelVideoResponse]
+        next_position: FeedCursor | None
+        if self.channel_index_manager is not None:
+            sliced_responses = await self._query_channel_index(
+                self.channel_index_manager,
+                channel.get_channel_id(),
+                requested_total,
+                limit,
+                offset,
+                from_date,
+                to_date,
+                include_shorts,
+            )
+            next_position = query.model_copy(
+                update={"offset": (offset or 0) + len(sliced_responses)}
+            )
+        else:
+            sliced_responses, next_position = await self._query_channel_listing(
+                query,
+                requested_total,
+                offset,
+                cursor,
+            )
+        next_cursor: str | None = None
+        if (
+            self.feed_cursor_manager is not None
+            and next_position is not None
+            and len(sliced_responses) == limit
+        ):
+            next_cursor = self.feed_cursor_manager.encode(
+                next_position.model_copy(update={"limit": limit})
+            )
         items: list[FeedItem] = [
             self.feed_item_mapper.create_from_channel_video_response(video_response)
             for video_response in sliced_responses
         ]
+        self._pin_latest_items(channel.get_channel_id(), items)
         return ChannelFeed(
             channel_id=channel.get_channel_id(),
             title=channel.get_title(),
@@ -69,64 +166,343 @@ class FeedService:
             author=channel.get_title(),
             image_url=channel.get_image_url(),
             items=items,
+            next_cursor=next_cursor,
+        )
+
+    async def _query_channel_listing(
+        self,
+        query: FeedCursor,
+        requested_total: int,
+        offset: int | None,
+        cursor: FeedCursor | None,
+    ) -> tuple[list[ChannelVideoResponse], FeedCursor | None]:
+        """Collect a feed page from the upstream listing, resuming from a known position.
+
+        Returns the page and the listing position right after it.
+        """
+        offset_value: int = offset or 0
+        start: FeedCursor | None = cursor
+        if start is not None and (
+            start.get_channel_id() != query.get_channel_id() or start.get_offset() > offset_value
+        ):
+            start = None
+        if start is None and self.feed_cursor_manager is not None:
+            start = self.feed_cursor_manager.find_nearest(
+                query.get_channel_id(),
+                query.get_from_date(),
+                query.get_to_date(),
+                query.get_include_shorts(),
+                offset_value,
+            )
+        collected: CollectedVideos = await self._collect_filtered_videos(
+            query.get_channel_id(),
+            requested_total,
+            query.get_from_date(),
+            query.get_to_date(),
+            query.get_include_shorts(),
+            start,
+        )
+        if self.feed_cursor_manager is not None:
+            self.feed_cursor_manager.remember(self._select_checkpoints(collected))
+        first_index: int = offset_value - (start.get_offset() if start is not None else 0)
+        sliced_responses: list[ChannelVideoResponse] = self._apply_paging(
+            collected.videos,
+            query.get_limit(),
+            first_index,
+        )
+        next_index: int = first_index + len(sliced_responses)
+        if next_index < len(collected.positions):
+            return sliced_responses, collected.positions[next_index]
+        return sliced_responses, collected.end
+
+    def _select_checkpoints(self, collected: CollectedVideos) -> list[FeedCursor]:
+        """Return the position where each listed page starts, and the end position."""
+        checkpoints: list[FeedCursor] = []
+        previous_page_token: str | None = None
+        for index, position in enumerate(collected.positions):
+            if index == 0 or position.get_page_token() != previous_page_token:
+                checkpoints.append(position)
+            previous_page_token = position.get_page_token()
+        if collected.end is not None:
+            checkpoints.append(collected.end)
+        return checkpoints
+
+    def _pin_latest_items(self, channel_id: str, items: list[FeedItem]) -> None:
+        """Keep the newest episodes of a requested feed in the audio store."""
+        latest_items: list[FeedItem] = sorted(
+            items,
+            key=lambda item: item.get_published_at(),
+            reverse=True,
+        )
+        self.audio_store_manager.pin_feed(
+            channel_id,
+            [item.get_video_id() for item in latest_items],
+        )
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    async def _query_channel_index(
+        self,
+        channel_index_manager: ChannelIndexManager,
+        channel_id: str,
+        requested_total: int,
+        limit: int,
+        offset: int | None,
+        from_date: datetime | None,
+        to_date: datetime | None,
+        include_shorts: bool,
+    ) -> list[ChannelVideoResponse]:
+        """Sync the channel index as far as the query needs and answer from it."""
+        normalized_from: datetime | None = self._normalize_filter_date(from_date)
+        normalized_to: datetime | None = self._normalize_filter_date(to_date)
+        state: ChannelSyncState | None = await asyncio.to_thread(
+            channel_index_manager.get_sync_state,
+            channel_id,
+        )
+        if state is not None and time.time() - state.synced_at >= self.index_sync_interval_seconds:
+            await self._sync_index_head(channel_index_manager, channel_id)
+        await self._backfill_index(
+            channel_index_manager,
+            channel_id,
+            state,
+            requested_total,
+            normalized_from,
+            normalized_to,
+            include_shorts,
+        )
+        offset_value: int = offset or 0
+        return await asyncio.to_thread(
+            channel_index_manager.list_videos,
+            channel_id,
+            normalized_from,
+            normalized_to,
+            include_shorts,
+            limit,
+            offset_value,
+        )
+
+    async def _sync_index_head(
+        self,
+        channel_index_manager: ChannelIndexManager,
+        channel_id: str,
+    ) -> None:
+        """Index uploads newer than the newest indexed video.
+
+        Pages are listed from the newest upload until a page contains an
+        already indexed video. New videos are stored only once the walk
+        completes, so an interrupted walk can never leave a gap behind the
+        watermark.
+        """
+        pending: list[ChannelVideoResponse] = []
+        page_token: str | None = None
+        while True:
+            page: ChannelVideosPageResponse = await self.yt_api_client.fetch_channel_videos_page(
+                channel_id,
+                max_results=FULL_PAGE_SIZE,
+                page_token=page_token,
+            )
+            pending.extend(page.get_items())
+            known_video_ids: set[str] = await asyncio.to_thread(
+                channel_index_manager.find_known_video_ids,
+                channel_id,
+                [video.get_video_id() for video in page.get_items()],
+            )
+            page_token = page.get_next_page_token()
+            if known_video_ids or not page_token:
+                break
+        await self._index_videos(channel_index_manager, channel_id, pending)
+        await asyncio.to_thread(channel_index_manager.touch_sync_state, channel_id)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    async def _backfill_index(
+        self,
+        channel_index_manager: ChannelIndexManager,
+        channel_id: str,
+        state: ChannelSyncState | None,
+        requested_total: int,
+        from_date: datetime | None,
+        to_date: datetime | None,
+        include_shorts: bool,
+    ) -> None:
+        """Index older uploads until the query can be answered."""
+        page_token: str | None = state.backfill_page_token if state is not None else None
+        is_complete: bool = state.is_complete if state is not None else False
+        while not is_complete:
+            if state is not None:
+                matching: int = await asyncio.to_thread(
+                    channel_index_manager.count_videos,
+                    channel_id,
+                    from_date,
+                    to_date,
+                    include_shorts,
+                )
+                if matching >= requested_total:
+                    return
+                oldest: datetime | None = await asyncio.to_thread(
+                    channel_index_manager.get_oldest_published_at,
+                    channel_id,
+                )
+                if from_date is not None and oldest is not None and oldest < from_date:
+                    return
+            page: ChannelVideosPageResponse = await self.yt_api_client.fetch_channel_videos_page(
+                channel_id,
+                max_results=FULL_PAGE_SIZE,
+                page_token=page_token,
+            )
+            await self._index_videos(channel_index_manager, channel_id, page.get_items())
+            page_token = page.get_next_page_token()
+            is_complete = page_token is None
+            await asyncio.to_thread(
+                channel_index_manager.set_sync_state,
+                channel_id,
+                page_token,
+                is_complete,
+            )
+            state = await asyncio.to_thread(channel_index_manager.get_sync_state, channel_id)
+
+    async def _index_videos(
+        self,
+        channel_index_manager: ChannelIndexManager,
+        channel_id: str,
+        videos: list[ChannelVideoResponse],
+    ) -> None:
+        """Store listed videos in the index together with their durations."""
+        if not videos:
+            return
+        video_responses: dict[str, VideoResponse] = await self.yt_api_client.fetch_videos(
+            [video.get_video_id() for video in videos],
+            structural_only=True,
+        )
+        await asyncio.to_thread(
+            channel_index_manager.put_videos,
+            channel_id,
+            videos,
+            {
+                video_id: video_response.get_duration_seconds()
+                for video_id, video_response in video_responses.items()
+            },
+            MAX_SHORTS_SECONDS,
         )
 
     def _resolve_requested_total(self, limit: int | None, offset: int | None) -> int:
         """Determine how many items to collect before paging."""
-        default_limit: int = 20
         if limit is None and offset is None:
-            return default_limit
+            return DEFAULT_FEED_LIMIT
         offset_value: int = offset or 0
-        requested_total: int = offset_value + (limit or default_limit)
+        requested_total: int = offset_value + (limit or DEFAULT_FEED_LIMIT)
         return max(requested_total, 1)
 
-    def _collect_filtered_videos(
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    async def _collect_filtered_videos(
         self,
         channel_id: str,
         requested_total: int,
         from_date: datetime | None,
         to_date: datetime | None,
         include_shorts: bool,
-    ) -> list[ChannelVideoResponse]:
-        """Fetch paged videos until enough filtered items are collected."""
+        start: FeedCursor | None = None,
+    ) -> CollectedVideos:
+        """Fetch paged videos until enough filtered items are collected.
+
+        Listings are newest first, so paging stops at the first page that
+        reaches back past from_date. Listings that support it are bounded
+        upstream by the date range, which skips newer uploads entirely.
+        Collection begins at start, whose offset counts toward requested_total.
+        """
+        normalized_from: datetime | None = self._normalize_filter_date(from_date)
+        normalized_to: datetime | None = self._normalize_filter_date(to_date)
+        is_date_bounded: bool = normalized_from is not None or normalized_to is not None
+        if start is None:
+            start = FeedCursor(
+                channel_id=channel_id,
+                from_date=normalized_from,
+                to_date=normalized_to,
+                include_shorts=include_shorts,
+            )
         collected: list[ChannelVideoResponse] = []
+        positions: list[FeedCursor] = []
         seen_video_ids: set[str] = set()
-        page_token: str | None = None
+        page_token: str | None = start.get_page_token()
+        skipped_items: int = start.get_page_position()
 
-        while len(collected) < requested_total:
-            remaining: int = requested_total - len(collected)
-            page_size: int = min(max(remaining, 1), 50)
-            page: ChannelVideosPageResponse = self.yt_api_client.fetch_channel_videos_page(
+        while start.get_offset() + len(collected) < requested_total:
+            remaining: int = requested_total - start.get_offset() - len(collected)
+            page_size: int = FULL_PAGE_SIZE if is_date_bounded else min(max(remaining, 1), 50)
+            page: ChannelVideosPageResponse = await self.yt_api_client.fetch_channel_videos_page(
                 channel_id,
                 max_results=page_size,
                 page_token=page_token,
+                published_after=normalized_from,
+                published_before=normalized_to,
             )
-            page_filtered: list[ChannelVideoResponse] = self._filter_by_date_range(
-                page.get_items(),
-                from_date,
-                to_date,
-            )
-            for video in page_filtered:
+            page_items: list[ChannelVideoResponse] = page.get_items()[skipped_items:]
+            matching_video_ids: list[str] = [
+                video.get_video_id()
+                for video in self._filter_by_date_range(page_items, from_date, to_date)
+                if video.get_video_id() not in seen_video_ids
+            ]
+            short_video_ids: set[str] = set()
+            if not include_shorts:
+                short_video_ids = await self._find_short_video_ids(matching_video_ids)
+            for page_position, video in enumerate(page_items, start=skipped_items):
                 video_id: str = video.get_video_id()
-                if video_id in seen_video_ids:
-                    continue
-                if not include_shorts and self._is_short_video(video_id):
+                if (
+                    video_id not in matching_video_ids
+                    or video_id in seen_video_ids
+                    or video_id in short_video_ids
+                ):
                     continue
                 seen_video_ids.add(video_id)
+                positions.append(
+                    start.model_copy(
+                        update={
+                            "offset": start.get_offset() + len(collected),
+                            "page_token": page_token,
+                            "page_position": page_position,
+                        }
+                    )
+                )
                 collected.append(video)
-            if not page.get_next_page_token():
-                break
+            skipped_items = 0
             page_token = page.get_next_page_token()
-        return collected
-
-    def _is_short_video(self, video_id: str) -> bool:
-        """Return True when the video is a YouTube Short."""
-        max_shorts_seconds: int = 240
-        try:
-            video_response = self.yt_api_client.fetch_video(video_id)
-        except ValueError:
-            return False
-        return video_response.get_duration_seconds() <= max_shorts_seconds
+            if normalized_from is not None and self._reaches_before(
+                page.get_items(),
+                normalized_from,
+            ):
+                page_token = None
+            if not page_token:
+                return CollectedVideos(videos=collected, positions=positions, end=None)
+        end: FeedCursor = start.model_copy(
+            update={
+                "offset": start.get_offset() + len(collected),
+                "page_token": page_token,
+                "page_position": 0,
+            }
+        )
+        return CollectedVideos(videos=collected, positions=positions, end=end)
+
+    def _reaches_before(self, video_responses: list[ChannelVideoResponse], date: datetime) -> bool:
+        """Return whether the oldest listed video was published before date."""
+        for video in video_responses:
+            published_at: datetime = video.get_published_at()
+            if published_at.tzinfo is None:
+                published_at = published_at.replace(tzinfo=timezone.utc)
+            if published_at < date:
+                return True
+        return False
+
+    async def _find_short_video_ids(self, video_ids: list[str]) -> set[str]:
+        """Return the ids that are YouTube Shorts, using batched lookups."""
+        if not video_ids:
+            return set()
+        video_responses: dict[str, VideoResponse] = await self.yt_api_client.fetch_videos(
+            video_ids,
+            structural_only=True,
+        )
+        return {
+            video_id
+            for video_id, video_response in video_responses.items()
+            if video_response.get_duration_seconds() <= MAX_SHORTS_SECONDS
+        }
 
     def _normalize_filter_date(self, value: datetime | None) -> datetime | None:
         """Normalize filter dates to UTC-aware values."""
@@ -1,69 +1,318 @@
 """Module for ytpodcast.service.video_service."""
 
+import asyncio
+import logging
+from collections.abc import Iterator
 from pathlib import Path
 
 from injector import inject
 
 from ytpodcast.client.yt_api_client import YtApiClient
 from ytpodcast.client.yt_dl_client import YtDlClient
+from ytpodcast.manager.audio_store_manager import AudioStoreManager
+from ytpodcast.manager.audio_stream_manager import AudioStreamManager
+from ytpodcast.manager.download_journal_manager import DownloadJournalManager
+from ytpodcast.manager.single_flight_manager import SingleFlightManager
 from ytpodcast.model.client.ytapi.video_response import VideoResponse
+from ytpodcast.model.client.ytdl.audio_download_response import AudioDownloadResponse
 from ytpodcast.model.client.ytdl.audio_format_response import AudioFormatResponse
 from ytpodcast.mapper.service.video_mapper import VideoMapper
+from ytpodcast.model.service.audio_format_preference import AudioFormatPreference
+from ytpodcast.model.service.audio_output_policy import AudioOutputCodec
+from ytpodcast.model.service.audio_output_policy import AudioOutputMode
+from ytpodcast.model.service.audio_output_policy import AudioOutputPolicy
 from ytpodcast.model.service.video import Video
 
 
-# pylint: disable=too-few-public-methods
+logger = logging.getLogger(__name__)
+
+# pylint: disable=too-few-public-methods,too-many-instance-attributes
 class VideoService:
     """Service layer for video data."""
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     @inject  # type: ignore[reportUntypedFunctionDecorator]
     def __init__(
         self,
         yt_api_client: YtApiClient,
         yt_dl_client: YtDlClient,
         video_mapper: VideoMapper,
+        single_flight_manager: SingleFlightManager,
+        audio_stream_manager: AudioStreamManager,
+        audio_store_manager: AudioStoreManager,
+        output_policy: AudioOutputPolicy,
+        format_preference: AudioFormatPreference,
+        download_journal_manager: DownloadJournalManager,
     ) -> None:
         """Store dependencies for video operations."""
         self.yt_api_client = yt_api_client
         self.yt_dl_client = yt_dl_client
         self.video_mapper = video_mapper
+        self.single_flight_manager = single_flight_manager
+        self.audio_stream_manager = audio_stream_manager
+        self.audio_store_manager = audio_store_manager
+        self.output_policy = output_policy
+        self.format_preference = format_preference
+        self.download_journal_manager = download_journal_manager
 
-    def get_video(self, video_id: str) -> Video:
-        """Fetch and map video data by id."""
-        yt_api_response: VideoResponse = self.yt_api_client.fetch_video(video_id)
-        audio_format_response: AudioFormatResponse = self.yt_dl_client.fetch_audio_format(
-            video_id
+    async def get_video(self, video_id: str) -> Video:
+        """Fetch and map video data by id.
+
+        The API lookup and the yt-dlp format extraction run concurrently; the
+        extraction blocks, so it runs on a worker thread.
+        """
+        yt_api_response: VideoResponse
+        audio_format_response: AudioFormatResponse
+        yt_api_response, audio_format_response = await asyncio.gather(
+            self.yt_api_client.fetch_video(video_id),
+            asyncio.to_thread(self.yt_dl_client.fetch_audio_format, video_id),
         )
         return self.video_mapper.create_from_video_response(
             yt_api_response,
             audio_format_response,
         )
 
-    def download_audio(self, video_id: str) -> Path:
-        """Download a single audio format for a video."""
+    def resolve_output_policy(
+        self,
+        mode: AudioOutputMode | None = None,
+        codec: AudioOutputCodec | None = None,
+        bitrate_kbps: int | None = None,
+    ) -> AudioOutputPolicy:
+        """Overlay per-request output settings on the deployment policy."""
+        if mode is None and codec is None and bitrate_kbps is None:
+            return self.output_policy
+        return AudioOutputPolicy(
+            mode=mode or self.output_policy.get_mode(),
+            codec=codec or self.output_policy.get_codec(),
+            bitrate_kbps=bitrate_kbps or self.output_policy.get_bitrate_kbps(),
+        )
+
+    def get_download_key(self, video_id: str, output_policy: AudioOutputPolicy) -> str:
+        """Return the key shared by concurrent downloads of the same output."""
+        return self.yt_dl_client.get_output_path(video_id, output_policy).name
+
+    def find_downloaded_audio(
+        self,
+        video_id: str,
+        output_policy: AudioOutputPolicy,
+    ) -> Path | None:
+        """Return the downloaded audio path if it is already available."""
+        existing_path: Path | None = self.yt_dl_client.find_downloaded_audio(
+            video_id,
+            output_policy,
+        )
+        if existing_path is None:
+            self.audio_store_manager.record_miss()
+        else:
+            self.audio_store_manager.record_hit(existing_path)
+        return existing_path
+
+    def download_audio(self, video_id: str, output_policy: AudioOutputPolicy) -> Path:
+        """Download a single audio format for a video.
+
+        Concurrent requests for the same output share a single download.
+        """
+        return self.single_flight_manager.run(
+            self.get_download_key(video_id, output_policy),
+            lambda: self._download_audio(video_id, output_policy),
+        )
+
+    def stream_audio(self, video_id: str, output_policy: AudioOutputPolicy) -> Iterator[bytes]:
+        """Stream encoded audio while the download is still in progress.
+
+        Concurrent requests join the same live encode, which is also written
+        to the download directory for later requests.
+        """
+        return self.audio_stream_manager.open(
+            self.get_download_key(video_id, output_policy),
+            self.yt_dl_client.get_output_path(video_id, output_policy),
+            lambda: self._open_audio_stream(video_id, output_policy),
+        )
+
+    def recover_interrupted_downloads(self, resume: bool) -> list[tuple[str, AudioOutputPolicy]]:
+        """Clean up downloads interrupted by a crashed worker.
+
+        Returns the interrupted downloads when they should be resumed; their
+        partial sources are kept so yt-dlp can continue them.
+        """
+        interrupted: list[tuple[str, AudioOutputPolicy]] = []
+        for entry in self.download_journal_manager.collect_interrupted():
+            video_id: str | None = entry.get("video_id")
+            if not video_id:
+                continue
+            output_policy: AudioOutputPolicy = AudioOutputPolicy.model_validate(
+                entry.get("output_policy") or self.output_policy.model_dump()
+            )
+            self.yt_dl_client.discard_staging(video_id, output_policy, keep_source=resume)
+            logger.warning("Recovered interrupted download of %s.", video_id)
+            if resume:
+                interrupted.append((video_id, output_policy))
+        return interrupted
+
+    def _begin_journal_entry(self, video_id: str, output_policy: AudioOutputPolicy) -> str:
+        """Journal a download so a crash mid-job can be recovered on startup."""
+        key: str = self.get_download_key(video_id, output_policy)
+        self.download_journal_manager.begin(
+            key,
+            {"video_id": video_id, "output_policy": output_policy.model_dump(mode="json")},
+        )
+        return key
+
+    def _open_audio_stream(
+        self,
+        video_id: str,
+        output_policy: AudioOutputPolicy,
+    ) -> Iterator[bytes]:
+        """Select a format and run the piped download and encode."""
         audio_formats: list[AudioFormatResponse] = self.yt_dl_client.fetch_audio_formats(
             video_id
         )
-        selected_format: AudioFormatResponse = self._select_best_audio_format(audio_formats)
-        return self.yt_dl_client.download_audio(
+        selected_format: AudioFormatResponse = self._select_best_audio_format(
+            audio_formats,
+            output_policy,
+        )
+        journal_key: str = self._begin_journal_entry(video_id, output_policy)
+        try:
+            with self.audio_store_manager.reserve(selected_format.get_file_size_bytes()):
+                yield from self.yt_dl_client.stream_audio(
+                    video_id,
+                    selected_format.get_format_id(),
+                    selected_format.get_extension(),
+                    output_policy,
+                )
+        finally:
+            self.download_journal_manager.end(journal_key)
+
+    def _download_audio(self, video_id: str, output_policy: AudioOutputPolicy) -> Path:
+        """Run the download pipeline for a video.
+
+        The format preferences are compiled into a yt-dlp selector, so format
+        resolution and download happen in one yt-dlp run.
+        """
+        existing_path: Path | None = self.yt_dl_client.find_downloaded_audio(
             video_id,
-            selected_format.get_format_id(),
+            output_policy,
         )
+        if existing_path is not None:
+            return existing_path
+        journal_key: str = self._begin_journal_entry(video_id, output_policy)
+        try:
+            with self.audio_store_manager.reserve(
+                self._estimate_download_bytes(video_id, output_policy)
+            ):
+                download: AudioDownloadResponse = self.yt_dl_client.download_best_audio(
+                    video_id,
+                    self._build_format_selector(output_policy),
+                    output_policy,
+                )
+        finally:
+            self.download_journal_manager.end(journal_key)
+        selected_format: AudioFormatResponse | None = download.get_audio_format()
+        if selected_format is not None:
+            logger.info(
+                "Downloaded %s from format %s (%s, %s kbps, language %s).",
+                video_id,
+                selected_format.get_format_id(),
+                selected_format.get_extension(),
+                selected_format.get_audio_bitrate_kbps(),
+                selected_format.get_language(),
+            )
+        return Path(download.get_path())
+
+    def _estimate_download_bytes(
+        self,
+        video_id: str,
+        output_policy: AudioOutputPolicy,
+    ) -> int | None:
+        """Estimate the size of a download from its cached format listing.
+
+        The format the selector will most likely pick is looked up in the
+        info cache only, so estimating never costs an extra yt-dlp run.
+        Returns None, for the store's default reservation, when the listing
+        or the size is unknown.
+        """
+        audio_formats: list[AudioFormatResponse] | None = (
+            self.yt_dl_client.get_cached_audio_formats(video_id)
+        )
+        if not audio_formats:
+            return None
+        return self._select_best_audio_format(
+            audio_formats,
+            output_policy,
+        ).get_file_size_bytes()
+
+    def _build_format_selector(self, output_policy: AudioOutputPolicy) -> str:
+        """Compile the format preferences into a yt-dlp format selector.
+
+        Alternatives are tried in order: preferred language first, then the
+        bitrate ceiling, then sources that can be copied without re-encoding.
+        Unknown bitrates pass the ceiling, and the selector ends with any audio
+        stream so a download never fails on preferences alone.
+        """
+        language_filters: list[str] = [
+            f"[language^={language}]"
+            for language in self.format_preference.get_preferred_languages()
+        ] + [""]
+        max_bitrate_kbps: int | None = self.format_preference.get_max_bitrate_kbps()
+        bitrate_filters: list[str] = [""]
+        if max_bitrate_kbps:
+            bitrate_filters = [f"[abr<=?{max_bitrate_kbps}]", ""]
+        extension_filters: list[str] = [""]
+        if output_policy.get_mode() != AudioOutputMode.TRANSCODE:
+            extension_filters = [
+                f"[ext={extension}]" for extension in output_policy.get_source_extensions()
+            ] + [""]
+        alternatives: list[str] = []
+        for language_filter in language_filters:
+            for bitrate_filter in bitrate_filters:
+                for extension_filter in extension_filters:
+                    alternative: str = (
+                        f"bestaudio{language_filter}{bitrate_filter}{extension_filter}"
+                    )
+                    if alternative not in alternatives:
+                        alternatives.append(alternative)
+        alternatives.append("best")
+        return "/".join(alternatives)
 
     def _select_best_audio_format(
         self,
         audio_formats: list[AudioFormatResponse],
+        output_policy: AudioOutputPolicy,
     ) -> AudioFormatResponse:
-        """Pick the best available audio format."""
+        """Pick the best available audio format from a format listing.
+
+        Applies the same preferences as the yt-dlp selector used for
+        downloads: audio only, preferred language, bitrate ceiling, and then
+        sources that can be copied instead of encoded.
+        """
         if not audio_formats:
             raise ValueError("No audio formats available for download.")
         audio_only: list[AudioFormatResponse] = [
             format_item for format_item in audio_formats if format_item.get_is_audio_only()
         ]
         candidates: list[AudioFormatResponse] = audio_only or audio_formats
-        italian_candidates: list[AudioFormatResponse] = [
-            format_item
-            for format_item in candidates
-            if (format_item.get_language() or "").lower() == "it"
-        ]
-        return italian_candidates[0] if italian_candidates else candidates[0]
+        for language in self.format_preference.get_preferred_languages():
+            language_candidates: list[AudioFormatResponse] = [
+                format_item
+                for format_item in candidates
+                if (format_item.get_language() or "").lower().startswith(language.lower())
+            ]
+            if language_candidates:
+                candidates = language_candidates
+                break
+        max_bitrate_kbps: int | None = self.format_preference.get_max_bitrate_kbps()
+        if max_bitrate_kbps:
+            bounded_candidates: list[AudioFormatResponse] = [
+                format_item
+                for format_item in candidates
+                if (format_item.get_audio_bitrate_kbps() or 0) <= max_bitrate_kbps
+            ]
+            candidates = bounded_candidates or candidates
+        if output_policy.get_mode() != AudioOutputMode.TRANSCODE:
+            compatible_candidates: list[AudioFormatResponse] = [
+                format_item
+                for format_item in candidates
+                if output_policy.is_source_compatible(format_item.get_extension())
+            ]
+            candidates = compatible_candidates or candidates
+        return max(candidates, key=lambda format_item: format_item.get_audio_bitrate_kbps() or 0)